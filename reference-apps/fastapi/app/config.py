@@ -6,7 +6,10 @@ for the DevStack Core infrastructure.
 """
 
 import os
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from typing import Tuple
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -21,6 +24,10 @@ class Settings(BaseSettings):
     VAULT_TOKEN: str = os.getenv("VAULT_TOKEN", "")
     VAULT_APPROLE_DIR: str = os.getenv("VAULT_APPROLE_DIR", "/vault-approles/reference-api")
 
+    # Seconds a secret fetched from Vault is reused before it is fetched
+    # again; 0 disables the in-process secret cache
+    VAULT_SECRET_CACHE_TTL: float = float(os.getenv("VAULT_SECRET_CACHE_TTL", "300.0"))
+
     # Service endpoints (internal Docker network)
     POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "postgres")
     POSTGRES_PORT: int = int(os.getenv("POSTGRES_PORT", "5432"))
@@ -40,9 +47,30 @@ class Settings(BaseSettings):
     # Redis Cluster nodes
     REDIS_NODES: str = os.getenv("REDIS_NODES", "redis-1:6379,redis-2:6379,redis-3:6379")
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Upper bound in seconds on fetching the Redis password from Vault and
+    # connecting the response cache at startup; past it the app starts
+    # without caching instead of holding up readiness
+    CACHE_INIT_TIMEOUT: float = float(os.getenv("CACHE_INIT_TIMEOUT", "2.0"))
+
+    # Upper bound in seconds on each backend check, whether run by
+    # /health/all (concurrently) or its own endpoint; a check past this is
+    # reported as unhealthy
+    HEALTH_CHECK_TIMEOUT: float = float(os.getenv("HEALTH_CHECK_TIMEOUT", "10.0"))
+
+    # Rate limit counter storage (limits storage URI). "memory://" keeps
+    # counters per process; a redis:// URI shares them across replicas.
+    RATE_LIMIT_STORAGE_URI: str = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+
+    # Frozen: settings are read once at startup and never mutated
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
+    @cached_property
+    def redis_nodes(self) -> Tuple[Tuple[str, int], ...]:
+        """REDIS_NODES parsed once into (host, port) pairs"""
+        return tuple(
+            (host, int(port))
+            for host, port in (node.strip().split(":") for node in self.REDIS_NODES.split(","))
+        )
 
 
 settings = Settings()
@@ -34,6 +34,14 @@ class BaseAPIException(Exception):
     - Additional context/details
     """
 
+    # Value of the "error" field in responses; set per subclass so to_dict()
+    # does not resolve the class name on every raise
+    error_name = "BaseAPIException"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.error_name = cls.__name__
+
     def __init__(
         self,
         message: str,
@@ -48,7 +56,7 @@ class BaseAPIException(Exception):
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON response"""
         response = {
-            "error": self.__class__.__name__,
+            "error": self.error_name,
             "message": self.message,
             "status_code": self.status_code
         }
@@ -74,12 +82,29 @@ class ServiceUnavailableError(BaseAPIException):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
+        error_details = {"service": service_name}
+        if details:
+            error_details.update(details)
+        self._init_service(
+            service_name,
+            message or f"Service '{service_name}' is currently unavailable",
+            error_details
+        )
+
+    def _init_service(self, service_name: str, message: str, details: Dict[str, Any]) -> None:
+        """
+        Shared initializer for service errors.
+
+        Subclasses build their complete details dict (including "service")
+        once and call this directly instead of chaining __init__ calls that
+        each copy the dict again.
+        """
         self.service_name = service_name
-        msg = message or f"Service '{service_name}' is currently unavailable"
-        super().__init__(
-            message=msg,
+        BaseAPIException.__init__(
+            self,
+            message=message,
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            details={"service": service_name, **(details or {})}
+            details=details
         )
 
 
@@ -100,15 +125,12 @@ class VaultUnavailableError(ServiceUnavailableError):
         secret_path: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        msg = message or "Vault service is unavailable"
-        error_details = details or {}
+        error_details = {"service": "vault"}
+        if details:
+            error_details.update(details)
         if secret_path:
             error_details["secret_path"] = secret_path
-        super().__init__(
-            service_name="vault",
-            message=msg,
-            details=error_details
-        )
+        self._init_service("vault", message or "Vault service is unavailable", error_details)
 
 
 class DatabaseConnectionError(ServiceUnavailableError):
@@ -129,12 +151,13 @@ class DatabaseConnectionError(ServiceUnavailableError):
         details: Optional[Dict[str, Any]] = None
     ):
         self.database_type = database_type
-        msg = message or f"Failed to connect to {database_type} database"
-        error_details = {"database_type": database_type, **(details or {})}
-        super().__init__(
-            service_name=database_type,
-            message=msg,
-            details=error_details
+        error_details = {"service": database_type, "database_type": database_type}
+        if details:
+            error_details.update(details)
+        self._init_service(
+            database_type,
+            message or f"Failed to connect to {database_type} database",
+            error_details
         )
 
 
@@ -153,12 +176,10 @@ class CacheConnectionError(ServiceUnavailableError):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        msg = message or "Failed to connect to cache service"
-        super().__init__(
-            service_name="redis",
-            message=msg,
-            details=details
-        )
+        error_details = {"service": "redis"}
+        if details:
+            error_details.update(details)
+        self._init_service("redis", message or "Failed to connect to cache service", error_details)
 
 
 class MessageQueueError(ServiceUnavailableError):
@@ -177,15 +198,12 @@ class MessageQueueError(ServiceUnavailableError):
         queue_name: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        msg = message or "Message queue operation failed"
-        error_details = details or {}
+        error_details = {"service": "rabbitmq"}
+        if details:
+            error_details.update(details)
         if queue_name:
             error_details["queue_name"] = queue_name
-        super().__init__(
-            service_name="rabbitmq",
-            message=msg,
-            details=error_details
-        )
+        self._init_service("rabbitmq", message or "Message queue operation failed", error_details)
 
 
 class ConfigurationError(BaseAPIException):
@@ -337,13 +355,13 @@ class CircuitBreakerError(ServiceUnavailableError):
         message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
-        # Don't set self.service_name here - parent class handles it
-        msg = message or f"Circuit breaker open for service '{service_name}'"
-        error_details = {"service": service_name, **(details or {})}
-        super().__init__(
-            message=msg,
-            service_name=service_name,
-            details=error_details
+        error_details = {"service": service_name}
+        if details:
+            error_details.update(details)
+        self._init_service(
+            service_name,
+            message or f"Circuit breaker open for service '{service_name}'",
+            error_details
         )
 
 
@@ -12,24 +12,62 @@ Not intended for production use.
 """
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, Response
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.datastructures import Default
+from fastapi.responses import Response, StreamingResponse
+from starlette.routing import Route
+import asyncio
+import atexit
+import importlib
+import itertools
 import logging
+import os
+import queue
 import sys
-import time
-import uuid
-from pythonjsonlogger import jsonlogger
+from time import monotonic_ns
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+import orjson
 
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY, Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 
-from app.routers import health, vault_demo, database_demo, cache_demo, messaging_demo, redis_cluster
 from app.config import settings
 from app.middleware.cache import cache_manager
+from app.middleware.cors import CachedPreflightCORSMiddleware
 from app.middleware.exception_handlers import register_exception_handlers
 from app.services.vault import vault_client
+from app.utils.logging import (
+    BufferedQueueListener,
+    BufferedStreamHandler,
+    OrjsonFormatter,
+    StructuredQueueHandler,
+)
+from app.utils.responses import OrjsonResponse
+
+# Request IDs: a random per-process prefix plus a monotonic counter, so each
+# request costs a counter increment instead of an os.urandom() syscall
+_ID_PREFIX = ""
+_id_counter = itertools.count().__next__
+
+
+def reset_request_ids() -> None:
+    """Draw a fresh request ID prefix and restart the counter"""
+    global _ID_PREFIX, _id_counter
+    _ID_PREFIX = os.urandom(8).hex()
+    _id_counter = itertools.count().__next__
+
+
+def generate_request_id() -> str:
+    """Return a process-unique request ID (16 hex prefix chars + hex counter)"""
+    return f"{_ID_PREFIX}{_id_counter():x}"
+
+
+reset_request_ids()
+
+# Workers forked after import (e.g. gunicorn --preload) must not share a prefix
+os.register_at_fork(after_in_child=reset_request_ids)
 
 # Configuration
 MAX_REQUEST_SIZE = 10 * 1024 * 1024  # 10MB
@@ -39,20 +77,54 @@ ALLOWED_CONTENT_TYPES = [
     "multipart/form-data",
     "text/plain"
 ]
+# Media types are compared after parameters (e.g. "; boundary=...") are
+# stripped, so a set lookup covers multipart/form-data as well
+_ALLOWED_CONTENT_TYPE_SET = frozenset(ALLOWED_CONTENT_TYPES)
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+_UNVALIDATED_PATHS = frozenset({"/metrics", "/docs", "/redoc", "/openapi.json"})
 
 # Configure structured JSON logging
-logHandler = logging.StreamHandler(sys.stdout)
-formatter = jsonlogger.JsonFormatter(
-    '%(asctime)s %(name)s %(levelname)s %(message)s %(request_id)s %(method)s %(path)s %(status_code)s %(duration_ms)s'
-)
+# Log lines are buffered in 8KB chunks and flushed by the listener thread
+# every LOG_FLUSH_INTERVAL instead of issuing one write syscall per record
+LOG_BUFFER_SIZE = 8192
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+try:
+    # closefd=False: the wrapper must never close the process's stdout
+    logStream = open(
+        sys.stdout.fileno(), "w",
+        buffering=LOG_BUFFER_SIZE, encoding="utf-8", closefd=False,
+    )
+except (AttributeError, OSError, ValueError):
+    # stdout replaced by an object without a file descriptor (e.g. test capture)
+    logStream = sys.stdout
+logHandler = BufferedStreamHandler(logStream)
+formatter = OrjsonFormatter()
 logHandler.setFormatter(formatter)
+
+# Loggers only enqueue records; a background listener thread owns the
+# stdout handler so JSON formatting and write syscalls stay off the event loop
+log_queue = queue.SimpleQueue()
+queueHandler = StructuredQueueHandler(log_queue)
+logListener = BufferedQueueListener(
+    log_queue, logHandler, respect_handler_level=True, flush_interval=LOG_FLUSH_INTERVAL
+)
+
+# Start at import so records are never stranded in the queue when the app
+# lifecycle does not run (scripts, TestClient without a context manager)
+logListener.start()
+atexit.register(logListener.stop)
+
+# The listener thread does not survive fork (e.g. gunicorn --preload)
+os.register_at_fork(after_in_child=logListener.start)
+
 logger = logging.getLogger(__name__)
-logger.addHandler(logHandler)
+logger.addHandler(queueHandler)
 logger.setLevel(logging.INFO)
 
 # Disable default basicConfig
 logging.getLogger().handlers.clear()
-logging.getLogger().addHandler(logHandler)
+logging.getLogger().addHandler(queueHandler)
 
 # Prometheus metrics
 http_requests_total = Counter(
@@ -79,8 +151,154 @@ app_info = Gauge(
     ['version', 'name']
 )
 
+# Endpoints polled by Prometheus and health probes: still measured, but a
+# successful request is not logged (errors are always logged)
+_SILENT_ENDPOINTS = frozenset({"/metrics", "/health/", "/health/all"})
+
+# Route index and pre-bound metric children (populated on startup by
+# index_routes(), extended lazily for endpoints seen at request time)
+UNMATCHED_ENDPOINT = "<unmatched>"
+# Starlette accepts any method token, so unknown methods share one label too
+OTHER_METHOD = "OTHER"
+_KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+_STATIC_ENDPOINTS: Dict[str, str] = {}
+_TEMPLATED_ROUTES: List[Route] = []
+_METRIC_CACHE: Dict[Tuple[str, str], Tuple[Any, Any, Dict[int, Any]]] = {}
+
+
+def index_routes(routes) -> None:
+    """
+    Index registered routes by path template and pre-bind metric children.
+
+    Static paths resolve with a single dict lookup; only routes with path
+    parameters need a regex match at request time. Templated routes keep
+    registration order, and a static path that an earlier templated route
+    would also match is left to the ordered scan, so the label is the route
+    Starlette dispatches to (method mismatches aside).
+    """
+    _STATIC_ENDPOINTS.clear()
+    _TEMPLATED_ROUTES.clear()
+
+    for route in routes:
+        if not isinstance(route, Route):
+            continue
+
+        shadowed = any(r.path_regex.match(route.path) for r in _TEMPLATED_ROUTES)
+        if route.param_convertors or shadowed:
+            _TEMPLATED_ROUTES.append(route)
+        else:
+            _STATIC_ENDPOINTS.setdefault(route.path, route.path)
+
+        for method in route.methods or ():
+            metric_children(method, route.path)
+
+
+def resolve_endpoint(path: str) -> str:
+    """
+    Map a request path to its route template (e.g. /redis/nodes/{node_name}/info).
+
+    Paths that match no route collapse to UNMATCHED_ENDPOINT so 404 scans
+    cannot grow the label set.
+    """
+    endpoint = _STATIC_ENDPOINTS.get(path)
+    if endpoint is not None:
+        return endpoint
+
+    for route in _TEMPLATED_ROUTES:
+        if route.path_regex.match(path):
+            return route.path
+
+    return UNMATCHED_ENDPOINT
+
+
+def metric_children(method: str, endpoint: str) -> Tuple[Any, Any, Dict[int, Any]]:
+    """
+    Return the label children for an endpoint in one cached tuple.
+
+    The tuple holds the in-progress gauge, the duration histogram and a
+    status code -> http_requests_total child dict filled by request_counter().
+    """
+    key = (method, endpoint)
+    children = _METRIC_CACHE.get(key)
+    if children is None:
+        children = (
+            http_requests_in_progress.labels(method=method, endpoint=endpoint),
+            http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+            {},
+        )
+        _METRIC_CACHE[key] = children
+    return children
+
+
+def request_counter(method: str, endpoint: str, status: int) -> Any:
+    """Return the http_requests_total child for an endpoint and status code"""
+    status_counters = metric_children(method, endpoint)[2]
+    counter = status_counters.get(status)
+    if counter is None:
+        counter = http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+        status_counters[status] = counter
+    return counter
+
+
+async def connect_cache() -> None:
+    """Initialize response caching with Redis, using the password from Vault"""
+    # Get Redis password from Vault
+    redis_creds = await vault_client.get_secret("redis-1")
+    redis_password = redis_creds.get("password", "")
+    redis_url = f"redis://:{redis_password}@{settings.REDIS_HOST}:{settings.REDIS_PORT}"
+    await cache_manager.init(redis_url, prefix="cache:")
+
+
+async def init_cache() -> None:
+    """Run connect_cache() within CACHE_INIT_TIMEOUT; startup continues either way"""
+    try:
+        await asyncio.wait_for(connect_cache(), timeout=settings.CACHE_INIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"Cache initialization timed out after {settings.CACHE_INIT_TIMEOUT}s")
+        logger.warning("Application will continue without caching")
+    except Exception as e:
+        logger.error(f"Failed to initialize cache: {e}")
+        logger.warning("Application will continue without caching")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown"""
+    # Index routes for metric label resolution
+    index_routes(app.routes)
+
+    # Set application info metric
+    app_info.labels(version="1.1.0", name="colima-reference-api").set(1)
+
+    await init_cache()
+
+    logger.info(
+        "Starting DevStack Core Reference API",
+        extra={
+            "vault_address": settings.VAULT_ADDR,
+            "redis_cache_enabled": cache_manager.enabled,
+            "version": "1.0.0"
+        }
+    )
+    logger.info("Application ready")
+
+    yield
+
+    # Close cache connection and the Vault HTTP client
+    await cache_manager.close()
+    await vault_client.aclose()
+    logger.info("Shutting down DevStack Core Reference API")
+
+
 # Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# With a redis:// storage URI, the limits library counts each hit with a
+# single server-side INCR+EXPIRE Lua script and falls back to in-memory
+# counters if Redis is unreachable
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    in_memory_fallback_enabled=True,
+)
 
 # Create FastAPI application
 app = FastAPI(
@@ -89,6 +307,10 @@ app = FastAPI(
     version="1.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # Wrapped in Default() so routes with a response_model keep FastAPI's
+    # pydantic fast path; only dict-returning handlers go through orjson
+    default_response_class=Default(OrjsonResponse),
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -109,8 +331,9 @@ CORS_ORIGINS = [
 if settings.DEBUG:
     CORS_ORIGINS = ["*"]
 
+# Preflight responses for allowed origins are built once and replayed
 app.add_middleware(
-    CORSMiddleware,
+    CachedPreflightCORSMiddleware,
     allow_origins=CORS_ORIGINS,
     allow_credentials=not settings.DEBUG,  # Only allow credentials with explicit origins
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
@@ -143,137 +366,68 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 register_exception_handlers(app)
 
 
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    """Middleware to collect metrics and add request tracking"""
-    # Generate request ID for correlation
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-
-    # Extract endpoint path template (e.g., /users/{id} instead of /users/123)
-    endpoint = request.url.path
-    method = request.method
-
-    # Track in-progress requests
-    http_requests_in_progress.labels(method=method, endpoint=endpoint).inc()
-
-    # Time the request
-    start_time = time.time()
-
-    try:
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Record metrics
-        http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status=response.status_code
-        ).inc()
-
-        http_request_duration_seconds.labels(
-            method=method,
-            endpoint=endpoint
-        ).observe(duration)
-
-        # Log request with structured data
-        logger.info(
-            "HTTP request completed",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "path": endpoint,
-                "status_code": response.status_code,
-                "duration_ms": round(duration * 1000, 2)
-            }
-        )
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        return response
-
-    except Exception as e:
-        # Record error metrics
-        duration = time.time() - start_time
-        http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status=500
-        ).inc()
-
-        # Log error with structured data
-        logger.error(
-            f"Request failed: {str(e)}",
-            extra={
-                "request_id": request_id,
-                "method": method,
-                "path": endpoint,
-                "status_code": 500,
-                "duration_ms": round(duration * 1000, 2)
-            },
-            exc_info=True
-        )
-        raise
-
-    finally:
-        # Decrement in-progress counter
-        http_requests_in_progress.labels(method=method, endpoint=endpoint).dec()
-
-
-@app.middleware("http")
-async def request_validation_middleware(request: Request, call_next):
-    """Middleware to validate request size and content-type"""
+def validate_request(method: str, path: str, headers) -> Optional[Response]:
+    """
+    Validate request size and content-type from the raw ASGI headers.
 
+    Returns the error response to send, or None if the request may proceed.
+    """
     # Skip validation for certain endpoints (GET requests, metrics, health checks)
-    if request.method in ["GET", "HEAD", "OPTIONS"]:
-        return await call_next(request)
-
-    if request.url.path in ["/metrics", "/docs", "/redoc", "/openapi.json"]:
-        return await call_next(request)
-
-    if request.url.path.startswith("/health"):
-        return await call_next(request)
-
-    # Validate content-type for POST/PUT/PATCH requests
-    if request.method in ["POST", "PUT", "PATCH"]:
-        content_type = request.headers.get("content-type", "").split(";")[0].strip()
-
-        # Allow requests without content-type if there's no body
-        content_length = request.headers.get("content-length")
-        if content_length and int(content_length) > 0:
-            if not content_type:
-                return JSONResponse(
+    if method in _SAFE_METHODS:
+        return None
+
+    if path in _UNVALIDATED_PATHS or path.startswith("/health"):
+        return None
+
+    # Single pass over the raw header list; content-length is parsed once
+    content_type = b""
+    content_length = 0
+    for name, value in headers:
+        if name == b"content-type":
+            content_type = value
+        elif name == b"content-length":
+            try:
+                content_length = int(value)
+            except ValueError:
+                return OrjsonResponse(
                     status_code=400,
                     content={
-                        "error": "Missing Content-Type header",
-                        "detail": "Content-Type header is required for requests with body"
+                        "error": "Invalid Content-Length header",
+                        "detail": "Content-Length must be an integer"
                     }
                 )
 
-            # Check if content-type is allowed
-            allowed = any(
-                content_type.startswith(allowed_type)
-                for allowed_type in ALLOWED_CONTENT_TYPES
+    # Requests without a body have nothing left to validate
+    if content_length <= 0:
+        return None
+
+    # Validate content-type for POST/PUT/PATCH requests
+    if method in _BODY_METHODS:
+        media_type = content_type.decode("latin-1").partition(";")[0].strip()
+
+        if not media_type:
+            return OrjsonResponse(
+                status_code=400,
+                content={
+                    "error": "Missing Content-Type header",
+                    "detail": "Content-Type header is required for requests with body"
+                }
             )
 
-            if not allowed:
-                return JSONResponse(
-                    status_code=415,
-                    content={
-                        "error": "Unsupported Media Type",
-                        "detail": f"Content-Type '{content_type}' is not supported",
-                        "allowed_types": ALLOWED_CONTENT_TYPES
-                    }
-                )
+        # Check if content-type is allowed
+        if media_type not in _ALLOWED_CONTENT_TYPE_SET:
+            return OrjsonResponse(
+                status_code=415,
+                content={
+                    "error": "Unsupported Media Type",
+                    "detail": f"Content-Type '{media_type}' is not supported",
+                    "allowed_types": ALLOWED_CONTENT_TYPES
+                }
+            )
 
     # Validate request size
-    content_length = request.headers.get("content-length")
-    if content_length and int(content_length) > MAX_REQUEST_SIZE:
-        return JSONResponse(
+    if content_length > MAX_REQUEST_SIZE:
+        return OrjsonResponse(
             status_code=413,
             content={
                 "error": "Request Entity Too Large",
@@ -282,23 +436,213 @@ async def request_validation_middleware(request: Request, call_next):
             }
         )
 
-    return await call_next(request)
+    return None
+
+
+class ObservabilityMiddleware:
+    """
+    Pure ASGI middleware for request tracking, metrics and request validation.
+
+    Replaces two @app.middleware("http") functions: BaseHTTPMiddleware wraps
+    every request in a Request object and runs call_next through a task and
+    memory stream, while this reads method, path and headers straight from
+    the scope and only wraps send() to capture the status code.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate request ID for correlation (read by the exception
+        # handlers through request.state)
+        request_id = generate_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        # Extract endpoint path template (e.g., /users/{id} instead of /users/123)
+        path = scope["path"]
+        endpoint = resolve_endpoint(path)
+        method = scope["method"]
+        method_label = method if method in _KNOWN_METHODS else OTHER_METHOD
+        in_progress, request_duration, status_counters = metric_children(method_label, endpoint)
+
+        status = 500
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = message.get("headers", ())
+                # Exception handler responses already carry the ID; build a
+                # new list otherwise, as the response may reuse its header list
+                if not any(name == b"x-request-id" for name, _ in headers):
+                    message["headers"] = [*headers, request_id_header]
+            await send(message)
+
+        # Track in-progress requests
+        in_progress.inc()
+
+        # Time the request
+        start_ns = monotonic_ns()
+
+        try:
+            # Process request
+            error_response = validate_request(method, path, scope["headers"])
+            if error_response is not None:
+                await error_response(scope, receive, send_with_request_id)
+            else:
+                await self.app(scope, receive, send_with_request_id)
+
+        except Exception as e:
+            # Record error metrics
+            duration_ns = monotonic_ns() - start_ns
+            (status_counters.get(500) or request_counter(method_label, endpoint, 500)).inc()
+
+            # Log error with structured data. Only exceptions no registered
+            # handler converted reach this point (BaseAPIException subclasses
+            # are answered further in), and unhandled_exception_handler logs
+            # their traceback, so it is not formatted a second time here
+            logger.error(
+                f"Request failed: {str(e)}",
+                extra={
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status_code": 500,
+                    "duration_ms": duration_ns // 1_000_000,
+                    "exception_type": e.__class__.__name__
+                }
+            )
+            raise
+
+        else:
+            # Calculate duration (integer nanoseconds; one float conversion for the histogram)
+            duration_ns = monotonic_ns() - start_ns
+
+            # Record metrics
+            (status_counters.get(status) or request_counter(method_label, endpoint, status)).inc()
+            request_duration.observe(duration_ns / 1e9)
+
+            # Log request with structured data (the extra dict is only built
+            # when INFO records would actually be emitted)
+            if endpoint not in _SILENT_ENDPOINTS and logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "HTTP request completed",
+                    extra={
+                        "request_id": request_id,
+                        "method": method,
+                        "path": path,
+                        "status_code": status,
+                        "duration_ms": duration_ns // 1_000_000
+                    }
+                )
+
+        finally:
+            # Decrement in-progress counter
+            in_progress.dec()
+
+
+# Added last so it is the outermost user middleware and times everything
+# below it, including CORS preflights and validation rejections
+app.add_middleware(ObservabilityMiddleware)
 
 
 # Include routers
-app.include_router(health.router, prefix="/health", tags=["Health Checks"])
-app.include_router(redis_cluster.router, prefix="/redis", tags=["Redis Cluster"])
-app.include_router(vault_demo.router, prefix="/examples/vault", tags=["Vault Examples"])
-app.include_router(database_demo.router, prefix="/examples/database", tags=["Database Examples"])
-app.include_router(cache_demo.router, prefix="/examples/cache", tags=["Cache Examples"])
-app.include_router(messaging_demo.router, prefix="/examples/messaging", tags=["Messaging Examples"])
+# Router modules (and the database/messaging drivers they pull in) are
+# imported here, after the app and its middleware are set up, rather than
+# at the top of the module. Drop an entry to skip importing that router.
+ROUTERS = (
+    ("health", "/health", "Health Checks"),
+    ("redis_cluster", "/redis", "Redis Cluster"),
+    ("vault_demo", "/examples/vault", "Vault Examples"),
+    ("database_demo", "/examples/database", "Database Examples"),
+    ("cache_demo", "/examples/cache", "Cache Examples"),
+    ("messaging_demo", "/examples/messaging", "Messaging Examples"),
+)
+for module_name, prefix, tag in ROUTERS:
+    router_module = importlib.import_module(f"app.routers.{module_name}")
+    app.include_router(router_module.router, prefix=prefix, tags=[tag])
+
+
+class _SingleFamily:
+    """Registry stand-in that exposes one already-collected metric family"""
+
+    __slots__ = ("family",)
+
+    def __init__(self, family):
+        self.family = family
+
+    def collect(self):
+        return (self.family,)
+
+
+def iter_metrics(registry=REGISTRY):
+    """Yield the Prometheus exposition text one metric family at a time"""
+    for family in registry.collect():
+        yield generate_latest(_SingleFamily(family))
 
 
 @app.get("/metrics")
 @limiter.limit("1000/minute")  # High limit for metrics scraping
 async def metrics(request: Request):
     """Prometheus metrics endpoint"""
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    # A sync iterator is consumed in Starlette's threadpool, so formatting
+    # runs off the event loop and the full payload is never held at once
+    return StreamingResponse(iter_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+# The root document is static once settings are loaded, so it is serialized
+# once at import instead of on every request
+ROOT_INFO = {
+    "name": "DevStack Core Reference API",
+    "version": "1.1.0",
+    "description": "Reference implementation for infrastructure integration",
+    "docs": "/docs",
+    "health": "/health/all",
+    "metrics": "/metrics",
+    "security": {
+        "cors": {
+            "enabled": True,
+            "allowed_origins": "localhost:3000, localhost:8000, localhost:8080" if not settings.DEBUG else "all (*)",
+            "allowed_methods": "GET, POST, PUT, DELETE, PATCH, OPTIONS",
+            "credentials": not settings.DEBUG,
+            "max_age": "600s"
+        },
+        "rate_limiting": {
+            "general_endpoints": "100/minute",
+            "metrics_endpoint": "1000/minute",
+            "health_checks": "200/minute"
+        },
+        "request_validation": {
+            "max_request_size": "10MB",
+            "allowed_content_types": ["application/json", "application/x-www-form-urlencoded", "multipart/form-data", "text/plain"]
+        },
+        "circuit_breakers": {
+            "enabled": True,
+            "services": ["vault", "postgres", "mysql", "mongodb", "redis", "rabbitmq"],
+            "failure_threshold": 5,
+            "reset_timeout": "60s"
+        }
+    },
+    "redis_cluster": {
+        "nodes": "/redis/cluster/nodes",
+        "slots": "/redis/cluster/slots",
+        "info": "/redis/cluster/info",
+        "node_info": "/redis/nodes/{node_name}/info"
+    },
+    "examples": {
+        "vault": "/examples/vault",
+        "databases": "/examples/database",
+        "cache": "/examples/cache",
+        "messaging": "/examples/messaging",
+    },
+    "note": "This is a reference implementation, not production code"
+}
+ROOT_RESPONSE_BODY = orjson.dumps(ROOT_INFO)
 
 
 @app.get("/")
@@ -308,84 +652,4 @@ async def root(request: Request):
 
     Rate Limit: 100 requests per minute per IP
     """
-    return {
-        "name": "DevStack Core Reference API",
-        "version": "1.1.0",
-        "description": "Reference implementation for infrastructure integration",
-        "docs": "/docs",
-        "health": "/health/all",
-        "metrics": "/metrics",
-        "security": {
-            "cors": {
-                "enabled": True,
-                "allowed_origins": "localhost:3000, localhost:8000, localhost:8080" if not settings.DEBUG else "all (*)",
-                "allowed_methods": "GET, POST, PUT, DELETE, PATCH, OPTIONS",
-                "credentials": not settings.DEBUG,
-                "max_age": "600s"
-            },
-            "rate_limiting": {
-                "general_endpoints": "100/minute",
-                "metrics_endpoint": "1000/minute",
-                "health_checks": "200/minute"
-            },
-            "request_validation": {
-                "max_request_size": "10MB",
-                "allowed_content_types": ["application/json", "application/x-www-form-urlencoded", "multipart/form-data", "text/plain"]
-            },
-            "circuit_breakers": {
-                "enabled": True,
-                "services": ["vault", "postgres", "mysql", "mongodb", "redis", "rabbitmq"],
-                "failure_threshold": 5,
-                "reset_timeout": "60s"
-            }
-        },
-        "redis_cluster": {
-            "nodes": "/redis/cluster/nodes",
-            "slots": "/redis/cluster/slots",
-            "info": "/redis/cluster/info",
-            "node_info": "/redis/nodes/{node_name}/info"
-        },
-        "examples": {
-            "vault": "/examples/vault",
-            "databases": "/examples/database",
-            "cache": "/examples/cache",
-            "messaging": "/examples/messaging",
-        },
-        "note": "This is a reference implementation, not production code"
-    }
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
-    # Set application info metric
-    app_info.labels(version="1.1.0", name="colima-reference-api").set(1)
-
-    # Initialize response caching with Redis
-    try:
-        # Get Redis password from Vault
-        redis_creds = await vault_client.get_secret("redis-1")
-        redis_password = redis_creds.get("password", "")
-        redis_url = f"redis://:{redis_password}@{settings.REDIS_HOST}:{settings.REDIS_PORT}"
-        await cache_manager.init(redis_url, prefix="cache:")
-    except Exception as e:
-        logger.error(f"Failed to initialize cache: {e}")
-        logger.warning("Application will continue without caching")
-
-    logger.info(
-        "Starting DevStack Core Reference API",
-        extra={
-            "vault_address": settings.VAULT_ADDR,
-            "redis_cache_enabled": cache_manager.enabled,
-            "version": "1.0.0"
-        }
-    )
-    logger.info("Application ready")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    # Close cache connection
-    await cache_manager.close()
-    logger.info("Shutting down DevStack Core Reference API")
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
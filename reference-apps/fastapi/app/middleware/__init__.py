@@ -3,6 +3,8 @@ Middleware package for FastAPI application
 """
 
 from .circuit_breaker import (
+    AsyncBreaker,
+    CircuitBreakerError,
     vault_breaker,
     postgres_breaker,
     mysql_breaker,
@@ -10,10 +12,13 @@ from .circuit_breaker import (
     redis_breaker,
     rabbitmq_breaker,
     with_circuit_breaker,
+    with_health_breaker,
     ServiceUnavailableError
 )
 
 __all__ = [
+    'AsyncBreaker',
+    'CircuitBreakerError',
     'vault_breaker',
     'postgres_breaker',
     'mysql_breaker',
@@ -21,5 +26,6 @@ __all__ = [
     'redis_breaker',
     'rabbitmq_breaker',
     'with_circuit_breaker',
+    'with_health_breaker',
     'ServiceUnavailableError'
 ]
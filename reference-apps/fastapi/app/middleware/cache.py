@@ -5,20 +5,23 @@ Implements caching for GET endpoints using fastapi-cache2 with Redis backend.
 Provides cache invalidation utilities for write operations.
 
 Features:
-- Automatic caching of GET endpoints
+- Automatic caching of GET endpoints (other methods skip the cache layer
+  before a key is built, since fastapi-cache2's @cache checks the method first)
 - Custom cache key generation
 - TTL configuration per endpoint
 - Cache invalidation patterns
 - Prometheus metrics for cache hits/misses
 """
 
-import hashlib
-from typing import Optional
+from operator import itemgetter
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
 from fastapi import Request, Response
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from redis import asyncio as aioredis
 import logging
+import xxhash
 from prometheus_client import Counter
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,35 @@ cache_invalidations = Counter(
 )
 
 
+# Server-side pattern invalidation: each EVAL runs one SCAN step and UNLINKs
+# the batch it found, returning {next_cursor, removed}. The caller loops over
+# the cursor so Redis is never blocked for longer than a single batch, and
+# UNLINK hands memory reclamation to a background thread.
+INVALIDATE_PATTERN_LUA = """
+local result = redis.call("SCAN", ARGV[1], "MATCH", ARGV[2], "COUNT", ARGV[3])
+local keys = result[2]
+local removed = 0
+if #keys > 0 then
+    removed = redis.call("UNLINK", unpack(keys))
+end
+return {result[1], removed}
+"""
+INVALIDATE_SCAN_COUNT = 500
+
+# Registered scripts per client, so the Script object and its SHA1 are
+# built once rather than on every invalidation
+_invalidate_scripts: "WeakKeyDictionary[aioredis.Redis, Any]" = WeakKeyDictionary()
+
+
+def get_invalidate_script(redis_client: aioredis.Redis):
+    """Return the pattern invalidation script registered on redis_client"""
+    script = _invalidate_scripts.get(redis_client)
+    if script is None:
+        script = redis_client.register_script(INVALIDATE_PATTERN_LUA)
+        _invalidate_scripts[redis_client] = script
+    return script
+
+
 def generate_cache_key(
     func,
     namespace: str = "",
@@ -73,27 +105,29 @@ def generate_cache_key(
     """
     prefix = f"{namespace}:" if namespace else ""
 
-    # Build key from function and path
-    func_name = f"{func.__module__}:{func.__name__}"
+    # Build key from function and path, appending only non-empty parts
+    key_parts = [prefix] if prefix else []
+    key_parts.append(func.__module__)
+    key_parts.append(func.__name__)
 
-    # Add path parameters
-    path_params = ""
     if request:
+        # Add path parameters
         path_params = ":".join(str(v) for v in request.path_params.values())
+        if path_params:
+            key_parts.append(path_params)
 
-    # Add query parameters (sorted for consistency)
-    query_params = ""
-    if request and request.query_params:
-        sorted_params = sorted(request.query_params.items())
-        query_params = ":".join(f"{k}={v}" for k, v in sorted_params)
+        # Add query parameters (sorted by name for consistency)
+        if request.query_params:
+            key_parts.extend(
+                f"{k}={v}" for k, v in sorted(request.query_params.items(), key=itemgetter(0))
+            )
 
-    # Combine all parts
-    key_parts = [prefix, func_name, path_params, query_params]
-    key = ":".join(filter(None, key_parts))
+    key = ":".join(key_parts)
 
     # Hash if too long (Redis keys should be kept under 250 chars for performance)
     if len(key) > 200:
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        # Non-cryptographic 128-bit hash: only used to dedupe keys, not for security
+        key_hash = xxhash.xxh3_128_hexdigest(key.encode("utf-8"))
         # Return just the prefix and hash to keep it short
         return f"{prefix}hash:{key_hash}"
 
@@ -112,16 +146,21 @@ async def invalidate_cache_pattern(pattern: str, redis_client: aioredis.Redis):
         await invalidate_cache_pattern("cache:examples:*", redis_client)
     """
     try:
-        # Find all keys matching pattern
-        keys = []
-        async for key in redis_client.scan_iter(match=pattern):
-            keys.append(key)
-
-        if keys:
-            # Delete all matching keys
-            await redis_client.delete(*keys)
-            cache_invalidations.labels(pattern=pattern).inc(len(keys))
-            logger.info(f"Invalidated {len(keys)} cache keys matching pattern: {pattern}")
+        # Scan and unlink matching keys server-side one batch per EVALSHA
+        invalidate_script = get_invalidate_script(redis_client)
+        removed = 0
+        cursor = 0
+        while True:
+            cursor, batch_removed = await invalidate_script(
+                args=[cursor, pattern, INVALIDATE_SCAN_COUNT]
+            )
+            removed += int(batch_removed)
+            if int(cursor) == 0:
+                break
+
+        if removed:
+            cache_invalidations.labels(pattern=pattern).inc(removed)
+            logger.info(f"Invalidated {removed} cache keys matching pattern: {pattern}")
         else:
             logger.debug(f"No cache keys found matching pattern: {pattern}")
 
@@ -138,7 +177,8 @@ async def invalidate_cache_key(key: str, redis_client: aioredis.Redis):
         redis_client: Redis client instance
     """
     try:
-        deleted = await redis_client.delete(key)
+        # UNLINK frees the value in a background thread instead of blocking Redis
+        deleted = await redis_client.unlink(key)
         if deleted:
             cache_invalidations.labels(pattern=key).inc()
             logger.info(f"Invalidated cache key: {key}")
@@ -157,18 +197,36 @@ class CacheManager:
         self.redis_client: Optional[aioredis.Redis] = None
         self.enabled = False
 
-    async def init(self, redis_url: str, prefix: str = "cache:"):
+    async def init(
+        self,
+        redis_url: str,
+        prefix: str = "cache:",
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+    ):
         """
         Initialize cache with Redis backend.
 
         Args:
             redis_url: Redis connection URL
             prefix: Cache key prefix
+            max_connections: Size of the shared connection pool
+            pool_timeout: Seconds to wait for a free pooled connection
         """
         try:
             # Note: decode_responses must be False (default) for fastapi-cache2
             # as it stores cached data as binary/bytes
-            self.redis_client = aioredis.from_url(redis_url)
+            # BlockingConnectionPool caps connections and makes bursts wait up to
+            # pool_timeout for a free one, instead of raising "Too many
+            # connections" like the default pool; redis-py picks the hiredis
+            # parser automatically (redis[hiredis]) and sets TCP_NODELAY.
+            pool = aioredis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=max_connections,
+                timeout=pool_timeout,
+                socket_keepalive=True,
+            )
+            self.redis_client = aioredis.Redis.from_pool(pool)
 
             # Test connection
             await self.redis_client.ping()
@@ -7,17 +7,21 @@ Implements circuit breakers to prevent cascading failures when external services
 Circuit Breaker States:
 - CLOSED: Normal operation, requests pass through
 - OPEN: Too many failures, requests fail immediately
-- HALF_OPEN: Testing if service recovered, limited requests pass through
+- HALF_OPEN: Testing if service recovered; the next failure re-opens the
+  circuit and the next success closes it
 
 Configuration:
-- fail_max: 5 failures trigger circuit to open
+- fail_max: 5 consecutive failures trigger circuit to open
 - reset_timeout: 60 seconds before attempting recovery (time circuit stays open)
 - listeners: Callbacks for circuit state changes and metrics
+
+The breakers are plain asyncio state machines: all calls run on the event
+loop thread, so state and counters are updated without locks.
 """
 
-import pybreaker
 import logging
-from typing import Callable, Any
+import time
+from typing import Callable, Any, Optional
 from functools import wraps
 from prometheus_client import Counter
 
@@ -80,81 +84,136 @@ def on_circuit_failure(service_name: str):
     return listener
 
 
-# Create circuit breakers for each external service
-vault_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="vault",
-    listeners=[
-        on_circuit_open("vault"),
-        on_circuit_half_open("vault"),
-        on_circuit_close("vault"),
-        on_circuit_failure("vault")
-    ]
-)
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
 
-postgres_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="postgres",
-    listeners=[
-        on_circuit_open("postgres"),
-        on_circuit_half_open("postgres"),
-        on_circuit_close("postgres"),
-        on_circuit_failure("postgres")
-    ]
-)
 
-mysql_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="mysql",
-    listeners=[
-        on_circuit_open("mysql"),
-        on_circuit_half_open("mysql"),
-        on_circuit_close("mysql"),
-        on_circuit_failure("mysql")
-    ]
-)
+class CircuitBreakerError(Exception):
+    """Raised by AsyncBreaker.call() while the circuit is open"""
+    pass
 
-mongodb_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="mongodb",
-    listeners=[
-        on_circuit_open("mongodb"),
-        on_circuit_half_open("mongodb"),
-        on_circuit_close("mongodb"),
-        on_circuit_failure("mongodb")
-    ]
-)
 
-redis_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="redis",
-    listeners=[
-        on_circuit_open("redis"),
-        on_circuit_half_open("redis"),
-        on_circuit_close("redis"),
-        on_circuit_failure("redis")
-    ]
-)
+class AsyncBreaker:
+    """
+    Lock-free circuit breaker for coroutines.
+
+    Args:
+        name: Service name used in logs and error messages
+        fail_max: Consecutive failures that open the circuit
+        reset_timeout: Seconds the circuit stays open before a trial call
+        on_open, on_half_open, on_close, on_failure: Optional callbacks
+            invoked with the breaker on each transition / failure
+    """
+
+    __slots__ = (
+        "name", "state", "failures", "opened_at", "fail_max", "reset_timeout",
+        "on_open", "on_half_open", "on_close", "on_failure",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 60,
+        on_open: Optional[Callable] = None,
+        on_half_open: Optional[Callable] = None,
+        on_close: Optional[Callable] = None,
+        on_failure: Optional[Callable] = None,
+    ):
+        self.name = name
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.on_open = on_open
+        self.on_half_open = on_half_open
+        self.on_close = on_close
+        self.on_failure = on_failure
+
+    @property
+    def current_state(self) -> str:
+        """Current state name (closed, open or half-open)"""
+        return self.state
+
+    def _allow(self) -> bool:
+        """Return whether a call may proceed, moving OPEN -> HALF_OPEN once reset_timeout passes"""
+        if self.state != STATE_OPEN:
+            return True
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        self.state = STATE_HALF_OPEN
+        if self.on_half_open:
+            self.on_half_open(self)
+        return True
+
+    def _record_success(self) -> None:
+        """Reset the failure count and close a half-open circuit"""
+        self.failures = 0
+        if self.state == STATE_HALF_OPEN:
+            self.state = STATE_CLOSED
+            if self.on_close:
+                self.on_close(self)
+
+    def _record_failure(self) -> None:
+        """Count a failure and open the circuit on threshold or failed trial call"""
+        self.failures += 1
+        if self.on_failure:
+            self.on_failure(self)
+        # Calls already in flight when the circuit opened can fail after it;
+        # they must not reopen it, restarting the timeout and the open count
+        if self.state == STATE_OPEN:
+            return
+        if self.state == STATE_HALF_OPEN or self.failures >= self.fail_max:
+            self.state = STATE_OPEN
+            self.opened_at = time.monotonic()
+            if self.on_open:
+                self.on_open(self)
+
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await func(*args, **kwargs) under circuit breaker protection.
+
+        Raises:
+            CircuitBreakerError: If the circuit is open
+        """
+        if not self._allow():
+            raise CircuitBreakerError(f"Circuit breaker {self.name} is open")
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+
+        self._record_success()
+        return result
 
-rabbitmq_breaker = pybreaker.CircuitBreaker(
-    fail_max=5,
-    reset_timeout=60,
-    name="rabbitmq",
-    listeners=[
-        on_circuit_open("rabbitmq"),
-        on_circuit_half_open("rabbitmq"),
-        on_circuit_close("rabbitmq"),
-        on_circuit_failure("rabbitmq")
-    ]
-)
 
+def create_breaker(service_name: str, fail_max: int = 5, reset_timeout: float = 60) -> AsyncBreaker:
+    """Create a breaker for a service with the standard listeners attached"""
+    return AsyncBreaker(
+        name=service_name,
+        fail_max=fail_max,
+        reset_timeout=reset_timeout,
+        on_open=on_circuit_open(service_name),
+        on_half_open=on_circuit_half_open(service_name),
+        on_close=on_circuit_close(service_name),
+        on_failure=on_circuit_failure(service_name),
+    )
 
-def with_circuit_breaker(breaker: pybreaker.CircuitBreaker):
+
+# Create circuit breakers for each external service
+vault_breaker = create_breaker("vault")
+postgres_breaker = create_breaker("postgres")
+mysql_breaker = create_breaker("mysql")
+mongodb_breaker = create_breaker("mongodb")
+redis_breaker = create_breaker("redis")
+rabbitmq_breaker = create_breaker("rabbitmq")
+
+
+def with_circuit_breaker(breaker: AsyncBreaker):
     """
     Decorator to wrap functions with circuit breaker protection
 
@@ -167,23 +226,52 @@ def with_circuit_breaker(breaker: pybreaker.CircuitBreaker):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # Create a synchronous wrapper for the async function
-            async def async_call():
-                return await func(*args, **kwargs)
-
-            try:
-                # Use pybreaker's call() method with a sync wrapper that runs the async code
-                import asyncio
-                result = breaker.call(lambda: asyncio.create_task(async_call()))
-                # Wait for the task to complete
-                if asyncio.iscoroutine(result) or asyncio.isfuture(result) or asyncio.istask(result):
-                    return await result
-                return result
-            except pybreaker.CircuitBreakerError as e:
-                logger.error(f"Circuit breaker {breaker.name} is OPEN: {str(e)}")
+            # State is checked and updated inline, so the protected coroutine
+            # is awaited directly with no extra call frame or task
+            if not breaker._allow():
+                logger.error(f"Circuit breaker {breaker.name} is OPEN")
                 raise ServiceUnavailableError(
                     f"{breaker.name.capitalize()} service is temporarily unavailable"
                 )
+
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                breaker._record_failure()
+                raise
+
+            breaker._record_success()
+            return result
+        return wrapper
+    return decorator
+
+
+def with_health_breaker(breaker: AsyncBreaker):
+    """
+    Decorator for health check coroutines returning a status dict
+
+    Health checks report failures as {"status": "unhealthy", ...} instead of
+    raising, so the result is inspected: an unhealthy result (or the check
+    being cancelled, e.g. by a timeout) counts as a failure. While the
+    circuit is open the check is skipped and reported unhealthy at once.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            if not breaker._allow():
+                return {"status": "unhealthy", "error": "circuit_open"}
+
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException:
+                breaker._record_failure()
+                raise
+
+            if result.get("status") == "unhealthy":
+                breaker._record_failure()
+            else:
+                breaker._record_success()
+            return result
         return wrapper
     return decorator
 
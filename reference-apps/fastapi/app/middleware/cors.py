@@ -0,0 +1,72 @@
+"""
+CORS middleware with cached preflight responses
+
+Extends Starlette's CORSMiddleware for a fixed origin list:
+- Allowed origins are held in a frozenset, so origin checks are O(1)
+- Successful preflight responses are built once per distinct request and
+  replayed afterwards with two sends, instead of rebuilding the header
+  dict and re-validating method and headers every time
+
+Failed preflights and simple (non-OPTIONS) requests use the stock
+implementation unchanged.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Upper bound on distinct (origin, method, headers) preflights kept; with
+# allow_origins=["*"] the origin is client-controlled
+PREFLIGHT_CACHE_SIZE = 256
+
+PreflightKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class CachedPreflightResponse(Response):
+    """
+    Pre-built preflight response that can be sent any number of times.
+
+    Each send gets a fresh header list, since outer middleware may append
+    to it in place; nothing else is rebuilt per request.
+    """
+
+    def __init__(self, response: Response):
+        self.status_code = response.status_code
+        self.body = response.body
+        self.raw_headers = list(response.raw_headers)
+        self.background = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": list(self.raw_headers)})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class CachedPreflightCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that reuses pre-built responses for allowed preflights"""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self._preflight_cache: Dict[PreflightKey, CachedPreflightResponse] = {}
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        key = (
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+            request_headers.get("access-control-request-private-network"),
+        )
+
+        cached = self._preflight_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = super().preflight_response(request_headers)
+        if response.status_code != 200 or len(self._preflight_cache) >= PREFLIGHT_CACHE_SIZE:
+            return response
+
+        cached = self._preflight_cache[key] = CachedPreflightResponse(response)
+        return cached
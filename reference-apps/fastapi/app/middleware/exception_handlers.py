@@ -10,11 +10,12 @@ Features:
 - Prometheus metrics for error tracking
 - Request ID correlation
 - Debug mode support
+- orjson-rendered response bodies
 """
 
 import logging
+from typing import Any, Dict, Tuple
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from prometheus_client import Counter
@@ -22,14 +23,10 @@ import traceback
 
 from app.exceptions import (
     BaseAPIException,
-    ServiceUnavailableError,
-    VaultUnavailableError,
-    DatabaseConnectionError,
-    CacheConnectionError,
-    MessageQueueError,
-    CircuitBreakerError
+    ServiceUnavailableError
 )
 from app.config import settings
+from app.utils.responses import OrjsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +37,67 @@ error_counter = Counter(
     ['error_type', 'status_code']
 )
 
+# error_type values kept as-is; anything else (e.g. the class of an
+# unhandled exception) is counted as "Other" so new bugs cannot add series
+ALLOWED_ERROR_TYPES = frozenset({
+    "BaseAPIException",
+    "ServiceUnavailableError",
+    "VaultUnavailableError",
+    "DatabaseConnectionError",
+    "CacheConnectionError",
+    "MessageQueueError",
+    "CircuitBreakerError",
+    "ConfigurationError",
+    "ValidationError",
+    "ResourceNotFoundError",
+    "AuthenticationError",
+    "RateLimitError",
+    "TimeoutError",
+    "HTTPException",
+})
+OTHER_ERROR_TYPE = "Other"
+
+_error_counters: Dict[Tuple[str, int], Any] = {}
+
+
+def count_error(error_type: str, status_code: int) -> None:
+    """
+    Increment http_errors_total for an error response.
+
+    status_code is recorded by class ("4xx", "5xx") and error_type is limited
+    to ALLOWED_ERROR_TYPES; label children are cached per bucketed pair.
+    """
+    if error_type not in ALLOWED_ERROR_TYPES:
+        error_type = OTHER_ERROR_TYPE
+    status_class = status_code // 100
+
+    counter = _error_counters.get((error_type, status_class))
+    if counter is None:
+        counter = error_counter.labels(error_type=error_type, status_code=f"{status_class}xx")
+        _error_counters[(error_type, status_class)] = counter
+    counter.inc()
+
+
+# Frames kept in debug tracebacks; deeper stacks keep only the innermost
+# frames (nearest the error) instead of formatting every frame
+DEBUG_TRACEBACK_LIMIT = 20
+
+
+def format_debug_traceback(exc: BaseException) -> str:
+    """Format the innermost DEBUG_TRACEBACK_LIMIT frames of exc's traceback"""
+    te = traceback.TracebackException.from_exception(exc, limit=-DEBUG_TRACEBACK_LIMIT)
+    return "".join(te.format())
+
 
 def get_request_id(request: Request) -> str:
     """Extract request ID from request state"""
-    return getattr(request.state, 'request_id', 'unknown')
+    # Read the scope's state dict directly: request.state resolves names
+    # through State.__getattr__, which only runs after a failed lookup
+    state = request.scope.get("state")
+    return state.get("request_id", "unknown") if state else "unknown"
 
 
-async def base_api_exception_handler(request: Request, exc: BaseAPIException) -> JSONResponse:
+async def base_api_exception_handler(request: Request, exc: BaseAPIException) -> OrjsonResponse:
     """
     Handler for all custom API exceptions.
 
@@ -54,24 +105,23 @@ async def base_api_exception_handler(request: Request, exc: BaseAPIException) ->
     """
     request_id = get_request_id(request)
 
-    # Log the error
-    logger.error(
-        f"{exc.__class__.__name__}: {exc.message}",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": str(request.url.path),
-            "status_code": exc.status_code,
-            "error_type": exc.__class__.__name__,
-            "error_details": exc.details
-        }
-    )
+    # Log the error (the message and extra dict are only built if the
+    # record would be emitted)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "%s: %s", exc.error_name, exc.message,
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.scope["path"],
+                "status_code": exc.status_code,
+                "error_type": exc.error_name,
+                "error_details": exc.details
+            }
+        )
 
     # Track error metric
-    error_counter.labels(
-        error_type=exc.__class__.__name__,
-        status_code=exc.status_code
-    ).inc()
+    count_error(exc.error_name, exc.status_code)
 
     # Build response
     response_data = exc.to_dict()
@@ -80,17 +130,17 @@ async def base_api_exception_handler(request: Request, exc: BaseAPIException) ->
     # Add stack trace in debug mode
     if settings.DEBUG:
         response_data["debug"] = {
-            "traceback": traceback.format_exc()
+            "traceback": format_debug_traceback(exc)
         }
 
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=exc.status_code,
         content=response_data,
         headers={"X-Request-ID": request_id}
     )
 
 
-async def service_unavailable_handler(request: Request, exc: ServiceUnavailableError) -> JSONResponse:
+async def service_unavailable_handler(request: Request, exc: ServiceUnavailableError) -> OrjsonResponse:
     """
     Handler for service unavailable errors.
 
@@ -98,34 +148,32 @@ async def service_unavailable_handler(request: Request, exc: ServiceUnavailableE
     """
     request_id = get_request_id(request)
 
-    logger.error(
-        f"Service unavailable: {exc.service_name} - {exc.message}",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": str(request.url.path),
-            "service": exc.service_name,
-            "error_details": exc.details
-        }
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Service unavailable: %s - %s", exc.service_name, exc.message,
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.scope["path"],
+                "service": exc.service_name,
+                "error_details": exc.details
+            }
+        )
 
-    error_counter.labels(
-        error_type=exc.__class__.__name__,
-        status_code=exc.status_code
-    ).inc()
+    count_error(exc.error_name, exc.status_code)
 
     response_data = exc.to_dict()
     response_data["request_id"] = request_id
     response_data["retry_suggestion"] = "Please try again later or contact support if the issue persists"
 
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=exc.status_code,
         content=response_data,
         headers={"X-Request-ID": request_id}
     )
 
 
-async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_error_handler(request: Request, exc: RequestValidationError) -> OrjsonResponse:
     """
     Handler for FastAPI request validation errors.
 
@@ -133,22 +181,20 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
     """
     request_id = get_request_id(request)
 
-    logger.warning(
-        f"Request validation failed: {exc}",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": str(request.url.path),
-            "validation_errors": exc.errors()
-        }
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Request validation failed: %s", exc,
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.scope["path"],
+                "validation_errors": exc.errors()
+            }
+        )
 
-    error_counter.labels(
-        error_type="ValidationError",
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
-    ).inc()
+    count_error("ValidationError", status.HTTP_422_UNPROCESSABLE_ENTITY)
 
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
@@ -163,7 +209,7 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> OrjsonResponse:
     """
     Handler for standard HTTP exceptions.
 
@@ -171,22 +217,20 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     """
     request_id = get_request_id(request)
 
-    logger.warning(
-        f"HTTP exception: {exc.status_code} - {exc.detail}",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": str(request.url.path),
-            "status_code": exc.status_code
-        }
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "HTTP exception: %s - %s", exc.status_code, exc.detail,
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.scope["path"],
+                "status_code": exc.status_code
+            }
+        )
 
-    error_counter.labels(
-        error_type="HTTPException",
-        status_code=exc.status_code
-    ).inc()
+    count_error("HTTPException", exc.status_code)
 
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTPException",
@@ -198,7 +242,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> OrjsonResponse:
     """
     Handler for all unhandled exceptions.
 
@@ -206,23 +250,22 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
     provides a generic error response while logging details.
     """
     request_id = get_request_id(request)
+    exception_type = exc.__class__.__name__
 
     # Log with full traceback
-    logger.error(
-        f"Unhandled exception: {exc}",
-        extra={
-            "request_id": request_id,
-            "method": request.method,
-            "path": str(request.url.path),
-            "exception_type": exc.__class__.__name__
-        },
-        exc_info=True
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unhandled exception: %s", exc,
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.scope["path"],
+                "exception_type": exception_type
+            },
+            exc_info=True
+        )
 
-    error_counter.labels(
-        error_type=exc.__class__.__name__,
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-    ).inc()
+    count_error(exception_type, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     response_data = {
         "error": "InternalServerError",
@@ -234,12 +277,12 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
     # Include exception details in debug mode
     if settings.DEBUG:
         response_data["debug"] = {
-            "exception_type": exc.__class__.__name__,
+            "exception_type": exception_type,
             "exception_message": str(exc),
-            "traceback": traceback.format_exc()
+            "traceback": format_debug_traceback(exc)
         }
 
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=response_data,
         headers={"X-Request-ID": request_id}
@@ -252,14 +295,10 @@ def register_exception_handlers(app):
 
     Call this function during application startup.
     """
-    # Custom exception handlers
+    # Custom exception handlers (Starlette resolves handlers along the
+    # exception's MRO, so ServiceUnavailableError covers its subclasses)
     app.add_exception_handler(BaseAPIException, base_api_exception_handler)
     app.add_exception_handler(ServiceUnavailableError, service_unavailable_handler)
-    app.add_exception_handler(VaultUnavailableError, service_unavailable_handler)
-    app.add_exception_handler(DatabaseConnectionError, service_unavailable_handler)
-    app.add_exception_handler(CacheConnectionError, service_unavailable_handler)
-    app.add_exception_handler(MessageQueueError, service_unavailable_handler)
-    app.add_exception_handler(CircuitBreakerError, service_unavailable_handler)
 
     # Standard exception handlers
     app.add_exception_handler(RequestValidationError, validation_error_handler)
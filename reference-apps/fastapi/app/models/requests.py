@@ -11,14 +11,21 @@ Defines Pydantic models for request validation with:
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Dict, Any, Optional
+import json
 import re
 
+import orjson
+
+# Patterns for the identifier validators below, compiled once at import
+_SERVICE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_CACHE_KEY_RE = re.compile(r'^[a-zA-Z0-9_:.-]+$')
+_QUEUE_NAME_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+_SECRET_KEY_RE = _SERVICE_NAME_RE
+
 
 class ServiceNameParam(BaseModel):
     """Validation for service name path parameters"""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     name: str = Field(
         ...,
         min_length=1,
@@ -31,7 +38,7 @@ class ServiceNameParam(BaseModel):
     @classmethod
     def validate_service_name(cls, v: str) -> str:
         """Validate service name contains only allowed characters"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _SERVICE_NAME_RE.fullmatch(v):
             raise ValueError(
                 'Service name must contain only alphanumeric characters, hyphens, and underscores'
             )
@@ -41,8 +48,6 @@ class ServiceNameParam(BaseModel):
 class CacheKeyParam(BaseModel):
     """Validation for cache key path parameters"""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     key: str = Field(
         ...,
         min_length=1,
@@ -55,7 +60,7 @@ class CacheKeyParam(BaseModel):
     @classmethod
     def validate_cache_key(cls, v: str) -> str:
         """Validate cache key contains only allowed characters"""
-        if not re.match(r'^[a-zA-Z0-9_:.-]+$', v):
+        if not _CACHE_KEY_RE.fullmatch(v):
             raise ValueError(
                 'Cache key must contain only alphanumeric characters and: - _ : .'
             )
@@ -65,8 +70,6 @@ class CacheKeyParam(BaseModel):
 class QueueNameParam(BaseModel):
     """Validation for queue name parameters"""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     name: str = Field(
         ...,
         min_length=1,
@@ -79,7 +82,7 @@ class QueueNameParam(BaseModel):
     @classmethod
     def validate_queue_name(cls, v: str) -> str:
         """Validate queue name contains only allowed characters"""
-        if not re.match(r'^[a-zA-Z0-9_.-]+$', v):
+        if not _QUEUE_NAME_RE.fullmatch(v):
             raise ValueError(
                 'Queue name must contain only alphanumeric characters and: - _ .'
             )
@@ -130,24 +133,27 @@ class MessagePublishRequest(BaseModel):
     @field_validator('message')
     @classmethod
     def validate_message_size(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate message is not too large"""
-        import json
-        message_size = len(json.dumps(v))
+        """Validate message is not empty or too large"""
+        if not v:
+            raise ValueError('Message cannot be empty')
+
+        # orjson encodes straight to UTF-8 bytes, so the size is measured
+        # without building an intermediate str. It rejects integers beyond
+        # 64 bits, which the stdlib encodes.
+        try:
+            message_size = len(orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS))
+        except orjson.JSONEncodeError:
+            message_size = len(json.dumps(v, ensure_ascii=False).encode())
 
         if message_size > 1_000_000:  # 1MB limit
             raise ValueError(f'Message size ({message_size} bytes) exceeds 1MB limit')
 
-        if not v:
-            raise ValueError('Message cannot be empty')
-
         return v
 
 
 class SecretKeyParam(BaseModel):
     """Validation for secret key path parameters"""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
-
     key: str = Field(
         ...,
         min_length=1,
@@ -160,7 +166,7 @@ class SecretKeyParam(BaseModel):
     @classmethod
     def validate_secret_key(cls, v: str) -> str:
         """Validate secret key contains only allowed characters"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _SECRET_KEY_RE.fullmatch(v):
             raise ValueError(
                 'Secret key must contain only alphanumeric characters, hyphens, and underscores'
             )
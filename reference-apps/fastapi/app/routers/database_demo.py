@@ -7,6 +7,10 @@ Demonstrates connections to:
 - MongoDB
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 import asyncpg
 import aiomysql
@@ -15,29 +19,107 @@ import motor.motor_asyncio
 from app.config import settings
 from app.services.vault import vault_client
 
-router = APIRouter()
+# Shared pools created on first use, so the Vault lookup and the
+# TCP/TLS/AUTH handshake happen once instead of on every request
+POOL_MAX_SIZE = 16
+_pg_pool: Optional[asyncpg.Pool] = None
+_mysql_pool: Optional[aiomysql.Pool] = None
+_mongo_client: Optional[motor.motor_asyncio.AsyncIOMotorClient] = None
+_mongo_database: str = "dev_database"
+_pool_lock = asyncio.Lock()
+
+
+async def get_postgres_pool() -> asyncpg.Pool:
+    """Get the shared PostgreSQL pool, creating it with Vault credentials on first use"""
+    global _pg_pool
+    if _pg_pool is None:
+        async with _pool_lock:
+            if _pg_pool is None:
+                creds = await vault_client.get_secret("postgres")
+                _pg_pool = await asyncpg.create_pool(
+                    host=settings.POSTGRES_HOST,
+                    port=settings.POSTGRES_PORT,
+                    user=creds.get("user"),
+                    password=creds.get("password"),
+                    database=creds.get("database"),
+                    timeout=5.0,
+                    min_size=1,
+                    max_size=POOL_MAX_SIZE
+                )
+    return _pg_pool
+
+
+async def get_mysql_pool() -> aiomysql.Pool:
+    """Get the shared MySQL pool, creating it with Vault credentials on first use"""
+    global _mysql_pool
+    if _mysql_pool is None:
+        async with _pool_lock:
+            if _mysql_pool is None:
+                creds = await vault_client.get_secret("mysql")
+                _mysql_pool = await aiomysql.create_pool(
+                    host=settings.MYSQL_HOST,
+                    port=settings.MYSQL_PORT,
+                    user=creds.get("user"),
+                    password=creds.get("password"),
+                    db=creds.get("database"),
+                    connect_timeout=5,
+                    minsize=1,
+                    maxsize=POOL_MAX_SIZE
+                )
+    return _mysql_pool
+
+
+async def get_mongo_database():
+    """Get the database handle of the shared MongoDB client, creating it on first use"""
+    global _mongo_client, _mongo_database
+    if _mongo_client is None:
+        async with _pool_lock:
+            if _mongo_client is None:
+                creds = await vault_client.get_secret("mongodb")
+                uri = f"mongodb://{creds.get('user')}:{creds.get('password')}@{settings.MONGODB_HOST}:{settings.MONGODB_PORT}"
+                _mongo_database = creds.get("database", "dev_database")
+                _mongo_client = motor.motor_asyncio.AsyncIOMotorClient(
+                    uri,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=POOL_MAX_SIZE
+                )
+    return _mongo_client[_mongo_database]
+
+
+async def close_database_pools() -> None:
+    """Close the shared database pools and client"""
+    global _pg_pool, _mysql_pool, _mongo_client
+    if _pg_pool is not None:
+        pool, _pg_pool = _pg_pool, None
+        await pool.close()
+    if _mysql_pool is not None:
+        pool, _mysql_pool = _mysql_pool, None
+        pool.close()
+        await pool.wait_closed()
+    if _mongo_client is not None:
+        client, _mongo_client = _mongo_client, None
+        client.close()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Release the shared database pools when the application shuts down"""
+    yield
+    await close_database_pools()
+
+
+router = APIRouter(lifespan=lifespan)
 
 
 @router.get("/postgres/query")
 async def postgres_example():
     """Example: Execute a simple PostgreSQL query"""
     try:
-        # Get credentials from Vault
-        creds = await vault_client.get_secret("postgres")
-
-        # Connect
-        conn = await asyncpg.connect(
-            host=settings.POSTGRES_HOST,
-            port=settings.POSTGRES_PORT,
-            user=creds.get("user"),
-            password=creds.get("password"),
-            database=creds.get("database"),
-            timeout=5.0
-        )
-
-        # Execute query
-        result = await conn.fetchval("SELECT current_timestamp")
-        await conn.close()
+        pool = await get_postgres_pool()
+
+        # Execute query on a pooled connection
+        async with pool.acquire() as conn:
+            result = await conn.fetchval("SELECT current_timestamp")
 
         return {
             "database": "PostgreSQL",
@@ -52,24 +134,13 @@ async def postgres_example():
 async def mysql_example():
     """Example: Execute a simple MySQL query"""
     try:
-        # Get credentials from Vault
-        creds = await vault_client.get_secret("mysql")
-
-        # Connect
-        conn = await aiomysql.connect(
-            host=settings.MYSQL_HOST,
-            port=settings.MYSQL_PORT,
-            user=creds.get("user"),
-            password=creds.get("password"),
-            db=creds.get("database"),
-            connect_timeout=5
-        )
-
-        async with conn.cursor() as cursor:
-            await cursor.execute("SELECT NOW()")
-            result = await cursor.fetchone()
+        pool = await get_mysql_pool()
 
-        conn.close()
+        # Execute query on a pooled connection
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT NOW()")
+                result = await cursor.fetchone()
 
         return {
             "database": "MySQL",
@@ -84,19 +155,10 @@ async def mysql_example():
 async def mongodb_example():
     """Example: Query MongoDB"""
     try:
-        # Get credentials from Vault
-        creds = await vault_client.get_secret("mongodb")
-
-        # Connect
-        uri = f"mongodb://{creds.get('user')}:{creds.get('password')}@{settings.MONGODB_HOST}:{settings.MONGODB_PORT}"
-        client = motor.motor_asyncio.AsyncIOMotorClient(uri, serverSelectionTimeoutMS=5000)
-
-        # Access database
-        db = client[creds.get("database", "dev_database")]
+        db = await get_mongo_database()
 
         # List collections
         collections = await db.list_collection_names()
-        client.close()
 
         return {
             "database": "MongoDB",
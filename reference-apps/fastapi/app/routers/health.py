@@ -9,27 +9,196 @@ Provides comprehensive health monitoring for:
 - Redis Cluster
 - RabbitMQ
 
-All health checks are protected with circuit breakers to prevent cascading failures.
+All health checks are protected with circuit breakers to prevent cascading
+failures: after repeated failures a check reports the service unhealthy
+immediately instead of waiting on connect timeouts.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import APIRouter
 from fastapi_cache.decorator import cache
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+import asyncio
 import asyncpg
 import aiomysql
 import motor.motor_asyncio
 import aio_pika
 import redis.asyncio as redis
 import logging
+import time
 
 from app.config import settings
 from app.services.vault import vault_client
 from app.middleware.cache import generate_cache_key
+from app.middleware.circuit_breaker import create_breaker, with_health_breaker
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+
+# Connections reused across health checks: created with Vault credentials on
+# first use and closed by the router lifespan, so a check costs a round trip
+# on an open connection instead of a new TCP/TLS/AUTH handshake. Each backend
+# has its own lock so the concurrent checks in check_all never wait on each
+# other.
+HEALTH_POOL_MAX_SIZE = 2
+_pg_pool: Optional[asyncpg.Pool] = None
+_pg_lock = asyncio.Lock()
+_mysql_pool: Optional[aiomysql.Pool] = None
+_mysql_lock = asyncio.Lock()
+_mongo_client: Optional[motor.motor_asyncio.AsyncIOMotorClient] = None
+_mongo_lock = asyncio.Lock()
+# Server version reported by check_mongodb, re-read at most every
+# MONGO_VERSION_TTL seconds so each check costs a single ping
+MONGO_VERSION_TTL = 300
+_mongo_version: Optional[str] = None
+_mongo_version_read_at = 0.0
+_rabbitmq_connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+_rabbitmq_lock = asyncio.Lock()
+_redis_clients: Dict[Tuple[str, int], redis.Redis] = {}
+_redis_lock = asyncio.Lock()
+
+
+async def get_postgres_pool() -> asyncpg.Pool:
+    """Get the health check PostgreSQL pool, creating it on first use"""
+    global _pg_pool
+    if _pg_pool is None:
+        async with _pg_lock:
+            if _pg_pool is None:
+                creds = await vault_client.get_secret("postgres")
+                _pg_pool = await asyncpg.create_pool(
+                    host=settings.POSTGRES_HOST,
+                    port=settings.POSTGRES_PORT,
+                    user=creds.get("user"),
+                    password=creds.get("password"),
+                    database=creds.get("database"),
+                    timeout=5.0,
+                    min_size=1,
+                    max_size=HEALTH_POOL_MAX_SIZE
+                )
+    return _pg_pool
+
+
+async def get_mysql_pool() -> aiomysql.Pool:
+    """Get the health check MySQL pool, creating it on first use"""
+    global _mysql_pool
+    if _mysql_pool is None:
+        async with _mysql_lock:
+            if _mysql_pool is None:
+                creds = await vault_client.get_secret("mysql")
+                _mysql_pool = await aiomysql.create_pool(
+                    host=settings.MYSQL_HOST,
+                    port=settings.MYSQL_PORT,
+                    user=creds.get("user"),
+                    password=creds.get("password"),
+                    db=creds.get("database"),
+                    connect_timeout=5,
+                    minsize=1,
+                    maxsize=HEALTH_POOL_MAX_SIZE
+                )
+    return _mysql_pool
+
+
+async def get_mongo_client() -> motor.motor_asyncio.AsyncIOMotorClient:
+    """Get the health check MongoDB client, creating it on first use"""
+    global _mongo_client
+    if _mongo_client is None:
+        async with _mongo_lock:
+            if _mongo_client is None:
+                creds = await vault_client.get_secret("mongodb")
+                # Build connection string with authSource
+                uri = f"mongodb://{creds.get('user')}:{creds.get('password')}@{settings.MONGODB_HOST}:{settings.MONGODB_PORT}/?authSource=admin"
+                _mongo_client = motor.motor_asyncio.AsyncIOMotorClient(
+                    uri,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=HEALTH_POOL_MAX_SIZE
+                )
+    return _mongo_client
+
+
+async def get_rabbitmq_connection() -> aio_pika.abc.AbstractRobustConnection:
+    """Get the health check RabbitMQ connection, connecting on first use"""
+    global _rabbitmq_connection
+    if _rabbitmq_connection is None:
+        async with _rabbitmq_lock:
+            if _rabbitmq_connection is None:
+                creds = await vault_client.get_secret("rabbitmq")
+
+                # Get vhost (default to 'dev_vhost' if not in vault)
+                vhost = creds.get('vhost', 'dev_vhost')
+
+                # Build connection string with vhost
+                url = f"amqp://{creds.get('user')}:{creds.get('password')}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/{vhost}"
+                _rabbitmq_connection = await aio_pika.connect_robust(url, timeout=5.0)
+    return _rabbitmq_connection
+
+
+async def get_redis_node_clients() -> List[Tuple[str, int, redis.Redis]]:
+    """Get a client per configured Redis node, creating missing ones on first use"""
+    nodes = settings.redis_nodes
+    if any(node not in _redis_clients for node in nodes):
+        async with _redis_lock:
+            missing = [node for node in nodes if node not in _redis_clients]
+            if missing:
+                creds = await vault_client.get_secret("redis-1")
+                for host, port in missing:
+                    _redis_clients[(host, port)] = redis.Redis(
+                        host=host,
+                        port=port,
+                        password=creds.get("password"),
+                        decode_responses=True,
+                        socket_connect_timeout=5
+                    )
+    return [(host, port, _redis_clients[(host, port)]) for host, port in nodes]
+
+
+async def close_health_clients() -> None:
+    """Close every connection held for health checks"""
+    global _pg_pool, _mysql_pool, _mongo_client, _mongo_version, _rabbitmq_connection
+    if _pg_pool is not None:
+        pool, _pg_pool = _pg_pool, None
+        await pool.close()
+    if _mysql_pool is not None:
+        pool, _mysql_pool = _mysql_pool, None
+        pool.close()
+        await pool.wait_closed()
+    if _mongo_client is not None:
+        client, _mongo_client = _mongo_client, None
+        _mongo_version = None
+        client.close()
+    if _rabbitmq_connection is not None:
+        connection, _rabbitmq_connection = _rabbitmq_connection, None
+        await connection.close()
+    clients = list(_redis_clients.values())
+    _redis_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Release the health check connections when the application shuts down"""
+    yield
+    await cancel_health_refresh()
+    await close_health_clients()
+
+
+router = APIRouter(lifespan=lifespan)
+
+# One breaker per checked service, separate from the breakers guarding
+# application calls; the short reset timeout lets a recovered service show as
+# healthy again within seconds
+HEALTH_BREAKER_FAIL_MAX = 5
+HEALTH_BREAKER_RESET_TIMEOUT = 10
+health_breakers = {
+    name: create_breaker(
+        f"{name}_health",
+        fail_max=HEALTH_BREAKER_FAIL_MAX,
+        reset_timeout=HEALTH_BREAKER_RESET_TIMEOUT
+    )
+    for name in ("vault", "postgres", "mysql", "mongodb", "redis", "rabbitmq")
+}
 
 
+@with_health_breaker(health_breakers["vault"])
 async def check_vault() -> Dict[str, Any]:
     """Check Vault health"""
     try:
@@ -42,25 +211,15 @@ async def check_vault() -> Dict[str, Any]:
         return {"status": "unhealthy", "error": "Vault health check failed"}
 
 
+@with_health_breaker(health_breakers["postgres"])
 async def check_postgres() -> Dict[str, Any]:
     """Check PostgreSQL connectivity"""
     try:
-        # Fetch credentials from Vault
-        creds = await vault_client.get_secret("postgres")
-
-        # Connect and test
-        conn = await asyncpg.connect(
-            host=settings.POSTGRES_HOST,
-            port=settings.POSTGRES_PORT,
-            user=creds.get("user"),
-            password=creds.get("password"),
-            database=creds.get("database"),
-            timeout=5.0
-        )
+        pool = await get_postgres_pool()
 
-        # Simple query
-        version = await conn.fetchval("SELECT version()")
-        await conn.close()
+        # Simple query on a pooled connection
+        async with pool.acquire() as conn:
+            version = await conn.fetchval("SELECT version()")
 
         return {
             "status": "healthy",
@@ -71,27 +230,16 @@ async def check_postgres() -> Dict[str, Any]:
         return {"status": "unhealthy", "error": "PostgreSQL connection failed"}
 
 
+@with_health_breaker(health_breakers["mysql"])
 async def check_mysql() -> Dict[str, Any]:
     """Check MySQL connectivity """
     try:
-        # Fetch credentials from Vault
-        creds = await vault_client.get_secret("mysql")
-
-        # Connect and test
-        conn = await aiomysql.connect(
-            host=settings.MYSQL_HOST,
-            port=settings.MYSQL_PORT,
-            user=creds.get("user"),
-            password=creds.get("password"),
-            db=creds.get("database"),
-            connect_timeout=5
-        )
+        pool = await get_mysql_pool()
 
-        async with conn.cursor() as cursor:
-            await cursor.execute("SELECT VERSION()")
-            version = await cursor.fetchone()
-
-        conn.close()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT VERSION()")
+                version = await cursor.fetchone()
 
         return {
             "status": "healthy",
@@ -102,107 +250,158 @@ async def check_mysql() -> Dict[str, Any]:
         return {"status": "unhealthy", "error": "MySQL connection failed"}
 
 
+@with_health_breaker(health_breakers["mongodb"])
 async def check_mongodb() -> Dict[str, Any]:
     """Check MongoDB connectivity """
     try:
-        # Fetch credentials from Vault
-        creds = await vault_client.get_secret("mongodb")
-
-        # Build connection string with authSource
-        uri = f"mongodb://{creds.get('user')}:{creds.get('password')}@{settings.MONGODB_HOST}:{settings.MONGODB_PORT}/?authSource=admin"
-
-        # Connect and test
-        client = motor.motor_asyncio.AsyncIOMotorClient(
-            uri,
-            serverSelectionTimeoutMS=5000
-        )
+        client = await get_mongo_client()
 
         # Ping to verify connection
         await client.admin.command('ping')
 
-        # Get server info
-        server_info = await client.server_info()
-        client.close()
+        # Get server info only when the stored version is missing or old
+        global _mongo_version, _mongo_version_read_at
+        if _mongo_version is None or time.monotonic() - _mongo_version_read_at >= MONGO_VERSION_TTL:
+            server_info = await client.server_info()
+            _mongo_version = server_info.get("version", "unknown")
+            _mongo_version_read_at = time.monotonic()
 
         return {
             "status": "healthy",
-            "version": server_info.get("version", "unknown")
+            "version": _mongo_version
         }
     except Exception as e:
         logger.error(f"MongoDB health check failed: {e}")
         return {"status": "unhealthy", "error": "MongoDB connection failed"}
 
 
+# Deadline for a single Redis node's probe, below HEALTH_CHECK_TIMEOUT so one
+# stalled node is reported on its own instead of timing out the whole check
+REDIS_NODE_TIMEOUT = 3.0
+
+
+def parse_cluster_state(cluster_raw: Any) -> str:
+    """Extract cluster_state from a CLUSTER INFO reply"""
+    cluster_info_dict = {}
+    if isinstance(cluster_raw, str):
+        for line in cluster_raw.splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                cluster_info_dict[key.strip()] = value.strip()
+    return cluster_info_dict.get("cluster_state", "unknown")
+
+
+async def probe_redis_node(
+    host: str, port: int, client: redis.Redis, cluster_info: bool = True
+) -> Tuple[Dict[str, Any], bool, Optional[str]]:
+    """
+    Check a single Redis node.
+
+    Returns the node's entry for the health response, whether cluster mode
+    is enabled on it, and its cluster state (None if not available or
+    cluster_info is False).
+    """
+    try:
+        # PING, INFO and (if wanted) CLUSTER INFO go out in one round trip.
+        # Command errors come back as results, since CLUSTER INFO fails on a
+        # node without cluster mode and that must not fail the node.
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.ping()
+            pipe.info()
+            if cluster_info:
+                pipe.execute_command("CLUSTER", "INFO")
+            responses = await pipe.execute(raise_on_error=False)
+        ping_response, info = responses[0], responses[1]
+        for response in (ping_response, info):
+            if isinstance(response, Exception):
+                raise response
+
+        # Use cluster info if cluster is enabled
+        cluster_enabled = info.get("cluster_enabled", 0) == 1
+        cluster_state = None
+        if cluster_enabled and cluster_info:
+            cluster_raw = responses[2]
+            if isinstance(cluster_raw, Exception):
+                logger.error(f"Failed to get cluster info: {cluster_raw}")
+            else:
+                cluster_state = parse_cluster_state(cluster_raw)
+
+        node = {
+            "host": host,
+            "port": port,
+            "status": "healthy" if ping_response else "unhealthy",
+            "version": info.get("redis_version", "unknown"),
+            "role": info.get("role", "unknown"),
+            "connected_clients": info.get("connected_clients", 0),
+            "used_memory_human": info.get("used_memory_human", "unknown")
+        }
+        return node, cluster_enabled, cluster_state
+
+    except Exception as e:
+        node = {
+            "host": host,
+            "port": port,
+            "status": "unhealthy",
+            "error": "Node connection failed"
+        }
+        return node, False, None
+
+
+async def probe_redis_node_with_timeout(
+    host: str, port: int, client: redis.Redis, cluster_info: bool = True
+) -> Tuple[Dict[str, Any], bool, Optional[str]]:
+    """Run probe_redis_node, reporting the node unhealthy past REDIS_NODE_TIMEOUT"""
+    try:
+        return await asyncio.wait_for(
+            probe_redis_node(host, port, client, cluster_info), timeout=REDIS_NODE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"Redis node {host}:{port} did not answer within {REDIS_NODE_TIMEOUT}s")
+        node = {
+            "host": host,
+            "port": port,
+            "status": "unhealthy",
+            "error": "Node health check timed out"
+        }
+        return node, False, None
+
+
+@with_health_breaker(health_breakers["redis"])
 async def check_redis() -> Dict[str, Any]:
     """Check Redis cluster health """
     try:
-        # Fetch credentials from Vault
-        creds = await vault_client.get_secret("redis-1")
-        password = creds.get("password")
-
-        # Parse Redis nodes from settings
-        node_addresses = settings.REDIS_NODES.split(",")
-        nodes = []
-        cluster_state = "unknown"
-        cluster_enabled = False
-
-        # Check each Redis node
-        for node_addr in node_addresses:
-            try:
-                host, port = node_addr.strip().split(":")
-
-                # Connect to node
-                client = redis.Redis(
-                    host=host,
-                    port=int(port),
-                    password=password,
-                    decode_responses=True,
-                    socket_connect_timeout=5
-                )
-
-                # Test ping
-                ping_response = await client.ping()
-
-                # Get server info
-                info = await client.info()
-
-                # Get cluster info if cluster is enabled
-                if info.get("cluster_enabled", 0) == 1:
-                    cluster_enabled = True
-                    try:
-                        cluster_raw = await client.execute_command("CLUSTER", "INFO")
-                        cluster_info_dict = {}
-                        # Parse cluster info response
-                        if isinstance(cluster_raw, str):
-                            for line in cluster_raw.split("\n"):
-                                if ":" in line:
-                                    key, value = line.strip().split(":", 1)
-                                    cluster_info_dict[key] = value
-                        # Update cluster state from the first node that provides it
-                        if cluster_state == "unknown":
-                            cluster_state = cluster_info_dict.get("cluster_state", "unknown")
-                    except Exception as e:
-                        logger.error(f"Failed to get cluster info: {e}")
-
-                await client.close()
-
-                nodes.append({
-                    "host": host,
-                    "port": int(port),
-                    "status": "healthy" if ping_response else "unhealthy",
-                    "version": info.get("redis_version", "unknown"),
-                    "role": info.get("role", "unknown"),
-                    "connected_clients": info.get("connected_clients", 0),
-                    "used_memory_human": info.get("used_memory_human", "unknown")
-                })
-
-            except Exception as e:
-                nodes.append({
-                    "host": host,
-                    "port": int(port),
-                    "status": "unhealthy",
-                    "error": "Node connection failed"
-                })
+        node_clients = await get_redis_node_clients()
+
+        # Check every Redis node concurrently, each under its own deadline.
+        # The cluster state is shared by all nodes, so only the first node
+        # is asked for CLUSTER INFO.
+        probes = await asyncio.gather(
+            *(
+                probe_redis_node_with_timeout(host, port, client, cluster_info=(i == 0))
+                for i, (host, port, client) in enumerate(node_clients)
+            )
+        )
+        nodes = [node for node, _, _ in probes]
+
+        cluster_enabled = any(enabled for _, enabled, _ in probes)
+        cluster_state = probes[0][2] if probes else None
+        if cluster_state is None and cluster_enabled:
+            # The first node could not report; ask the next nodes (in
+            # configured order) that are up and in cluster mode
+            for (_, _, client), (node, enabled, _) in zip(node_clients[1:], probes[1:]):
+                if not enabled or node["status"] != "healthy":
+                    continue
+                try:
+                    cluster_raw = await asyncio.wait_for(
+                        client.execute_command("CLUSTER", "INFO"), timeout=REDIS_NODE_TIMEOUT
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to get cluster info: {e}")
+                    continue
+                cluster_state = parse_cluster_state(cluster_raw)
+                break
+        if cluster_state is None:
+            cluster_state = "unknown"
 
         # Overall health is healthy if all nodes are healthy
         all_healthy = all(node.get("status") == "healthy" for node in nodes)
@@ -219,23 +418,15 @@ async def check_redis() -> Dict[str, Any]:
         return {"status": "unhealthy", "error": "Redis cluster health check failed"}
 
 
+@with_health_breaker(health_breakers["rabbitmq"])
 async def check_rabbitmq() -> Dict[str, Any]:
     """Check RabbitMQ connectivity """
     try:
-        # Fetch credentials from Vault
-        creds = await vault_client.get_secret("rabbitmq")
-
-        # Get vhost (default to 'dev_vhost' if not in vault)
-        vhost = creds.get('vhost', 'dev_vhost')
-
-        # Build connection string with vhost
-        url = f"amqp://{creds.get('user')}:{creds.get('password')}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/{vhost}"
+        connection = await get_rabbitmq_connection()
 
-        # Connect
-        connection = await aio_pika.connect_robust(url, timeout=5.0)
-
-        # Connection successful - RabbitMQ is healthy
-        await connection.close()
+        # Opening a channel round-trips to the broker over the shared connection
+        async with connection.channel():
+            pass
 
         return {
             "status": "healthy"
@@ -245,58 +436,165 @@ async def check_rabbitmq() -> Dict[str, Any]:
         return {"status": "unhealthy", "error": "RabbitMQ connection failed"}
 
 
+async def run_check(name: str, check: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run one service check, bounded by HEALTH_CHECK_TIMEOUT"""
+    try:
+        return await asyncio.wait_for(check(), timeout=settings.HEALTH_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"{name} health check timed out after {settings.HEALTH_CHECK_TIMEOUT}s")
+        return {"status": "unhealthy", "error": f"{name} health check timed out"}
+    except Exception as e:
+        logger.error(f"{name} health check failed: {e}")
+        return {"status": "unhealthy", "error": f"{name} health check failed"}
+
+
+async def check_all() -> Dict[str, Dict[str, Any]]:
+    """
+    Check every service concurrently.
+
+    The checks talk to independent backends, so running them together makes
+    the total latency that of the slowest check rather than the sum.
+    """
+    checks = {
+        "vault": check_vault,
+        "postgres": check_postgres,
+        "mysql": check_mysql,
+        "mongodb": check_mongodb,
+        "redis": check_redis,
+        "rabbitmq": check_rabbitmq,
+    }
+    results = await asyncio.gather(*(run_check(name, check) for name, check in checks.items()))
+    return dict(zip(checks, results))
+
+
+# In-process results of check_all behind /health/all (stale-while-revalidate).
+# Results younger than HEALTH_ALL_FRESH_FOR are served as-is; up to
+# HEALTH_ALL_STALE_FOR they are served at once while one background refresh
+# runs; older (or missing) results are awaited. Concurrent callers share the
+# single refresh in flight, so a cache miss never fans out more than once.
+HEALTH_ALL_FRESH_FOR = 10
+HEALTH_ALL_STALE_FOR = 60
+_all_results: Optional[Dict[str, Dict[str, Any]]] = None
+_all_checked_at = 0.0
+_all_refresh: Optional[asyncio.Task] = None
+
+# The endpoint sits behind a response cache, so consecutive misses are at
+# least HEALTH_ALL_CACHE_TTL apart. Each miss therefore schedules a refresh
+# HEALTH_ALL_REFRESH_AHEAD seconds before the cached response expires; the
+# next miss then finds fresh results rather than ones a full cycle old.
+# HEALTH_ALL_REFRESH_AHEAD must stay below HEALTH_ALL_FRESH_FOR.
+HEALTH_ALL_CACHE_TTL = 30
+HEALTH_ALL_REFRESH_AHEAD = 5
+_all_refresh_timer: Optional[asyncio.TimerHandle] = None
+
+
+async def refresh_all() -> Dict[str, Dict[str, Any]]:
+    """Run check_all and store its results"""
+    global _all_results, _all_checked_at
+    results = await check_all()
+    _all_results, _all_checked_at = results, time.monotonic()
+    return results
+
+
+def start_refresh() -> asyncio.Task:
+    """Return the refresh in flight, starting one if there is none"""
+    global _all_refresh
+    if _all_refresh is None or _all_refresh.done():
+        _all_refresh = asyncio.create_task(refresh_all())
+    return _all_refresh
+
+
+def _refresh_ahead() -> None:
+    global _all_refresh_timer
+    _all_refresh_timer = None
+    start_refresh()
+
+
+def schedule_refresh() -> None:
+    """Schedule a refresh ahead of the cached response expiring, unless one is pending"""
+    global _all_refresh_timer
+    if _all_refresh_timer is None:
+        _all_refresh_timer = asyncio.get_running_loop().call_later(
+            HEALTH_ALL_CACHE_TTL - HEALTH_ALL_REFRESH_AHEAD, _refresh_ahead
+        )
+
+
+async def get_all_results() -> Dict[str, Dict[str, Any]]:
+    """Get check_all results, serving recent ones without waiting on a refresh"""
+    if _all_results is not None:
+        age = time.monotonic() - _all_checked_at
+        if age < HEALTH_ALL_STALE_FOR:
+            if age >= HEALTH_ALL_FRESH_FOR:
+                start_refresh()
+            return _all_results
+    # Shielded so a disconnecting caller does not cancel the shared refresh
+    return await asyncio.shield(start_refresh())
+
+
+async def cancel_health_refresh() -> None:
+    """Cancel a scheduled or running background refresh at shutdown"""
+    global _all_refresh, _all_refresh_timer
+    if _all_refresh_timer is not None:
+        _all_refresh_timer.cancel()
+        _all_refresh_timer = None
+    if _all_refresh is not None:
+        task, _all_refresh = _all_refresh, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
 @router.get("/vault")
 async def health_vault():
     """Check Vault health"""
-    return await check_vault()
+    return await run_check("vault", check_vault)
 
 
 @router.get("/postgres")
 async def health_postgres():
     """Check PostgreSQL health"""
-    return await check_postgres()
+    return await run_check("postgres", check_postgres)
 
 
 @router.get("/mysql")
 async def health_mysql():
     """Check MySQL health"""
-    return await check_mysql()
+    return await run_check("mysql", check_mysql)
 
 
 @router.get("/mongodb")
 async def health_mongodb():
     """Check MongoDB health"""
-    return await check_mongodb()
+    return await run_check("mongodb", check_mongodb)
 
 
 @router.get("/redis")
 async def health_redis():
     """Check Redis health"""
-    return await check_redis()
+    return await run_check("redis", check_redis)
 
 
 @router.get("/rabbitmq")
 async def health_rabbitmq():
     """Check RabbitMQ health"""
-    return await check_rabbitmq()
+    return await run_check("rabbitmq", check_rabbitmq)
 
 
 @router.get("/all")
-@cache(expire=30, key_builder=generate_cache_key)  # Cache for 30 seconds
+@cache(expire=HEALTH_ALL_CACHE_TTL, key_builder=generate_cache_key)  # Cache for 30 seconds
 async def health_all():
     """
     Check all services health
 
     Response is cached for 30 seconds to reduce load on infrastructure services.
+    Cache misses are served from recent in-process results (see
+    get_all_results), which are refreshed shortly before the cached response
+    expires, so misses rarely wait on the checks themselves.
     """
-    results = {
-        "vault": await check_vault(),
-        "postgres": await check_postgres(),
-        "mysql": await check_mysql(),
-        "mongodb": await check_mongodb(),
-        "redis": await check_redis(),
-        "rabbitmq": await check_rabbitmq(),
-    }
+    results = await get_all_results()
+    schedule_refresh()
 
     # Determine overall status
     all_healthy = all(
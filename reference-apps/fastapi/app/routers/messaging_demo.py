@@ -7,9 +7,16 @@ Demonstrates:
 - Basic messaging patterns
 """
 
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Annotated, Optional, Set
+
 from fastapi import APIRouter, HTTPException, Path, Query, Body
 import aio_pika
-import json
+from aio_pika.pool import Pool
+import orjson
 
 from app.config import settings
 from app.services.vault import vault_client
@@ -18,25 +25,97 @@ from app.models.responses import (
     QueueInfoResponse
 )
 
-router = APIRouter()
+# One long-lived connection (AMQP expects few connections carrying many
+# channels) and a pool of channels on it, created on first use so requests
+# skip the TCP/SASL/tune handshake
+CHANNEL_POOL_MAX_SIZE = 16
+_connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+_channel_pool: Optional[Pool] = None
+_connection_lock = asyncio.Lock()
+
+# Queues already declared on the shared connection; publishing to them skips
+# the queue.declare round trip. Cleared when the connection reconnects or
+# closes, and bounded since queue names come from requests. A queue deleted
+# out of band is caught at publish time: pooled channels raise on messages
+# the broker returns as unroutable, and the queue is then declared again.
+DECLARED_QUEUES_MAX_SIZE = 1024
+_declared_queues: Set[str] = set()
+
+
+def forget_declared_queues(*args) -> None:
+    """Forget declared queues so the next publish to each declares it again"""
+    _declared_queues.clear()
+
+
+async def declare_queue(channel: aio_pika.abc.AbstractChannel, queue_name: str) -> None:
+    """Declare a durable queue and remember it as declared"""
+    await channel.declare_queue(queue_name, durable=True)
+    if len(_declared_queues) >= DECLARED_QUEUES_MAX_SIZE:
+        _declared_queues.clear()
+    _declared_queues.add(queue_name)
+
+
+async def get_rabbitmq_connection() -> aio_pika.abc.AbstractRobustConnection:
+    """Get the shared RabbitMQ connection, connecting with Vault credentials on first use"""
+    global _connection
+    if _connection is None:
+        async with _connection_lock:
+            if _connection is None:
+                creds = await vault_client.get_secret("rabbitmq")
+                url = f"amqp://{creds.get('user')}:{creds.get('password')}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/"
+                _connection = await aio_pika.connect_robust(url, timeout=5.0)
+                _connection.reconnect_callbacks.add(forget_declared_queues)
+    return _connection
+
+
+async def get_channel_pool() -> Pool:
+    """Get the pool of channels on the shared connection"""
+    global _channel_pool
+    if _channel_pool is None:
+        connection = await get_rabbitmq_connection()
+        if _channel_pool is None:
+            _channel_pool = Pool(
+                partial(connection.channel, on_return_raises=True),
+                max_size=CHANNEL_POOL_MAX_SIZE,
+            )
+    return _channel_pool
+
+
+async def close_rabbitmq_connection() -> None:
+    """Close the channel pool and the shared connection"""
+    global _connection, _channel_pool
+    forget_declared_queues()
+    if _channel_pool is not None:
+        pool, _channel_pool = _channel_pool, None
+        await pool.close()
+    if _connection is not None:
+        connection, _connection = _connection, None
+        await connection.close()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Release the shared RabbitMQ connection when the application shuts down"""
+    yield
+    await close_rabbitmq_connection()
 
 
-async def get_rabbitmq_connection():
-    """Get RabbitMQ connection"""
-    creds = await vault_client.get_secret("rabbitmq")
-    url = f"amqp://{creds.get('user')}:{creds.get('password')}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/"
-    return await aio_pika.connect_robust(url, timeout=5.0)
+router = APIRouter(lifespan=lifespan)
+
+# Queue name constraints, shared by the query and path parameters below
+QUEUE_NAME_CONSTRAINTS = dict(
+    min_length=1,
+    max_length=100,
+    pattern=r'^[a-zA-Z0-9_.-]+$',
+    description="Queue name (alphanumeric and: - _ . only)"
+)
+QueueNameQuery = Annotated[str, Query(**QUEUE_NAME_CONSTRAINTS)]
+QueueNamePath = Annotated[str, Path(**QUEUE_NAME_CONSTRAINTS)]
 
 
 @router.post("/publish", response_model=MessagePublishResponse)
 async def publish_message(
-    queue_name: str = Query(
-        ...,
-        min_length=1,
-        max_length=100,
-        pattern=r'^[a-zA-Z0-9_.-]+$',
-        description="Queue name (alphanumeric and: - _ . only)"
-    ),
+    queue_name: QueueNameQuery,
     message: dict = Body(
         ...,
         description="Message payload (JSON object, max 1MB)"
@@ -44,30 +123,43 @@ async def publish_message(
 ) -> MessagePublishResponse:
     """Example: Publish a message to a queue"""
     try:
+        if not message:
+            raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+        # Serialize once: the encoded body is both size-checked and published.
+        # orjson rejects integers beyond 64 bits, which the stdlib encodes.
+        try:
+            body = orjson.dumps(message)
+        except orjson.JSONEncodeError:
+            body = json.dumps(message).encode()
+
         # Validate message size
-        message_size = len(json.dumps(message))
+        message_size = len(body)
         if message_size > 1_000_000:  # 1MB limit
             raise HTTPException(
                 status_code=413,
                 detail=f"Message size ({message_size} bytes) exceeds 1MB limit"
             )
 
-        if not message:
-            raise HTTPException(status_code=400, detail="Message cannot be empty")
-
-        connection = await get_rabbitmq_connection()
-        channel = await connection.channel()
-
-        # Declare queue
-        await channel.declare_queue(queue_name, durable=True)
-
-        # Publish message
-        await channel.default_exchange.publish(
-            aio_pika.Message(body=json.dumps(message).encode()),
-            routing_key=queue_name,
-        )
-
-        await connection.close()
+        channel_pool = await get_channel_pool()
+        async with channel_pool.acquire() as channel:
+            # Declare queue (once per connection)
+            if queue_name not in _declared_queues:
+                await declare_queue(channel, queue_name)
+
+            # Publish message
+            try:
+                await channel.default_exchange.publish(
+                    aio_pika.Message(body=body),
+                    routing_key=queue_name,
+                )
+            except aio_pika.exceptions.DeliveryError:
+                # Returned unroutable: the queue was deleted since it was declared
+                await declare_queue(channel, queue_name)
+                await channel.default_exchange.publish(
+                    aio_pika.Message(body=body),
+                    routing_key=queue_name,
+                )
 
         return MessagePublishResponse(
             queue=queue_name,
@@ -77,40 +169,35 @@ async def publish_message(
     except HTTPException:
         raise
     except Exception as e:
+        # The queue's state is unknown after a failure, so declare it next time
+        _declared_queues.discard(queue_name)
         raise HTTPException(status_code=500, detail=f"Message publish failed: {str(e)}")
 
 
 @router.get("/queue/{queue_name}/info", response_model=QueueInfoResponse)
 async def get_queue_info(
-    queue_name: str = Path(
-        ...,
-        min_length=1,
-        max_length=100,
-        pattern=r'^[a-zA-Z0-9_.-]+$',
-        description="Queue name (alphanumeric and: - _ . only)"
-    )
+    queue_name: QueueNamePath
 ) -> QueueInfoResponse:
     """Example: Get information about a queue"""
     try:
         connection = await get_rabbitmq_connection()
-        channel = await connection.channel()
 
-        # Declare queue (passive=True means don't create if doesn't exist)
-        try:
-            queue = await channel.declare_queue(queue_name, passive=True)
-            message_count = queue.declaration_result.message_count
-            consumer_count = queue.declaration_result.consumer_count
-        except Exception:
-            # Queue doesn't exist
-            await connection.close()
-            return QueueInfoResponse(
-                queue=queue_name,
-                exists=False,
-                message_count=None,
-                consumer_count=None
-            )
-
-        await connection.close()
+        # A passive declare of a missing queue makes the broker close the
+        # channel, so this uses its own channel rather than a pooled one
+        async with connection.channel() as channel:
+            # Declare queue (passive=True means don't create if doesn't exist)
+            try:
+                queue = await channel.declare_queue(queue_name, passive=True)
+                message_count = queue.declaration_result.message_count
+                consumer_count = queue.declaration_result.consumer_count
+            except Exception:
+                # Queue doesn't exist
+                return QueueInfoResponse(
+                    queue=queue_name,
+                    exists=False,
+                    message_count=None,
+                    consumer_count=None
+                )
 
         return QueueInfoResponse(
             queue=queue_name,
@@ -8,9 +8,11 @@ Provides detailed information about Redis cluster configuration:
 - Per-node detailed information
 """
 
+from typing import Any, Dict, Optional
 from fastapi import APIRouter
 import redis.asyncio as redis
 import logging
+import time
 
 from app.config import settings
 from app.services.vault import vault_client
@@ -18,6 +20,16 @@ from app.services.vault import vault_client
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# CLUSTER NODES role flags and the role reported for them
+NODE_ROLES = {"master": "master", "slave": "replica"}
+
+# Slot distribution served by /cluster/slots for up to this many seconds;
+# topology changes rarely, so repeated requests skip the Vault lookup,
+# connection and CLUSTER SLOTS round trip
+SLOTS_CACHE_TTL = 10
+_slots_response: Optional[Dict[str, Any]] = None
+_slots_read_at = 0.0
+
 
 @router.get("/cluster/nodes")
 async def get_cluster_nodes():
@@ -71,40 +83,43 @@ async def get_cluster_nodes():
             config_epoch = parts[6]
             link_state = parts[7]
 
-            # Parse slots (if any)
-            slots = []
+            # Parse slots (if any); only the ranges and their total size are
+            # needed, so individual slot numbers are never materialized
+            slots_count = 0
             slot_ranges = []
-            for i in range(8, len(parts)):
-                slot_info = parts[i]
-                if "-" in slot_info and not slot_info.startswith("["):
+            for slot_info in parts[8:]:
+                if "-" in slot_info and slot_info[0] != "[":
                     # Slot range like "0-5460"
-                    start, end = slot_info.split("-")
-                    slot_ranges.append({"start": int(start), "end": int(end)})
-                    slots.extend(range(int(start), int(end) + 1))
+                    start, end = slot_info.split("-", 1)
+                    start, end = int(start), int(end)
+                    slot_ranges.append({"start": start, "end": end})
+                    slots_count += end - start + 1
                 elif slot_info.isdigit():
                     # Single slot
-                    slots.append(int(slot_info))
-                    slot_ranges.append({"start": int(slot_info), "end": int(slot_info)})
+                    slot = int(slot_info)
+                    slot_ranges.append({"start": slot, "end": slot})
+                    slots_count += 1
 
             # Parse address
             host_port = address.split("@")[0]  # Remove cluster bus port
             host, port = host_port.rsplit(":", 1)
 
-            # Determine role
-            role = "master" if "master" in flags else "replica" if "slave" in flags else "unknown"
+            # Determine role from the first master/slave flag
+            flag_list = flags.split(",")
+            role = next((NODE_ROLES[flag] for flag in flag_list if flag in NODE_ROLES), "unknown")
 
             nodes.append({
                 "node_id": node_id,
                 "host": host,
                 "port": int(port),
                 "role": role,
-                "flags": flags.split(","),
+                "flags": flag_list,
                 "master_id": master_id,
                 "ping_sent": ping_sent,
                 "pong_recv": pong_recv,
                 "config_epoch": int(config_epoch),
                 "link_state": link_state,
-                "slots_count": len(slots),
+                "slots_count": slots_count,
                 "slot_ranges": slot_ranges
             })
 
@@ -128,7 +143,13 @@ async def get_cluster_slots():
     - Slot ranges assigned to each master
     - Total slots covered
     - Slot coverage percentage
+
+    Successful responses are reused for SLOTS_CACHE_TTL seconds.
     """
+    global _slots_response, _slots_read_at
+    if _slots_response is not None and time.monotonic() - _slots_read_at < SLOTS_CACHE_TTL:
+        return _slots_response
+
     try:
         # Fetch credentials from Vault
         creds = await vault_client.get_secret("redis-1")
@@ -139,7 +160,7 @@ async def get_cluster_slots():
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             password=password,
-            decode_responses=False,  # CLUSTER SLOTS returns binary data
+            decode_responses=True,  # Host and node ID fields decoded by the parser
             socket_connect_timeout=5
         )
 
@@ -156,23 +177,15 @@ async def get_cluster_slots():
             end_slot = slot_info[1]
             master_info = slot_info[2]
 
-            # Master node info
-            master_host = master_info[0].decode() if isinstance(master_info[0], bytes) else master_info[0]
-            master_port = master_info[1]
-            master_id = master_info[2].decode() if isinstance(master_info[2], bytes) else master_info[2]
-
             # Replica info (if any)
-            replicas = []
-            for i in range(3, len(slot_info)):
-                replica_info = slot_info[i]
-                replica_host = replica_info[0].decode() if isinstance(replica_info[0], bytes) else replica_info[0]
-                replica_port = replica_info[1]
-                replica_id = replica_info[2].decode() if isinstance(replica_info[2], bytes) else replica_info[2]
-                replicas.append({
-                    "host": replica_host,
-                    "port": replica_port,
-                    "node_id": replica_id
-                })
+            replicas = [
+                {
+                    "host": replica_info[0],
+                    "port": replica_info[1],
+                    "node_id": replica_info[2]
+                }
+                for replica_info in slot_info[3:]
+            ]
 
             slots_in_range = end_slot - start_slot + 1
             total_slots += slots_in_range
@@ -182,20 +195,22 @@ async def get_cluster_slots():
                 "end_slot": end_slot,
                 "slots_count": slots_in_range,
                 "master": {
-                    "host": master_host,
-                    "port": master_port,
-                    "node_id": master_id
+                    "host": master_info[0],
+                    "port": master_info[1],
+                    "node_id": master_info[2]
                 },
                 "replicas": replicas
             })
 
-        return {
+        _slots_response = {
             "status": "success",
             "total_slots": total_slots,
             "max_slots": 16384,
             "coverage_percentage": round((total_slots / 16384) * 100, 2),
             "slot_distribution": slot_distribution
         }
+        _slots_read_at = time.monotonic()
+        return _slots_response
 
     except Exception as e:
         logger.error(f"Failed to get cluster slots: {e}")
@@ -235,14 +250,13 @@ async def get_cluster_info():
 
         # Parse cluster info
         cluster_info = {}
-        for line in cluster_info_raw.split("\n"):
-            if ":" in line:
-                key, value = line.strip().split(":", 1)
-                # Try to convert to int if possible
-                try:
-                    cluster_info[key] = int(value)
-                except ValueError:
-                    cluster_info[key] = value
+        for line in cluster_info_raw.splitlines():
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            value = value.strip()
+            # Numeric fields become ints; others (e.g. cluster_state) stay strings
+            cluster_info[key.strip()] = int(value) if value.lstrip("-").isdecimal() else value
 
         return {
             "status": "success",
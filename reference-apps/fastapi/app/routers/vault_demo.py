@@ -8,6 +8,8 @@ Demonstrates how to:
 - Response caching for performance
 """
 
+from typing import Annotated
+
 from fastapi import APIRouter, Path
 from fastapi_cache.decorator import cache
 from app.services.vault import vault_client
@@ -16,18 +18,34 @@ from app.middleware.cache import generate_cache_key
 
 router = APIRouter()
 
+# Substrings marking a secret field as sensitive; matched against the
+# lowercased field name, which is computed once per field
+SENSITIVE_KEY_PARTS = ("password", "token", "secret", "key")
+MASK = "***"
+
+
+def is_sensitive_key(key_lower: str) -> bool:
+    """Whether a lowercased secret field name holds a sensitive value"""
+    return any(part in key_lower for part in SENSITIVE_KEY_PARTS)
+
+# Path parameters, declared once for both routes below
+ServiceName = Annotated[str, Path(
+    min_length=1,
+    max_length=50,
+    pattern=r'^[a-zA-Z0-9_-]+$',
+    description="Service name (alphanumeric, hyphens, underscores only)"
+)]
+SecretKeyName = Annotated[str, Path(
+    min_length=1,
+    max_length=100,
+    pattern=r'^[a-zA-Z0-9_-]+$',
+    description="Secret key name (alphanumeric, hyphens, underscores only)"
+)]
+
 
 @router.get("/secret/{service_name}", response_model=SecretResponse)
 @cache(expire=300, key_builder=generate_cache_key)  # Cache for 5 minutes
-async def get_secret_example(
-    service_name: str = Path(
-        ...,
-        min_length=1,
-        max_length=50,
-        pattern=r'^[a-zA-Z0-9_-]+$',
-        description="Service name (alphanumeric, hyphens, underscores only)"
-    )
-) -> SecretResponse:
+async def get_secret_example(service_name: ServiceName) -> SecretResponse:
     """
     Example: Fetch a secret from Vault
 
@@ -44,7 +62,7 @@ async def get_secret_example(
     # Don't return passwords in real applications!
     # This is just a demonstration
     safe_secret = {
-        k: "***" if "password" in k.lower() else v
+        k: MASK if is_sensitive_key(k.lower()) else v
         for k, v in secret.items()
     }
 
@@ -57,22 +75,7 @@ async def get_secret_example(
 
 @router.get("/secret/{service_name}/{key}", response_model=SecretKeyResponse)
 @cache(expire=300, key_builder=generate_cache_key)  # Cache for 5 minutes
-async def get_secret_key_example(
-    service_name: str = Path(
-        ...,
-        min_length=1,
-        max_length=50,
-        pattern=r'^[a-zA-Z0-9_-]+$',
-        description="Service name (alphanumeric, hyphens, underscores only)"
-    ),
-    key: str = Path(
-        ...,
-        min_length=1,
-        max_length=100,
-        pattern=r'^[a-zA-Z0-9_-]+$',
-        description="Secret key name (alphanumeric, hyphens, underscores only)"
-    )
-) -> SecretKeyResponse:
+async def get_secret_key_example(service_name: ServiceName, key: SecretKeyName) -> SecretKeyResponse:
     """
     Example: Fetch a specific key from a secret
 
@@ -83,13 +86,15 @@ async def get_secret_key_example(
         VaultUnavailableError: If Vault is unreachable or returns an error
         ResourceNotFoundError: If the secret or key doesn't exist
     """
+    key_lower = key.lower()
+
     # Let exceptions bubble up to global handlers
-    secret = await vault_client.get_secret(service_name.lower(), key=key.lower())
+    secret = await vault_client.get_secret(service_name.lower(), key=key_lower)
 
     # Mask sensitive data
-    value = secret.get(key.lower())
-    if value and ("password" in key.lower() or "token" in key.lower()):
-        value = "***"
+    value = secret.get(key_lower)
+    if value and is_sensitive_key(key_lower):
+        value = MASK
 
     return SecretKeyResponse(
         service=service_name,
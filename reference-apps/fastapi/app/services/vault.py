@@ -5,14 +5,22 @@ Demonstrates how to integrate with HashiCorp Vault to fetch credentials
 for other infrastructure services.
 
 Supports both AppRole authentication (recommended for production) and
-token-based authentication (fallback for development).
+token-based authentication (fallback for development). The AppRole login
+happens on first use and is repeated before the token's lease runs out.
+
+Fetched secrets are cached in-process for VAULT_SECRET_CACHE_TTL seconds,
+so repeated lookups (health checks, connection setup) skip the round trip.
+Requests that do reach Vault share one pooled HTTP client, so they reuse
+kept-alive connections instead of opening a new one each time.
 """
 
+import asyncio
 import httpx
 import logging
 import os
 import re
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urljoin
 
 from app.config import settings
@@ -20,6 +28,21 @@ from app.exceptions import VaultUnavailableError, ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on distinct secret paths held in the secret cache
+SECRET_CACHE_MAX_ENTRIES = 64
+
+# Characters allowed in a secret path: alphanumerics, hyphens, underscores, slashes
+SECRET_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9/_-]+$')
+
+# Log in again this many seconds before the AppRole token's lease expires
+TOKEN_RENEW_SLACK = 60
+
+# Seconds to wait before retrying a failed AppRole login
+TOKEN_RETRY_INTERVAL = 30
+
+# Connection pool of the shared HTTP client used for Vault API calls
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
 
 class VaultClient:
     """
@@ -32,25 +55,91 @@ class VaultClient:
 
     def __init__(self):
         self.vault_addr = settings.VAULT_ADDR
-        self.vault_token = None
 
-        # Try AppRole authentication first (recommended for production)
+        # The token from settings is used until an AppRole login succeeds
+        self._set_token(settings.VAULT_TOKEN)
+
+        # AppRole login is deferred to the first request (see _ensure_token),
+        # so creating the client never blocks on Vault. Monotonic time of the
+        # next login; None when there is nothing to log in with.
+        self._token_refresh_at: Optional[float] = None
+        self._auth_lock = asyncio.Lock()
         if settings.VAULT_APPROLE_DIR and os.path.exists(settings.VAULT_APPROLE_DIR):
-            try:
-                self.vault_token = self._login_with_approle()
-                logger.info("Successfully authenticated to Vault using AppRole")
-            except Exception as e:
-                # Fall back to token-based auth if AppRole fails
-                logger.warning(f"AppRole authentication failed: {e}, falling back to token-based auth")
-                self.vault_token = settings.VAULT_TOKEN
+            self._token_refresh_at = 0.0
         else:
-            # Use token-based authentication
             logger.info("Using token-based authentication (AppRole directory not found)")
-            self.vault_token = settings.VAULT_TOKEN
 
-        self.headers = {"X-Vault-Token": self.vault_token}
+        # Secret path -> (expiry on the monotonic clock, secret data), and the
+        # fetch in flight for each path so concurrent misses share one request
+        self._secret_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._secret_fetches: Dict[str, asyncio.Task] = {}
+
+        # Shared HTTP client, created on first use and released by aclose()
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=5.0, limits=HTTP_LIMITS)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections"""
+        if self._http_client is not None:
+            client, self._http_client = self._http_client, None
+            await client.aclose()
+
+    def _set_token(self, token: str) -> None:
+        """Use the given token for subsequent Vault requests"""
+        self.vault_token = token
+        self.headers = {"X-Vault-Token": token}
 
-    def _login_with_approle(self) -> str:
+    async def _ensure_token(self) -> None:
+        """
+        Log in with AppRole if no AppRole token is held or it is about to expire
+
+        Concurrent callers share one login. If the login fails, the current
+        token stays in use and the login is retried after TOKEN_RETRY_INTERVAL.
+        """
+        if self._token_refresh_at is None or time.monotonic() < self._token_refresh_at:
+            return
+
+        async with self._auth_lock:
+            # Another caller may have logged in while this one waited
+            if self._token_refresh_at is None or time.monotonic() < self._token_refresh_at:
+                return
+
+            try:
+                token, lease_duration = await self._login_with_approle()
+            except Exception as e:
+                logger.warning(f"AppRole authentication failed: {e}, keeping current token")
+                self._token_refresh_at = time.monotonic() + TOKEN_RETRY_INTERVAL
+                return
+
+            self._set_token(token)
+            logger.info("Successfully authenticated to Vault using AppRole")
+
+            if lease_duration > 0:
+                self._token_refresh_at = time.monotonic() + max(
+                    lease_duration - TOKEN_RENEW_SLACK, lease_duration / 2
+                )
+            else:
+                # Token does not expire
+                self._token_refresh_at = None
+
+    def clear_secret_cache(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached secrets so the next lookups go to Vault
+
+        Args:
+            path: Secret path to drop (e.g., "postgres"); all paths if omitted
+        """
+        if path is None:
+            self._secret_cache.clear()
+        else:
+            self._secret_cache.pop(path.strip("/"), None)
+
+    async def _login_with_approle(self) -> Tuple[str, int]:
         """
         Authenticate to Vault using AppRole method
 
@@ -58,7 +147,8 @@ class VaultClient:
         for a Vault client token.
 
         Returns:
-            Vault client token
+            Vault client token and its lease duration in seconds (0 if it
+            does not expire)
 
         Raises:
             VaultUnavailableError: If AppRole login fails
@@ -93,21 +183,21 @@ class VaultClient:
         }
 
         try:
-            with httpx.Client() as client:
-                response = client.post(url, json=payload, timeout=5.0)
-                response.raise_for_status()
-
-                data = response.json()
-                client_token = data.get("auth", {}).get("client_token")
-
-                if not client_token:
-                    raise VaultUnavailableError(
-                        message="No client token in AppRole login response",
-                        secret_path="approle",
-                        details={"response": data}
-                    )
+            response = await self._get_http_client().post(url, json=payload, timeout=5.0)
+            response.raise_for_status()
+
+            data = response.json()
+            auth = data.get("auth") or {}
+            client_token = auth.get("client_token")
+
+            if not client_token:
+                raise VaultUnavailableError(
+                    message="No client token in AppRole login response",
+                    secret_path="approle",
+                    details={"response": data}
+                )
 
-                return client_token
+            return client_token, auth.get("lease_duration") or 0
 
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during AppRole login: {e}")
@@ -141,7 +231,7 @@ class VaultClient:
         path = path.strip("/")
 
         # Only allow alphanumeric, hyphens, underscores, and forward slashes
-        if not re.match(r'^[a-zA-Z0-9/_-]+$', path):
+        if not SECRET_PATH_PATTERN.match(path):
             raise ValueError(f"Invalid secret path: {path}. Only alphanumeric characters, hyphens, underscores, and forward slashes are allowed.")
 
         # Prevent path traversal
@@ -154,6 +244,9 @@ class VaultClient:
         """
         Fetch a secret from Vault KV v2 secrets engine
 
+        Secrets are served from the in-process cache while fresh; concurrent
+        lookups of an uncached path share a single request to Vault.
+
         Args:
             path: Secret path (e.g., 'postgres', 'mysql')
             key: Optional specific key to extract
@@ -169,47 +262,76 @@ class VaultClient:
         # Validate path to prevent SSRF
         validated_path = self._validate_secret_path(path)
 
+        entry = self._secret_cache.get(validated_path)
+        if entry is not None and entry[0] > time.monotonic():
+            secret_data = entry[1]
+        else:
+            fetch = self._secret_fetches.get(validated_path)
+            if fetch is None:
+                fetch = asyncio.ensure_future(self._fetch_secret(validated_path, path, key))
+                self._secret_fetches[validated_path] = fetch
+                fetch.add_done_callback(lambda _: self._secret_fetches.pop(validated_path, None))
+            # Shielded so one caller being cancelled does not abort the
+            # fetch the other callers are waiting on
+            secret_data = await asyncio.shield(fetch)
+
+        if key:
+            # Check if the specific key exists
+            if key not in secret_data:
+                raise ResourceNotFoundError(
+                    resource_type="secret_key",
+                    resource_id=f"{path}/{key}",
+                    message=f"Key '{key}' not found in secret '{path}'",
+                    details={"secret_path": path, "key": key}
+                )
+            return {key: secret_data.get(key)}
+
+        # Copy so callers cannot modify the cached secret
+        return dict(secret_data)
+
+    async def _fetch_secret(self, validated_path: str, path: str, key: Optional[str]) -> Dict[str, Any]:
+        """Fetch a secret's data from Vault and store it in the secret cache"""
+        await self._ensure_token()
+
         # Construct URL safely
         url = urljoin(f"{self.vault_addr}/", f"v1/secret/data/{validated_path}")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=5.0)
-
-                # Handle 404 specifically
-                if response.status_code == 404:
-                    raise ResourceNotFoundError(
-                        resource_type="secret",
-                        resource_id=path,
-                        message=f"Secret '{path}' not found in Vault",
-                        details={"secret_path": path, "key": key}
-                    )
-
-                # Handle 403 (permission denied)
-                if response.status_code == 403:
-                    raise VaultUnavailableError(
-                        message="Permission denied accessing Vault secret",
-                        secret_path=path,
-                        details={"status_code": 403}
-                    )
-
-                response.raise_for_status()
-
-                data = response.json()
-                secret_data = data.get("data", {}).get("data", {})
-
-                if key:
-                    # Check if the specific key exists
-                    if key not in secret_data:
-                        raise ResourceNotFoundError(
-                            resource_type="secret_key",
-                            resource_id=f"{path}/{key}",
-                            message=f"Key '{key}' not found in secret '{path}'",
-                            details={"secret_path": path, "key": key}
-                        )
-                    return {key: secret_data.get(key)}
-
-                return secret_data
+            response = await self._get_http_client().get(url, headers=self.headers, timeout=5.0)
+
+            # Handle 404 specifically
+            if response.status_code == 404:
+                raise ResourceNotFoundError(
+                    resource_type="secret",
+                    resource_id=path,
+                    message=f"Secret '{path}' not found in Vault",
+                    details={"secret_path": path, "key": key}
+                )
+
+            # Handle 403 (permission denied)
+            if response.status_code == 403:
+                raise VaultUnavailableError(
+                    message="Permission denied accessing Vault secret",
+                    secret_path=path,
+                    details={"status_code": 403}
+                )
+
+            response.raise_for_status()
+
+            data = response.json()
+            secret_data = data.get("data", {}).get("data", {})
+
+            if settings.VAULT_SECRET_CACHE_TTL > 0:
+                if (validated_path not in self._secret_cache
+                        and len(self._secret_cache) >= SECRET_CACHE_MAX_ENTRIES):
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._secret_cache[next(iter(self._secret_cache))]
+                self._secret_cache[validated_path] = (
+                    time.monotonic() + settings.VAULT_SECRET_CACHE_TTL,
+                    secret_data
+                )
+
+            return secret_data
 
         except (ResourceNotFoundError, VaultUnavailableError):
             # Re-raise our custom exceptions
@@ -248,18 +370,17 @@ class VaultClient:
         url = f"{self.vault_addr}/v1/sys/health"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{url}?standbyok=true",
-                    timeout=5.0
-                )
+            response = await self._get_http_client().get(
+                f"{url}?standbyok=true",
+                timeout=5.0
+            )
 
-                return {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "initialized": response.status_code != 501,
-                    "sealed": response.status_code == 503,
-                    "standby": response.status_code == 429,
-                }
+            return {
+                "status": "healthy" if response.status_code == 200 else "unhealthy",
+                "initialized": response.status_code != 501,
+                "sealed": response.status_code == 503,
+                "standby": response.status_code == 429,
+            }
         except Exception as e:
             logger.error(f"Vault health check failed: {e}")
             return {
@@ -1,10 +1,30 @@
 """
 Secure logging utilities to prevent sensitive data exposure and log injection attacks.
+
+Also provides the orjson-backed JSON formatter used for structured request logs.
 """
 
+import copy
+import functools
+import logging
+import re
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty
 from typing import Any, Dict, Set
 from urllib.parse import urlparse, urlunparse
 
+import orjson
+
+# Pre-bound to skip the module attribute lookup on every log record
+orjson_dumps = orjson.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Attributes present on every LogRecord; anything else was passed via extra={...}
+_RESERVED_RECORD_ATTRS: Set[str] = set(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
 
 # Sensitive field names that should be redacted in logs
 SENSITIVE_KEYS: Set[str] = {
@@ -13,6 +33,11 @@ SENSITIVE_KEYS: Set[str] = {
     'pwd', 'authorization', 'x-vault-token'
 }
 
+# Matches a key containing any sensitive field name, in one pass over the key
+_SENSITIVE_KEY_PATTERN = re.compile(
+    '|'.join(sorted(map(re.escape, SENSITIVE_KEYS))), re.IGNORECASE
+)
+
 
 def redact_sensitive(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -33,10 +58,8 @@ def redact_sensitive(data: Dict[str, Any]) -> Dict[str, Any]:
 
     result = {}
     for key, value in data.items():
-        key_lower = key.lower()
-
         # Check if key contains any sensitive keyword
-        if any(sensitive in key_lower for sensitive in SENSITIVE_KEYS):
+        if _SENSITIVE_KEY_PATTERN.search(key):
             result[key] = '[REDACTED]'
         elif isinstance(value, dict):
             # Recursively redact nested dicts
@@ -78,12 +101,14 @@ def sanitize_log_string(value: str) -> str:
             .replace('\x00', '\\x00'))  # Null byte
 
 
+@functools.lru_cache(maxsize=256)
 def redact_url_password(url: str) -> str:
     """
     Redact password from URL for safe logging.
 
     Removes username and password from URLs while preserving the connection
-    information (scheme, host, port, path).
+    information (scheme, host, port, path). Connection URLs come from fixed
+    configuration, so results are memoized per URL.
 
     Args:
         url: URL that may contain credentials
@@ -128,3 +153,109 @@ def redact_url_password(url: str) -> str:
     except Exception:
         # If URL parsing fails, return a generic safe message
         return "[REDACTED_URL]"
+
+
+class OrjsonFormatter(logging.Formatter):
+    """
+    JSON log formatter that serializes records with orjson.
+
+    Emits one JSON object per record containing the raw ``record.created``
+    timestamp (no asctime formatting), logger name, level, message and any
+    fields passed through ``extra={...}``.
+
+    Example:
+        >>> handler.setFormatter(OrjsonFormatter())
+        >>> logger.info("HTTP request completed", extra={"status_code": 200})
+        {"ts":1730032496.789,"name":"app.main","levelname":"INFO","message":"HTTP request completed","status_code":200}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS:
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        # StreamHandler appends its own terminator, so no OPT_APPEND_NEWLINE here
+        return orjson_dumps(payload, default=str, option=_ORJSON_OPTIONS).decode()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that does not flush after every record.
+
+    Pair with a buffered stream and flush it periodically (see
+    ``BufferedQueueListener``) so many log lines are coalesced into a single
+    write syscall.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    QueueHandler that defers all formatting to the listener thread.
+
+    The stdlib ``prepare()`` formats the record on the caller's thread and
+    folds the traceback into ``msg``. This version only merges ``args`` into
+    the message and keeps ``exc_info``, so ``OrjsonFormatter`` can emit it as
+    a separate field from the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers on a timer from its own thread.
+
+    Handlers are flushed once ``flush_interval`` seconds have passed since
+    the last flush, or as soon as the queue goes idle for that long, so the
+    write syscalls for buffered output never run on the event loop.
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False,
+                 flush_interval: float = 0.1):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._next_flush = time.monotonic() + flush_interval
+
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval if block else None)
+            except Empty:
+                if not block:
+                    raise
+                self.flush()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if time.monotonic() >= self._next_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        self._next_flush = time.monotonic() + self.flush_interval
+        for handler in self.handlers:
+            handler.flush()
+
+    def stop(self) -> None:
+        super().stop()
+        self.flush()
@@ -0,0 +1,20 @@
+"""
+JSON response class backed by orjson.
+
+FastAPI's own ORJSONResponse is deprecated in the pinned release, so the app
+ships a minimal equivalent for handlers that return plain dicts.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson instead of json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
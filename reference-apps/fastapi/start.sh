@@ -149,6 +149,9 @@ check_tls_certs() {
 # Notes:
 #   - Binds to 0.0.0.0 for all network interfaces
 #   - Uses --reload for development (auto-restart on code changes)
+#   - Pins the uvloop event loop and httptools parser (both installed by
+#     uvicorn[standard]) so a missing one fails at startup instead of
+#     silently falling back to the slower asyncio/h11 implementations
 #   - Runs in background (&) to allow HTTPS server startup
 #   - PID stored in HTTP_PID for shutdown coordination
 #######################################
@@ -157,6 +160,8 @@ start_http() {
     uvicorn app.main:app \
         --host 0.0.0.0 \
         --port "$HTTP_PORT" \
+        --loop uvloop \
+        --http httptools \
         --reload &
     HTTP_PID=$!
     success "HTTP server started (PID: $HTTP_PID)"
@@ -181,6 +186,7 @@ start_http() {
 # Notes:
 #   - Binds to 0.0.0.0 for all network interfaces
 #   - Uses --reload for development (auto-restart on code changes)
+#   - Pins uvloop and httptools, as start_http does
 #   - Runs in background (&) for parallel operation with HTTP server
 #   - PID stored in HTTPS_PID for shutdown coordination
 #   - Certificate files must exist and be readable by process
@@ -190,6 +196,8 @@ start_https() {
     uvicorn app.main:app \
         --host 0.0.0.0 \
         --port "$HTTPS_PORT" \
+        --loop uvloop \
+        --http httptools \
         --ssl-keyfile "$KEY_FILE" \
         --ssl-certfile "$CERT_FILE" \
         --reload &
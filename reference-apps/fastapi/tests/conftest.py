@@ -65,6 +65,7 @@ def mock_redis():
     mock_redis.get = AsyncMock(return_value=None)
     mock_redis.set = AsyncMock(return_value=True)
     mock_redis.delete = AsyncMock(return_value=1)
+    mock_redis.unlink = AsyncMock(return_value=1)
 
     # scan_iter is a regular function that returns an async generator
     # Tests will override scan_iter.return_value with their own async generator
@@ -73,6 +74,10 @@ def mock_redis():
         yield  # Make it an empty generator
 
     mock_redis.scan_iter = MagicMock(return_value=default_scan_iter())
+
+    # register_script is synchronous and returns an awaitable Script object;
+    # the invalidation script returns [next_cursor, removed]
+    mock_redis.register_script = MagicMock(return_value=AsyncMock(return_value=[b"0", 0]))
     mock_redis.close = AsyncMock()
     return mock_redis
 
@@ -115,6 +120,26 @@ def reset_prometheus_metrics():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_health_state():
+    """
+    Close the health check circuit breakers and drop stored /health/all
+    results after each test, so one test's checks cannot affect the next
+    """
+    yield
+    from app.middleware.circuit_breaker import STATE_CLOSED
+    from app.routers import health
+    for breaker in health.health_breakers.values():
+        breaker.state = STATE_CLOSED
+        breaker.failures = 0
+    health._all_results = None
+    health._all_checked_at = 0.0
+    health._all_refresh = None
+    if health._all_refresh_timer is not None:
+        health._all_refresh_timer.cancel()
+        health._all_refresh_timer = None
+
+
 @pytest.fixture
 def mock_httpx_client():
     """
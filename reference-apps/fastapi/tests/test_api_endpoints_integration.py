@@ -36,6 +36,16 @@ class TestRootEndpoint:
             assert response.status_code == 200
             assert "application/json" in response.headers["content-type"]
 
+    def test_root_endpoint_serves_preserialized_document(self):
+        """Test root endpoint body matches the pre-serialized ROOT_INFO document."""
+        from app.main import ROOT_INFO, ROOT_RESPONSE_BODY
+
+        with TestClient(app) as client:
+            response = client.get("/")
+
+            assert response.content == ROOT_RESPONSE_BODY
+            assert response.json() == ROOT_INFO
+
 
 @pytest.mark.integration
 class TestOpenAPIEndpoints:
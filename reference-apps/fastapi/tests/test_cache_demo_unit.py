@@ -11,6 +11,21 @@ from fastapi import HTTPException
 from app.routers.cache_demo import get_cache_value, set_cache_value, delete_cache_value
 
 
+def make_pipeline_client(results=None, error=None):
+    """Build a mock Redis client whose pipeline returns results from execute()"""
+    pipe = MagicMock()
+    pipe.get.return_value = pipe
+    pipe.ttl.return_value = pipe
+    pipe.execute = AsyncMock(return_value=results, side_effect=error)
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+
+    mock_client = AsyncMock()
+    mock_client.pipeline = MagicMock(return_value=pipe)
+    mock_client.close = AsyncMock()
+    return mock_client, pipe
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 class TestCacheDemoGetValue:
@@ -19,10 +34,7 @@ class TestCacheDemoGetValue:
     async def test_get_existing_value(self):
         """Test getting an existing cache value"""
         with patch('app.routers.cache_demo.get_redis_client') as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = "cached_value"
-            mock_client.ttl.return_value = 300
-            mock_client.close = AsyncMock()
+            mock_client, pipe = make_pipeline_client(["cached_value", 300])
             mock_get_client.return_value = mock_client
 
             result = await get_cache_value(key="test:key")
@@ -31,15 +43,26 @@ class TestCacheDemoGetValue:
             assert result.value == "cached_value"
             assert result.exists is True
             assert result.ttl == 300
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
+
+    async def test_get_uses_single_round_trip(self):
+        """Test that GET and TTL are pipelined without a transaction"""
+        with patch('app.routers.cache_demo.get_redis_client') as mock_get_client:
+            mock_client, pipe = make_pipeline_client(["cached_value", 300])
+            mock_get_client.return_value = mock_client
+
+            await get_cache_value(key="test:key")
+
+            mock_client.pipeline.assert_called_once_with(transaction=False)
+            pipe.get.assert_called_once_with("test:key")
+            pipe.ttl.assert_called_once_with("test:key")
+            pipe.execute.assert_awaited_once()
+            mock_client.get.assert_not_called()
 
     async def test_get_nonexistent_value(self):
         """Test getting a non-existent cache value"""
         with patch('app.routers.cache_demo.get_redis_client') as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = None
-            mock_client.ttl.return_value = -2
-            mock_client.close = AsyncMock()
+            mock_client, pipe = make_pipeline_client([None, -2])
             mock_get_client.return_value = mock_client
 
             result = await get_cache_value(key="missing:key")
@@ -52,10 +75,7 @@ class TestCacheDemoGetValue:
     async def test_get_value_with_no_expiration(self):
         """Test getting a value with no TTL"""
         with patch('app.routers.cache_demo.get_redis_client') as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = "persistent_value"
-            mock_client.ttl.return_value = -1  # No expiration
-            mock_client.close = AsyncMock()
+            mock_client, pipe = make_pipeline_client(["persistent_value", -1])  # No expiration
             mock_get_client.return_value = mock_client
 
             result = await get_cache_value(key="persistent:key")
@@ -66,8 +86,7 @@ class TestCacheDemoGetValue:
     async def test_get_value_redis_error(self):
         """Test getting value when Redis fails"""
         with patch('app.routers.cache_demo.get_redis_client') as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = Exception("Redis connection failed")
+            mock_client, pipe = make_pipeline_client(error=Exception("Redis connection failed"))
             mock_get_client.return_value = mock_client
 
             with pytest.raises(HTTPException) as exc_info:
@@ -97,7 +116,7 @@ class TestCacheDemoSetValue:
             assert result.ttl is None
             assert result.action == "set"
             mock_client.set.assert_called_once_with("test:key", "test_value")
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
 
     async def test_set_value_with_ttl(self):
         """Test setting a cache value with TTL"""
@@ -114,7 +133,7 @@ class TestCacheDemoSetValue:
             assert result.ttl == 60
             assert result.action == "set"
             mock_client.setex.assert_called_once_with("temp:key", 60, "temp_value")
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
 
     async def test_set_value_redis_error(self):
         """Test setting value when Redis fails"""
@@ -149,7 +168,7 @@ class TestCacheDemoDeleteValue:
             assert result.deleted is True
             assert result.action == "delete"
             mock_client.delete.assert_called_once_with("test:key")
-            mock_client.close.assert_called_once()
+            mock_client.close.assert_not_called()
 
     async def test_delete_nonexistent_key(self):
         """Test deleting a non-existent cache key"""
@@ -188,7 +207,8 @@ class TestGetRedisClient:
         """Test getting Redis client with Vault credentials"""
         from app.routers.cache_demo import get_redis_client
 
-        with patch('app.routers.cache_demo.vault_client.get_secret') as mock_vault:
+        with patch('app.routers.cache_demo._redis_client', None), \
+                patch('app.routers.cache_demo.vault_client.get_secret') as mock_vault:
             with patch('app.routers.cache_demo.redis.Redis') as mock_redis_class:
                 mock_vault.return_value = {"password": "test_password"}
 
@@ -200,3 +220,32 @@ class TestGetRedisClient:
                 assert result == mock_client
                 mock_vault.assert_called_once_with("redis-1")
                 mock_redis_class.assert_called_once()
+
+    async def test_get_redis_client_reused(self):
+        """Test that the client and its pool are created once and shared"""
+        from app.routers.cache_demo import get_redis_client
+
+        with patch('app.routers.cache_demo._redis_client', None), \
+                patch('app.routers.cache_demo.vault_client.get_secret') as mock_vault:
+            with patch('app.routers.cache_demo.redis.Redis') as mock_redis_class:
+                mock_vault.return_value = {"password": "test_password"}
+
+                first = await get_redis_client()
+                second = await get_redis_client()
+
+                assert first is second
+                mock_vault.assert_called_once_with("redis-1")
+                mock_redis_class.assert_called_once()
+
+    async def test_close_redis_client(self):
+        """Test that closing releases the shared client so the next call reconnects"""
+        from app.routers import cache_demo
+
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+
+        with patch('app.routers.cache_demo._redis_client', mock_client):
+            await cache_demo.close_redis_client()
+
+            assert cache_demo._redis_client is None
+            mock_client.aclose.assert_awaited_once()
@@ -4,13 +4,17 @@ Unit and integration tests for response caching
 Tests the caching middleware, cache key generation, and cache operations.
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from redis.exceptions import RedisError
 
 from app.main import app
 from app.middleware.cache import (
     generate_cache_key,
     CacheManager,
+    INVALIDATE_PATTERN_LUA,
+    INVALIDATE_SCAN_COUNT,
     invalidate_cache_pattern,
     invalidate_cache_key
 )
@@ -83,7 +87,7 @@ class TestCacheKeyGeneration:
         key = generate_cache_key(mock_func, request=mock_request)
 
         # Long keys should be hashed, resulting in func_name + hash (max ~100 chars)
-        assert len(key) <= 150  # func name + colon + md5 hash
+        assert len(key) <= 150  # func name + colon + xxh3-128 hash
 
     def test_generate_cache_key_consistency(self):
         """Test that same inputs generate same key"""
@@ -109,7 +113,7 @@ class TestCacheManager:
     @pytest.mark.asyncio
     async def test_cache_manager_init(self, mock_redis):
         """Test cache manager initialization"""
-        with patch('app.middleware.cache.aioredis.from_url', return_value=mock_redis):
+        with patch('app.middleware.cache.aioredis.Redis.from_pool', return_value=mock_redis):
             with patch('app.middleware.cache.FastAPICache.init') as mock_init:
                 manager = CacheManager()
                 await manager.init("redis://localhost:6379", prefix="test:")
@@ -118,16 +122,51 @@ class TestCacheManager:
                 assert manager.redis_client == mock_redis
                 mock_init.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cache_manager_init_uses_blocking_pool(self):
+        """Test the client is backed by a bounded pool that waits instead of failing"""
+        from redis.asyncio import BlockingConnectionPool
+
+        with patch('app.middleware.cache.aioredis.Redis.ping', new=AsyncMock(return_value=True)):
+            with patch('app.middleware.cache.FastAPICache.init'):
+                manager = CacheManager()
+                await manager.init("redis://localhost:6379", max_connections=8, pool_timeout=2.5)
+
+        pool = manager.redis_client.connection_pool
+        try:
+            assert manager.enabled is True
+            assert isinstance(pool, BlockingConnectionPool)
+            assert pool.max_connections == 8
+            assert pool.timeout == 2.5
+            assert pool.connection_kwargs["socket_keepalive"] is True
+        finally:
+            await manager.close()
+
     @pytest.mark.asyncio
     async def test_cache_manager_init_failure(self):
         """Test cache manager handles initialization failure gracefully"""
-        with patch('app.middleware.cache.aioredis.from_url', side_effect=Exception("Connection failed")):
+        with patch('app.middleware.cache.aioredis.BlockingConnectionPool.from_url', side_effect=Exception("Connection failed")):
             manager = CacheManager()
             await manager.init("redis://localhost:6379")
 
             assert manager.enabled is False
             assert manager.redis_client is None
 
+    @pytest.mark.asyncio
+    async def test_startup_cache_init_is_bounded(self):
+        """Test that a slow Vault cannot hold up startup past CACHE_INIT_TIMEOUT"""
+        from app import main
+
+        async def slow_get_secret(path):
+            await asyncio.sleep(10)
+
+        with patch.object(main.vault_client, 'get_secret', side_effect=slow_get_secret), \
+                patch.object(main.cache_manager, 'init', new=AsyncMock()) as mock_init, \
+                patch('app.main.settings', MagicMock(CACHE_INIT_TIMEOUT=0.01)):
+            await asyncio.wait_for(main.init_cache(), timeout=1)
+
+        mock_init.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_cache_manager_close(self, mock_redis):
         """Test cache manager close"""
@@ -139,18 +178,20 @@ class TestCacheManager:
         mock_redis.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_cache_manager_clear_all(self, mock_redis, mock_async_iterator):
+    async def test_cache_manager_clear_all(self, mock_redis):
         """Test clearing all cache entries"""
         manager = CacheManager()
         manager.redis_client = mock_redis
         manager.enabled = True
 
-        # Mock scan_iter to return some keys
-        mock_redis.scan_iter.return_value = mock_async_iterator(["cache:key1", "cache:key2"])
+        # Invalidation script reports two removed keys
+        mock_redis.register_script.return_value = AsyncMock(return_value=[b"0", 2])
 
         await manager.clear_all()
 
-        mock_redis.scan_iter.assert_called_once()
+        mock_redis.register_script.return_value.assert_awaited_once_with(
+            args=[0, "cache:*", INVALIDATE_SCAN_COUNT]
+        )
 
 
 @pytest.mark.asyncio
@@ -160,48 +201,74 @@ class TestCacheInvalidation:
     """Test cache invalidation functions"""
 
     async def test_invalidate_cache_pattern(self, mock_redis):
-        """Test invalidating cache by pattern"""
-        # Create async generator for scan_iter
-        async def mock_scan():
-            for key in ["cache:test:1", "cache:test:2"]:
-                yield key
-
-        mock_redis.scan_iter.return_value = mock_scan()
-        mock_redis.delete.return_value = 2
+        """Test invalidating cache by pattern runs the server-side script"""
+        script = AsyncMock(return_value=[b"0", 2])
+        mock_redis.register_script.return_value = script
 
         await invalidate_cache_pattern("cache:test:*", mock_redis)
 
-        mock_redis.scan_iter.assert_called_once_with(match="cache:test:*")
-        mock_redis.delete.assert_called_once()
+        mock_redis.register_script.assert_called_once_with(INVALIDATE_PATTERN_LUA)
+        script.assert_awaited_once_with(args=[0, "cache:test:*", INVALIDATE_SCAN_COUNT])
+        mock_redis.scan_iter.assert_not_called()
+        mock_redis.delete.assert_not_called()
+
+    async def test_invalidate_cache_pattern_follows_cursor(self, mock_redis):
+        """Test that each EVAL handles one SCAN batch and the cursor is looped client-side"""
+        from app.middleware.cache import cache_invalidations
+
+        script = AsyncMock(side_effect=[[b"17", 1], [b"42", 0], [b"0", 2]])
+        mock_redis.register_script.return_value = script
+        initial_count = cache_invalidations.labels(pattern="cache:batched:*")._value.get()
+
+        await invalidate_cache_pattern("cache:batched:*", mock_redis)
+
+        assert [c.kwargs["args"][0] for c in script.await_args_list] == [0, b"17", b"42"]
+        final_count = cache_invalidations.labels(pattern="cache:batched:*")._value.get()
+        assert final_count == initial_count + 3
+
+    async def test_invalidate_script_registered_once(self, mock_redis):
+        """Test that the script is registered once per client and reused"""
+        await invalidate_cache_pattern("cache:a:*", mock_redis)
+        await invalidate_cache_pattern("cache:b:*", mock_redis)
+
+        mock_redis.register_script.assert_called_once_with(INVALIDATE_PATTERN_LUA)
+        assert mock_redis.register_script.return_value.await_count == 2
 
     async def test_invalidate_cache_pattern_no_matches(self, mock_redis):
         """Test invalidating pattern with no matches"""
-        # Empty async iterator
-        async def mock_scan():
-            return
-            yield  # Make it a generator
+        from app.middleware.cache import cache_invalidations
 
-        mock_redis.scan_iter.return_value = mock_scan()
+        mock_redis.register_script.return_value = AsyncMock(return_value=[b"0", 0])
+        initial_count = cache_invalidations.labels(pattern="cache:nomatch:*")._value.get()
 
         await invalidate_cache_pattern("cache:nomatch:*", mock_redis)
 
-        mock_redis.delete.assert_not_called()
+        final_count = cache_invalidations.labels(pattern="cache:nomatch:*")._value.get()
+        assert final_count == initial_count
+
+    async def test_invalidate_cache_pattern_script_error(self, mock_redis):
+        """Test script failures are logged and swallowed"""
+        mock_redis.register_script.return_value = AsyncMock(side_effect=RedisError("connection lost"))
+
+        # Should not raise
+        await invalidate_cache_pattern("cache:test:*", mock_redis)
 
     async def test_invalidate_cache_key(self, mock_redis):
         """Test invalidating specific cache key"""
-        mock_redis.delete.return_value = 1
+        mock_redis.unlink.return_value = 1
 
         await invalidate_cache_key("cache:test:key", mock_redis)
 
-        mock_redis.delete.assert_called_once_with("cache:test:key")
+        mock_redis.unlink.assert_called_once_with("cache:test:key")
+        mock_redis.delete.assert_not_called()
 
     async def test_invalidate_cache_key_not_found(self, mock_redis):
         """Test invalidating non-existent key"""
-        mock_redis.delete.return_value = 0
+        mock_redis.unlink.return_value = 0
 
         await invalidate_cache_key("cache:nonexistent", mock_redis)
 
-        mock_redis.delete.assert_called_once()
+        mock_redis.unlink.assert_called_once()
 
 
 @pytest.mark.integration
@@ -350,13 +417,8 @@ class TestCacheMetrics:
 
         initial_count = cache_invalidations.labels(pattern="test:*")._value.get()
 
-        # Mock some keys to delete
-        async def mock_scan():
-            for key in ["test:1", "test:2"]:
-                yield key
-
-        mock_redis.scan_iter.return_value = mock_scan()
-        mock_redis.delete.return_value = 2
+        # Invalidation script reports two removed keys
+        mock_redis.register_script.return_value = AsyncMock(return_value=[b"0", 2])
 
         await invalidate_cache_pattern("test:*", mock_redis)
 
@@ -1,14 +1,21 @@
 """
 Unit tests for circuit breaker middleware
 
-Tests the circuit breaker functionality using pybreaker library.
+Tests the asyncio circuit breaker state machine, its listeners and the
+with_circuit_breaker decorator.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock
-import pybreaker
+from unittest.mock import MagicMock, patch
 
 from app.middleware.circuit_breaker import (
+    AsyncBreaker,
+    CircuitBreakerError,
+    ServiceUnavailableError,
+    with_circuit_breaker,
+    with_health_breaker,
     on_circuit_open,
     on_circuit_half_open,
     on_circuit_close,
@@ -95,69 +102,263 @@ class TestCircuitBreakerMetrics:
         circuit_breaker_failures.labels(service="rabbitmq")
 
 
+async def failing_function():
+    raise Exception("Service unavailable")
+
+
+async def successful_function():
+    return "success"
+
+
 @pytest.mark.unit
+@pytest.mark.asyncio
 class TestCircuitBreakerBehavior:
-    """Test circuit breaker behavior using pybreaker"""
+    """Test AsyncBreaker state transitions"""
 
-    def test_circuit_breaker_creation(self):
+    async def test_circuit_breaker_creation(self):
         """Test creating a circuit breaker"""
-        cb = pybreaker.CircuitBreaker(
-            fail_max=3,
-            reset_timeout=10
-        )
+        cb = AsyncBreaker("test", fail_max=3, reset_timeout=10)
 
         assert cb.fail_max == 3
         assert cb.reset_timeout == 10
         assert cb.current_state == "closed"
 
-    def test_circuit_breaker_opens_after_failures(self):
+    async def test_circuit_breaker_opens_after_failures(self):
         """Test circuit breaker opens after threshold"""
-        cb = pybreaker.CircuitBreaker(fail_max=2, reset_timeout=60)
-
-        def failing_function():
-            raise Exception("Service unavailable")
+        cb = AsyncBreaker("test", fail_max=2, reset_timeout=60)
 
         # First failure
         with pytest.raises(Exception):
-            cb.call(failing_function)
+            await cb.call(failing_function)
 
         assert cb.current_state == "closed"
 
         # Second failure - should open circuit
         with pytest.raises(Exception):
-            cb.call(failing_function)
+            await cb.call(failing_function)
 
         assert cb.current_state == "open"
 
-    def test_circuit_breaker_prevents_calls_when_open(self):
+    async def test_circuit_breaker_prevents_calls_when_open(self):
         """Test that open circuit breaker prevents calls"""
-        cb = pybreaker.CircuitBreaker(fail_max=1, reset_timeout=60)
-
-        def failing_function():
-            raise Exception("Service unavailable")
+        cb = AsyncBreaker("test", fail_max=1, reset_timeout=60)
+        func = MagicMock(side_effect=successful_function)
 
         # Trigger circuit to open
         with pytest.raises(Exception):
-            cb.call(failing_function)
+            await cb.call(failing_function)
 
         assert cb.current_state == "open"
 
-        # Next call should fail fast with CircuitBreakerError
-        with pytest.raises(pybreaker.CircuitBreakerError):
-            cb.call(failing_function)
+        # Next call should fail fast without invoking the function
+        with pytest.raises(CircuitBreakerError):
+            await cb.call(func)
+        func.assert_not_called()
 
-    def test_circuit_breaker_allows_success(self):
+    async def test_circuit_breaker_allows_success(self):
         """Test circuit breaker allows successful calls"""
-        cb = pybreaker.CircuitBreaker(fail_max=3, reset_timeout=10)
+        cb = AsyncBreaker("test", fail_max=3, reset_timeout=10)
 
-        def successful_function():
-            return "success"
-
-        result = cb.call(successful_function)
+        result = await cb.call(successful_function)
 
         assert result == "success"
         assert cb.current_state == "closed"
 
+    async def test_success_resets_failure_count(self):
+        """Test that only consecutive failures open the circuit"""
+        cb = AsyncBreaker("test", fail_max=2, reset_timeout=60)
+
+        with pytest.raises(Exception):
+            await cb.call(failing_function)
+        await cb.call(successful_function)
+        with pytest.raises(Exception):
+            await cb.call(failing_function)
+
+        assert cb.failures == 1
+        assert cb.current_state == "closed"
+
+    async def test_half_open_success_closes_circuit(self):
+        """Test that a successful trial call after reset_timeout closes the circuit"""
+        on_half_open, on_close = MagicMock(), MagicMock()
+        cb = AsyncBreaker("test", fail_max=1, reset_timeout=0, on_half_open=on_half_open, on_close=on_close)
+
+        with pytest.raises(Exception):
+            await cb.call(failing_function)
+
+        assert await cb.call(successful_function) == "success"
+        assert cb.current_state == "closed"
+        on_half_open.assert_called_once_with(cb)
+        on_close.assert_called_once_with(cb)
+
+    async def test_half_open_failure_reopens_circuit(self):
+        """Test that a failed trial call re-opens the circuit"""
+        on_open = MagicMock()
+        cb = AsyncBreaker("test", fail_max=3, reset_timeout=0, on_open=on_open)
+        cb.state = "open"
+
+        with pytest.raises(Exception):
+            await cb.call(failing_function)
+
+        assert cb.current_state == "open"
+        on_open.assert_called_once_with(cb)
+
+    async def test_in_flight_failure_does_not_reopen_circuit(self):
+        """Test a call started before the circuit opened does not reopen it when it fails"""
+        import asyncio
+
+        on_open = MagicMock()
+        cb = AsyncBreaker("test", fail_max=1, reset_timeout=60, on_open=on_open)
+        release = asyncio.Event()
+
+        async def slow_failure():
+            await release.wait()
+            raise Exception("Test failure")
+
+        in_flight = asyncio.ensure_future(cb.call(slow_failure))
+        await asyncio.sleep(0)
+        with pytest.raises(Exception):
+            await cb.call(failing_function)
+        opened_at = cb.opened_at
+
+        release.set()
+        with pytest.raises(Exception):
+            await in_flight
+
+        assert cb.current_state == "open"
+        assert cb.opened_at == opened_at
+        on_open.assert_called_once_with(cb)
+
+    async def test_failure_listener_called(self):
+        """Test that the failure callback runs on every failure"""
+        on_failure = MagicMock()
+        cb = AsyncBreaker("test", fail_max=5, on_failure=on_failure)
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await cb.call(failing_function)
+
+        assert on_failure.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWithCircuitBreaker:
+    """Test the with_circuit_breaker decorator"""
+
+    async def test_decorator_passes_through_result(self):
+        """Test decorated coroutine results and arguments pass through"""
+        cb = AsyncBreaker("test")
+
+        @with_circuit_breaker(cb)
+        async def add(a, b=0):
+            return a + b
+
+        assert await add(1, b=2) == 3
+
+    async def test_decorator_raises_service_unavailable_when_open(self):
+        """Test open circuit is surfaced as ServiceUnavailableError"""
+        cb = AsyncBreaker("vault", fail_max=1, reset_timeout=60)
+
+        @with_circuit_breaker(cb)
+        async def call_vault():
+            raise ConnectionError("refused")
+
+        with pytest.raises(ConnectionError):
+            await call_vault()
+
+        with pytest.raises(ServiceUnavailableError, match="Vault service is temporarily unavailable"):
+            await call_vault()
+
+    async def test_decorator_updates_breaker_state(self):
+        """Test the decorator records failures and successes on the breaker"""
+        cb = AsyncBreaker("test", fail_max=2, reset_timeout=0)
+        outcomes = [ConnectionError("refused"), ConnectionError("refused"), "ok"]
+
+        @with_circuit_breaker(cb)
+        async def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await flaky()
+        assert cb.current_state == "open"
+
+        # reset_timeout=0: next call is the half-open trial and closes the circuit
+        assert await flaky() == "ok"
+        assert cb.current_state == "closed"
+        assert cb.failures == 0
+
+    async def test_decorator_does_not_spawn_tasks(self):
+        """Test the wrapped coroutine is awaited directly"""
+        cb = AsyncBreaker("test")
+
+        @with_circuit_breaker(cb)
+        async def ok():
+            return "ok"
+
+        with patch("asyncio.create_task") as mock_create_task:
+            assert await ok() == "ok"
+        mock_create_task.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWithHealthBreaker:
+    """Test the with_health_breaker decorator"""
+
+    async def test_unhealthy_results_open_circuit(self):
+        """Test unhealthy results count as failures and open the circuit"""
+        cb = AsyncBreaker("test", fail_max=2, reset_timeout=60)
+        check_calls = 0
+
+        @with_health_breaker(cb)
+        async def check():
+            nonlocal check_calls
+            check_calls += 1
+            return {"status": "unhealthy", "error": "Connection failed"}
+
+        assert (await check())["error"] == "Connection failed"
+        assert (await check())["error"] == "Connection failed"
+        assert cb.current_state == "open"
+
+        # Open circuit: the check itself is skipped
+        assert await check() == {"status": "unhealthy", "error": "circuit_open"}
+        assert check_calls == 2
+
+    async def test_healthy_and_degraded_results_reset_failures(self):
+        """Test any result other than unhealthy counts as a success"""
+        cb = AsyncBreaker("test", fail_max=2, reset_timeout=0)
+        results = [{"status": "unhealthy"}, {"status": "unhealthy"}, {"status": "degraded"}]
+
+        @with_health_breaker(cb)
+        async def check():
+            return results.pop(0)
+
+        await check()
+        await check()
+        assert cb.current_state == "open"
+
+        # reset_timeout=0: next call is the half-open trial and closes the circuit
+        assert (await check())["status"] == "degraded"
+        assert cb.current_state == "closed"
+        assert cb.failures == 0
+
+    async def test_cancelled_check_counts_as_failure(self):
+        """Test a check cancelled by a timeout is recorded as a failure"""
+        cb = AsyncBreaker("test", fail_max=1, reset_timeout=60)
+
+        @with_health_breaker(cb)
+        async def check():
+            await asyncio.sleep(10)
+            return {"status": "healthy"}
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(check(), timeout=0.01)
+        assert cb.current_state == "open"
+
 
 @pytest.mark.integration
 class TestCircuitBreakerIntegration:
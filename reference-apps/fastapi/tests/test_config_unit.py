@@ -0,0 +1,34 @@
+"""
+Unit tests for application settings
+
+Tests derived settings values and that the settings object is read-only.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+@pytest.mark.unit
+class TestSettings:
+    """Test Settings parsing and immutability"""
+
+    def test_redis_nodes_parsed(self):
+        """Test REDIS_NODES is parsed into (host, port) pairs"""
+        settings = Settings(REDIS_NODES="redis-1:6379, redis-2:6380")
+
+        assert settings.redis_nodes == (("redis-1", 6379), ("redis-2", 6380))
+
+    def test_redis_nodes_cached(self):
+        """Test the parsed node list is computed once"""
+        settings = Settings()
+
+        assert settings.redis_nodes is settings.redis_nodes
+
+    def test_settings_frozen(self):
+        """Test settings cannot be mutated after construction"""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.DEBUG = True
@@ -10,8 +10,11 @@ Tests for:
 - Allowed and exposed headers
 """
 
+import asyncio
 import pytest
+from unittest.mock import patch
 from fastapi.testclient import TestClient
+from starlette.middleware.cors import CORSMiddleware
 from app.main import app
 
 
@@ -289,5 +292,107 @@ class TestCORSConfiguration:
             assert "access-control-allow-origin" in response.headers
 
 
+class TestCachedPreflight:
+    """Test CachedPreflightCORSMiddleware response reuse"""
+
+    def make_client(self):
+        from fastapi import FastAPI
+        from app.middleware.cors import CachedPreflightCORSMiddleware
+
+        test_app = FastAPI()
+
+        @test_app.get("/")
+        async def index():
+            return {}
+
+        test_app.add_middleware(
+            CachedPreflightCORSMiddleware,
+            allow_origins=["http://localhost:3000"],
+            allow_methods=["GET", "POST"],
+            allow_headers=["Content-Type", "X-Request-ID"],
+        )
+
+        @test_app.middleware("http")
+        async def add_header(request, call_next):
+            # Mutates the outgoing header list in place via response.headers
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = "abc"
+            return response
+
+        return TestClient(test_app)
+
+    def preflight(self, test_client, origin="http://localhost:3000", method="POST"):
+        return test_client.options(
+            "/",
+            headers={
+                "Origin": origin,
+                "Access-Control-Request-Method": method,
+                "Access-Control-Request-Headers": "content-type",
+            }
+        )
+
+    def test_repeated_preflight_identical(self):
+        """Test replayed preflights match the first response and do not accumulate headers"""
+        test_client = self.make_client()
+
+        first = self.preflight(test_client)
+        second = self.preflight(test_client)
+        third = self.preflight(test_client)
+
+        assert first.status_code == second.status_code == third.status_code == 200
+        assert first.headers.items() == third.headers.items()
+        assert third.headers.get_list("x-request-id") == ["abc"]
+        assert third.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    def test_successful_preflight_cached(self):
+        """Test that allowed preflights are built once"""
+        test_client = self.make_client()
+        with patch.object(
+            CORSMiddleware, "preflight_response", autospec=True,
+            side_effect=CORSMiddleware.preflight_response,
+        ) as build:
+            self.preflight(test_client)
+            self.preflight(test_client)
+
+        assert build.call_count == 1
+
+    def test_cached_response_keeps_its_headers(self):
+        """Test that the replayed response is reused and its header list is never handed out"""
+        from starlette.datastructures import Headers
+        from app.middleware.cors import CachedPreflightCORSMiddleware, CachedPreflightResponse
+
+        middleware = CachedPreflightCORSMiddleware(None, allow_origins=["http://localhost:3000"])
+        request_headers = Headers({
+            "origin": "http://localhost:3000",
+            "access-control-request-method": "GET",
+        })
+
+        first = middleware.preflight_response(request_headers)
+        second = middleware.preflight_response(request_headers)
+        original_headers = list(first.raw_headers)
+
+        async def send(message):
+            # Outer middleware appending to the header list in place
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"x-request-id", b"abc"))
+
+        asyncio.run(first({"type": "http"}, None, send))
+
+        assert isinstance(first, CachedPreflightResponse)
+        assert second is first
+        assert first.raw_headers == original_headers
+
+    def test_disallowed_preflight_not_cached(self):
+        """Test that rejected preflights are rebuilt and keep failing"""
+        test_client = self.make_client()
+
+        for _ in range(2):
+            response = self.preflight(test_client, origin="http://evil.example")
+            assert response.status_code == 400
+            assert "access-control-allow-origin" not in response.headers
+
+        assert self.preflight(test_client, method="DELETE").status_code == 400
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
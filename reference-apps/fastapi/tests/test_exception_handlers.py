@@ -7,7 +7,7 @@ Tests that custom exceptions are properly caught and converted to JSON responses
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from app.main import app
 from app.exceptions import (
@@ -99,6 +99,7 @@ class TestExceptionHandlers:
             response = client.get("/examples/vault/secret/test")
 
             assert "X-Request-ID" in response.headers
+            assert len(response.headers.get_list("X-Request-ID")) == 1
             request_id = response.headers["X-Request-ID"]
             data = response.json()
             assert data["request_id"] == request_id
@@ -234,7 +235,7 @@ class TestDebugMode:
 
     def test_debug_info_included_when_debug_enabled(self, client):
         """Test that debug info is included when DEBUG=True"""
-        with patch('app.config.settings.DEBUG', True):
+        with patch('app.middleware.exception_handlers.settings', MagicMock(DEBUG=True)):
             with patch('app.services.vault.vault_client.get_secret') as mock_get:
                 mock_get.side_effect = VaultUnavailableError(message="Test error")
 
@@ -247,7 +248,7 @@ class TestDebugMode:
 
     def test_debug_info_excluded_when_debug_disabled(self, client):
         """Test that debug info is excluded when DEBUG=False"""
-        with patch('app.config.settings.DEBUG', False):
+        with patch('app.middleware.exception_handlers.settings', MagicMock(DEBUG=False)):
             with patch('app.services.vault.vault_client.get_secret') as mock_get:
                 mock_get.side_effect = VaultUnavailableError(message="Test error")
 
@@ -279,7 +280,7 @@ class TestPrometheusMetrics:
         # Get initial count
         initial_count = error_counter.labels(
             error_type="VaultUnavailableError",
-            status_code=503
+            status_code="5xx"
         )._value.get()
 
         with patch('app.services.vault.vault_client.get_secret') as mock_get:
@@ -290,7 +291,7 @@ class TestPrometheusMetrics:
         # Check count increased
         final_count = error_counter.labels(
             error_type="VaultUnavailableError",
-            status_code=503
+            status_code="5xx"
         )._value.get()
 
         assert final_count > initial_count
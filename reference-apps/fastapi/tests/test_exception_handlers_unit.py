@@ -4,6 +4,8 @@ Direct unit tests for exception handler functions
 Tests handler functions directly without going through the FastAPI app.
 """
 
+import traceback
+
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi import Request, status
@@ -16,7 +18,11 @@ from app.middleware.exception_handlers import (
     validation_error_handler,
     http_exception_handler,
     unhandled_exception_handler,
-    get_request_id
+    get_request_id,
+    count_error,
+    format_debug_traceback,
+    register_exception_handlers,
+    DEBUG_TRACEBACK_LIMIT
 )
 from app.exceptions import (
     BaseAPIException,
@@ -26,27 +32,25 @@ from app.exceptions import (
 )
 
 
+def make_request(method, path, state=None):
+    """Build a request from a minimal ASGI scope"""
+    scope = {"type": "http", "method": method, "path": path, "headers": [], "query_string": b""}
+    if state is not None:
+        scope["state"] = state
+    return Request(scope)
+
+
 @pytest.fixture
 def mock_request():
-    """Create a mock request object"""
-    request = MagicMock(spec=Request)
-    request.state = MagicMock()
-    request.state.request_id = "test-request-123"
-    request.method = "GET"
-    request.url.path = "/test/endpoint"
-    return request
+    """Create a request with a request ID in its state"""
+    return make_request("GET", "/test/endpoint", {"request_id": "test-request-123"})
 
 
 @pytest.fixture
 def mock_request_no_id():
-    """Create a mock request without request_id"""
-    request = MagicMock(spec=Request)
-    request.state = MagicMock()
-    # No request_id attribute
-    del request.state.request_id
-    request.method = "POST"
-    request.url.path = "/api/test"
-    return request
+    """Create a request without request_id"""
+    # No request_id in state
+    return make_request("POST", "/api/test", {})
 
 
 @pytest.mark.unit
@@ -64,6 +68,18 @@ class TestGetRequestId:
         result = get_request_id(mock_request_no_id)
         assert result == "unknown"
 
+    async def test_get_request_id_no_state(self):
+        """Test default request ID when the scope has no state at all"""
+        result = get_request_id(make_request("GET", "/api/test"))
+        assert result == "unknown"
+
+    async def test_get_request_id_set_through_state(self):
+        """Test an ID assigned via request.state is found"""
+        request = make_request("GET", "/api/test")
+        request.state.request_id = "from-state"
+
+        assert get_request_id(request) == "from-state"
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -121,6 +137,7 @@ class TestBaseAPIExceptionHandler:
         # Check that debug is not in the response (comparing strings since body is bytes)
         assert "traceback" not in data.lower() or "debug" not in data
 
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
     @patch('app.middleware.exception_handlers.error_counter')
     async def test_handler_increments_metrics(self, mock_counter, mock_request):
         """Test handler increments Prometheus metrics"""
@@ -130,7 +147,7 @@ class TestBaseAPIExceptionHandler:
 
         mock_counter.labels.assert_called_once_with(
             error_type="BaseAPIException",
-            status_code=404
+            status_code="4xx"
         )
         mock_counter.labels.return_value.inc.assert_called_once()
 
@@ -173,6 +190,7 @@ class TestServiceUnavailableHandler:
         data = response.body.decode()
         assert "mysql" in data
 
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
     @patch('app.middleware.exception_handlers.error_counter')
     async def test_handler_increments_metrics(self, mock_counter, mock_request):
         """Test handler increments Prometheus metrics"""
@@ -222,6 +240,7 @@ class TestValidationErrorHandler:
         assert "validation_errors" in data
         assert "limit" in data
 
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
     @patch('app.middleware.exception_handlers.error_counter')
     async def test_handler_increments_metrics(self, mock_counter, mock_request):
         """Test handler increments Prometheus metrics"""
@@ -232,7 +251,7 @@ class TestValidationErrorHandler:
 
         mock_counter.labels.assert_called_once_with(
             error_type="ValidationError",
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+            status_code="4xx"
         )
 
 
@@ -258,6 +277,7 @@ class TestHTTPExceptionHandler:
         data = response.body.decode()
         assert "Forbidden resource" in data
 
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
     @patch('app.middleware.exception_handlers.error_counter')
     async def test_handler_increments_metrics(self, mock_counter, mock_request):
         """Test handler increments Prometheus metrics"""
@@ -267,9 +287,44 @@ class TestHTTPExceptionHandler:
 
         mock_counter.labels.assert_called_once_with(
             error_type="HTTPException",
-            status_code=401
+            status_code="4xx"
         )
 
+    @patch('app.middleware.exception_handlers.logger')
+    async def test_handler_skips_disabled_warning_log(self, mock_logger, mock_request):
+        """Test no log record is built when WARNING is filtered out"""
+        mock_logger.isEnabledFor.return_value = False
+        exc = StarletteHTTPException(status_code=404, detail="Not found")
+
+        response = await http_exception_handler(mock_request, exc)
+
+        assert response.status_code == 404
+        mock_logger.warning.assert_not_called()
+
+    @patch('app.middleware.exception_handlers.logger')
+    async def test_handler_logs_with_deferred_formatting(self, mock_logger, mock_request):
+        """Test message arguments are passed to the logger, not pre-formatted"""
+        mock_logger.isEnabledFor.return_value = True
+        exc = StarletteHTTPException(status_code=404, detail="Not found")
+
+        await http_exception_handler(mock_request, exc)
+
+        args = mock_logger.warning.call_args.args
+        assert args == ("HTTP exception: %s - %s", 404, "Not found")
+
+    @patch('app.middleware.exception_handlers.logger')
+    async def test_handler_logs_path_from_scope(self, mock_logger, mock_request):
+        """Test the logged path is read from the scope without building request.url"""
+        mock_logger.isEnabledFor.return_value = True
+        exc = StarletteHTTPException(status_code=404, detail="Not found")
+
+        await http_exception_handler(mock_request, exc)
+
+        extra = mock_logger.warning.call_args.kwargs["extra"]
+        assert extra["path"] == "/test/endpoint"
+        assert extra["method"] == "GET"
+        assert getattr(mock_request, "_url", None) is None
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -321,6 +376,7 @@ class TestUnhandledExceptionHandler:
         # Should not include specific exception details
         assert "RuntimeError" not in data or "debug" not in data.lower()
 
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
     @patch('app.middleware.exception_handlers.error_counter')
     async def test_handler_increments_metrics(self, mock_counter, mock_request):
         """Test handler increments Prometheus metrics"""
@@ -329,6 +385,112 @@ class TestUnhandledExceptionHandler:
         await unhandled_exception_handler(mock_request, exc)
 
         mock_counter.labels.assert_called_once_with(
-            error_type="ZeroDivisionError",
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+            error_type="Other",
+            status_code="5xx"
         )
+
+
+@pytest.mark.unit
+class TestCountError:
+    """Test http_errors_total label bucketing"""
+
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
+    @patch('app.middleware.exception_handlers.error_counter')
+    def test_known_type_and_status_class(self, mock_counter):
+        """Test that known error types are kept and status codes bucketed"""
+        count_error("VaultUnavailableError", 503)
+
+        mock_counter.labels.assert_called_once_with(error_type="VaultUnavailableError", status_code="5xx")
+        mock_counter.labels.return_value.inc.assert_called_once()
+
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
+    @patch('app.middleware.exception_handlers.error_counter')
+    def test_unknown_type_collapses_to_other(self, mock_counter):
+        """Test that arbitrary exception class names share one label"""
+        count_error("KeyError", 500)
+        count_error("IndexError", 500)
+
+        mock_counter.labels.assert_called_once_with(error_type="Other", status_code="5xx")
+        assert mock_counter.labels.return_value.inc.call_count == 2
+
+    @patch.dict('app.middleware.exception_handlers._error_counters', clear=True)
+    @patch('app.middleware.exception_handlers.error_counter')
+    def test_label_child_cached(self, mock_counter):
+        """Test that labels() is resolved once per error type and status class"""
+        count_error("HTTPException", 404)
+        count_error("HTTPException", 401)
+
+        mock_counter.labels.assert_called_once()
+        assert mock_counter.labels.return_value.inc.call_count == 2
+
+
+@pytest.mark.unit
+class TestRegisterExceptionHandlers:
+    """Test handler registration"""
+
+    def test_service_error_subclasses_use_service_handler(self):
+        """Test subclasses resolve to the ServiceUnavailableError handler via the MRO"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.exceptions import CacheConnectionError, CircuitBreakerError
+
+        test_app = FastAPI()
+        register_exception_handlers(test_app)
+
+        @test_app.get("/cache")
+        async def cache_down():
+            raise CacheConnectionError()
+
+        @test_app.get("/breaker")
+        async def breaker_open():
+            raise CircuitBreakerError("postgres")
+
+        assert ServiceUnavailableError in test_app.exception_handlers
+        assert CacheConnectionError not in test_app.exception_handlers
+
+        with TestClient(test_app) as client:
+            for path, error in (("/cache", "CacheConnectionError"), ("/breaker", "CircuitBreakerError")):
+                response = client.get(path)
+
+                assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+                data = response.json()
+                assert data["error"] == error
+                assert "retry_suggestion" in data
+
+
+@pytest.mark.unit
+class TestFormatDebugTraceback:
+    """Test debug traceback formatting"""
+
+    def test_formats_exception_traceback(self):
+        """Test the traceback of the given exception is formatted, not the current one"""
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            exc = e
+
+        formatted = format_debug_traceback(exc)
+
+        assert formatted.startswith("Traceback (most recent call last):")
+        assert 'raise RuntimeError("boom")' in formatted
+        assert formatted.rstrip().endswith("RuntimeError: boom")
+
+    def test_deep_stack_keeps_innermost_frames(self):
+        """Test deep stacks are cut to DEBUG_TRACEBACK_LIMIT frames nearest the error"""
+        def recurse(depth):
+            if depth == 0:
+                raise ValueError("bottom")
+            recurse(depth - 1)
+
+        try:
+            recurse(DEBUG_TRACEBACK_LIMIT * 3)
+        except ValueError as e:
+            exc = e
+
+        formatted = format_debug_traceback(exc)
+        full = "".join(traceback.format_exception(exc))
+
+        assert 'raise ValueError("bottom")' in formatted
+        # The outermost frame is only in the untruncated traceback
+        assert "test_deep_stack_keeps_innermost_frames" in full
+        assert "test_deep_stack_keeps_innermost_frames" not in formatted
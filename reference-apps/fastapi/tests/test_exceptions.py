@@ -59,6 +59,15 @@ class TestBaseAPIException:
         assert result["status_code"] == 400
         assert result["details"]["field"] == "test"
 
+    def test_subclass_error_name(self):
+        """Test that each subclass reports its own class name"""
+        class CustomError(BaseAPIException):
+            pass
+
+        assert CustomError.error_name == "CustomError"
+        assert CustomError(message="x").to_dict()["error"] == "CustomError"
+        assert BaseAPIException.error_name == "BaseAPIException"
+
     def test_base_exception_str(self):
         """Test string representation"""
         exc = BaseAPIException(message="Test error")
@@ -129,6 +138,22 @@ class TestServiceUnavailableError:
         assert exc.service_name == "rabbitmq"
         assert exc.details["queue_name"] == "test-queue"
 
+    def test_subclass_details_built_once(self):
+        """Test that subclass details include the service and merge caller details"""
+        exc = DatabaseConnectionError(database_type="mysql", details={"host": "db"})
+
+        assert exc.service_name == "mysql"
+        assert exc.details == {"service": "mysql", "database_type": "mysql", "host": "db"}
+
+    def test_caller_details_not_mutated(self):
+        """Test that the details dict passed in is copied, not modified"""
+        details = {"attempt": 2}
+
+        exc = VaultUnavailableError(secret_path="secret/test", details=details)
+
+        assert details == {"attempt": 2}
+        assert exc.details == {"service": "vault", "attempt": 2, "secret_path": "secret/test"}
+
 
 @pytest.mark.unit
 @pytest.mark.exceptions
@@ -11,6 +11,62 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def reset_health_clients():
+    """Start every test without cached health check connections"""
+    with patch('app.routers.health._pg_pool', None), \
+            patch('app.routers.health._mysql_pool', None), \
+            patch('app.routers.health._mongo_client', None), \
+            patch('app.routers.health._mongo_version', None), \
+            patch('app.routers.health._rabbitmq_connection', None), \
+            patch.dict('app.routers.health._redis_clients', clear=True):
+        yield
+
+
+def make_redis_node_client(cluster_state="ok", delay=0.0, fail=False, cluster_error=None, info=None):
+    """
+    Build a mock Redis client for the node probe's pipeline
+
+    The pipeline's execute() waits delay seconds, raises ConnectionError if
+    fail, and otherwise returns the PING, INFO and CLUSTER INFO results
+    (cluster_error, if given, in place of the CLUSTER INFO reply).
+    """
+    import asyncio
+
+    # CLUSTER INFO lines end in CRLF, as Redis sends them
+    cluster_raw = f"cluster_state:{cluster_state}\r\ncluster_size:3\r\n"
+
+    async def execute(raise_on_error=True):
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionError("refused")
+        responses = [True, info or {"redis_version": "7.0.0", "role": "master", "cluster_enabled": 1}]
+        if pipe.execute_command.called:
+            responses.append(cluster_error or cluster_raw)
+        return responses
+
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    pipe.execute = AsyncMock(side_effect=execute)
+
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    client.execute_command = AsyncMock(return_value=cluster_raw)
+    return client
+
+
+def make_pool(conn):
+    """Build a mock pool whose acquire() yields conn"""
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=None)
+
+    pool = MagicMock()
+    pool.acquire.return_value = acquire
+    return pool
+
+
 @pytest.mark.integration
 class TestHealthEndpoints:
     """Test health check endpoints"""
@@ -136,7 +192,7 @@ class TestHealthCheckFunctions:
         from app.routers.health import check_postgres
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
-            with patch('app.routers.health.asyncpg.connect') as mock_connect:
+            with patch('app.routers.health.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_secret.return_value = {
                     "user": "test_user",
                     "password": "test_pass",
@@ -145,21 +201,25 @@ class TestHealthCheckFunctions:
 
                 mock_conn = AsyncMock()
                 mock_conn.fetchval.return_value = "PostgreSQL 16.0"
-                mock_connect.return_value = mock_conn
+                mock_create_pool.return_value = make_pool(mock_conn)
 
                 result = await check_postgres()
+                await check_postgres()
 
                 assert result["status"] == "healthy"
                 assert "version" in result
+                # The pool is created once and reused by later checks
+                mock_create_pool.assert_called_once()
+                assert mock_conn.fetchval.await_count == 2
 
     async def test_check_postgres_unhealthy(self):
         """Test PostgreSQL health check when unhealthy"""
         from app.routers.health import check_postgres
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
-            with patch('app.routers.health.asyncpg.connect') as mock_connect:
+            with patch('app.routers.health.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_secret.return_value = {"user": "test", "password": "test", "database": "test"}
-                mock_connect.side_effect = Exception("Connection refused")
+                mock_create_pool.side_effect = Exception("Connection refused")
 
                 result = await check_postgres()
 
@@ -174,19 +234,17 @@ class TestHealthCheckFunctions:
             with patch('app.routers.health.redis.Redis') as mock_redis_class:
                 mock_secret.return_value = {"password": "test_pass"}
 
-                mock_client = AsyncMock()
-                mock_client.ping.return_value = True
-                mock_client.info.return_value = {
+                mock_client = make_redis_node_client(info={
                     "redis_version": "7.0.0",
                     "role": "master",
                     "cluster_enabled": 1,
                     "connected_clients": 5,
                     "used_memory_human": "1.5M"
-                }
-                mock_client.execute_command.return_value = "cluster_state:ok\ncluster_slots_assigned:16384"
+                })
                 mock_redis_class.return_value = mock_client
 
-                with patch('app.routers.health.settings.REDIS_NODES', "localhost:6379,localhost:6380,localhost:6381"):
+                nodes = (("localhost", 6379), ("localhost", 6380), ("localhost", 6381))
+                with patch('app.routers.health.settings', MagicMock(redis_nodes=nodes)):
                     result = await check_redis()
 
                     assert result["status"] in ["healthy", "degraded"]
@@ -198,7 +256,7 @@ class TestHealthCheckFunctions:
         from app.routers.health import check_mysql
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
-            with patch('app.routers.health.aiomysql.connect') as mock_connect:
+            with patch('app.routers.health.aiomysql.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_secret.return_value = {
                     "user": "test_user",
                     "password": "test_pass",
@@ -209,12 +267,11 @@ class TestHealthCheckFunctions:
                 mock_cursor.execute = AsyncMock()
                 mock_cursor.fetchone.return_value = ("MySQL 8.0",)
                 mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-                mock_cursor.__aexit__ = AsyncMock()
+                mock_cursor.__aexit__ = AsyncMock(return_value=None)
 
                 mock_conn = MagicMock()
                 mock_conn.cursor.return_value = mock_cursor
-                mock_conn.close = MagicMock()
-                mock_connect.return_value = mock_conn
+                mock_create_pool.return_value = make_pool(mock_conn)
 
                 result = await check_mysql()
 
@@ -226,19 +283,18 @@ class TestHealthCheckFunctions:
         from app.routers.health import check_mysql
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
-            with patch('app.routers.health.aiomysql.connect') as mock_connect:
+            with patch('app.routers.health.aiomysql.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_secret.return_value = {"user": "test", "password": "test", "database": "test"}
-                mock_connect.side_effect = Exception("Connection refused")
+                mock_create_pool.side_effect = Exception("Connection refused")
 
                 result = await check_mysql()
 
                 assert result["status"] == "unhealthy"
                 assert "error" in result
 
-    @pytest.mark.skip(reason="Needs better async mocking for motor")
     async def test_check_mongodb_healthy(self):
         """Test MongoDB health check when healthy"""
-        from app.routers.health import check_mongodb
+        from app.routers import health
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
             with patch('app.routers.health.motor.motor_asyncio.AsyncIOMotorClient') as mock_client_class:
@@ -248,18 +304,23 @@ class TestHealthCheckFunctions:
                     "database": "test_db"
                 }
 
-                mock_db = AsyncMock()
-                mock_db.command.return_value = {"version": "6.0.0", "ok": 1}
-
                 mock_client = MagicMock()
-                mock_client.__getitem__.return_value = mock_db
-                mock_client.close = MagicMock()
+                mock_client.admin.command = AsyncMock(return_value={"ok": 1})
+                mock_client.server_info = AsyncMock(return_value={"version": "6.0.0"})
                 mock_client_class.return_value = mock_client
 
-                result = await check_mongodb()
+                result = await health.check_mongodb()
+                second = await health.check_mongodb()
 
-                assert result["status"] == "healthy"
-                assert "version" in result
+                assert result == second == {"status": "healthy", "version": "6.0.0"}
+                # Every check pings; the version is read once and reused
+                assert mock_client.admin.command.await_count == 2
+                mock_client.server_info.assert_awaited_once()
+
+                # Re-read once MONGO_VERSION_TTL has passed
+                health._mongo_version_read_at -= health.MONGO_VERSION_TTL
+                await health.check_mongodb()
+                assert mock_client.server_info.await_count == 2
 
     async def test_check_mongodb_unhealthy(self):
         """Test MongoDB health check when unhealthy"""
@@ -278,23 +339,29 @@ class TestHealthCheckFunctions:
         from app.routers.health import check_rabbitmq
 
         with patch('app.routers.health.vault_client.get_secret') as mock_secret:
-            with patch('app.routers.health.aio_pika.connect_robust') as mock_connect:
+            with patch('app.routers.health.aio_pika.connect_robust', new_callable=AsyncMock) as mock_connect:
                 mock_secret.return_value = {
                     "user": "test_user",
                     "password": "test_pass"
                 }
 
-                mock_channel = AsyncMock()
-                mock_channel.close = AsyncMock()
+                mock_channel = MagicMock()
+                mock_channel.__aenter__ = AsyncMock(return_value=mock_channel)
+                mock_channel.__aexit__ = AsyncMock(return_value=None)
 
-                mock_connection = AsyncMock()
+                mock_connection = MagicMock()
                 mock_connection.channel.return_value = mock_channel
                 mock_connection.close = AsyncMock()
                 mock_connect.return_value = mock_connection
 
                 result = await check_rabbitmq()
+                await check_rabbitmq()
 
                 assert result["status"] == "healthy"
+                # One connection, a short-lived channel per check
+                mock_connect.assert_called_once()
+                assert mock_connection.channel.call_count == 2
+                mock_connection.close.assert_not_called()
 
     async def test_check_rabbitmq_unhealthy(self):
         """Test RabbitMQ health check when unhealthy"""
@@ -321,3 +388,407 @@ class TestHealthCheckFunctions:
 
             assert result["status"] == "unhealthy"
             assert "error" in result
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCheckAll:
+    """Test the concurrent aggregate check behind /health/all"""
+
+    CHECKS = ("vault", "postgres", "mysql", "mongodb", "redis", "rabbitmq")
+
+    def patch_checks(self, **overrides):
+        """Patch every check_* function, healthy unless overridden"""
+        from contextlib import ExitStack
+
+        stack = ExitStack()
+        for name in self.CHECKS:
+            mock = overrides.get(name) or AsyncMock(return_value={"status": "healthy"})
+            stack.enter_context(patch(f'app.routers.health.check_{name}', mock))
+        return stack
+
+    async def test_check_all_reports_every_service(self):
+        """Test results are keyed by service in the original order"""
+        from app.routers.health import check_all
+
+        with self.patch_checks():
+            results = await check_all()
+
+        assert tuple(results) == self.CHECKS
+        assert all(r["status"] == "healthy" for r in results.values())
+
+    async def test_check_all_runs_concurrently(self):
+        """Test total time is that of the slowest check, not the sum"""
+        import asyncio
+        import time
+        from app.routers.health import check_all
+
+        async def slow_check():
+            await asyncio.sleep(0.2)
+            return {"status": "healthy"}
+
+        with self.patch_checks(**{name: slow_check for name in self.CHECKS}):
+            start = time.monotonic()
+            await check_all()
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.6
+
+    async def test_check_all_bounds_slow_check(self):
+        """Test a check past HEALTH_CHECK_TIMEOUT is unhealthy without failing the rest"""
+        import asyncio
+        from app.routers.health import check_all
+
+        async def hanging_check():
+            await asyncio.sleep(10)
+
+        with self.patch_checks(mongodb=hanging_check), \
+                patch('app.routers.health.settings', MagicMock(HEALTH_CHECK_TIMEOUT=0.01)):
+            results = await check_all()
+
+        assert results["mongodb"]["status"] == "unhealthy"
+        assert "timed out" in results["mongodb"]["error"]
+        assert results["postgres"]["status"] == "healthy"
+
+    async def test_service_endpoint_bounds_slow_check(self):
+        """Test the single-service endpoints apply HEALTH_CHECK_TIMEOUT too"""
+        import asyncio
+        from app.routers.health import health_postgres
+
+        async def hanging_check():
+            await asyncio.sleep(10)
+
+        with self.patch_checks(postgres=hanging_check), \
+                patch('app.routers.health.settings', MagicMock(HEALTH_CHECK_TIMEOUT=0.01)):
+            result = await health_postgres()
+
+        assert result == {"status": "unhealthy", "error": "postgres health check timed out"}
+
+    async def test_check_all_maps_unexpected_error(self):
+        """Test an exception escaping a check is reported as unhealthy"""
+        from app.routers.health import check_all
+
+        with self.patch_checks(redis=AsyncMock(side_effect=RuntimeError("boom"))):
+            results = await check_all()
+
+        assert results["redis"] == {"status": "unhealthy", "error": "redis health check failed"}
+        assert results["vault"]["status"] == "healthy"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCheckRedisNodes:
+    """Test the concurrent per-node Redis probes"""
+
+    NODES = (("redis-1", 6379), ("redis-2", 6379), ("redis-3", 6379))
+
+    def make_client(self, cluster_state="ok", delay=0.0, fail=False, cluster_error=None):
+        """Build a mock node client whose pipeline answers PING, INFO and CLUSTER INFO"""
+        return make_redis_node_client(cluster_state, delay, fail, cluster_error)
+
+    async def test_nodes_probed_concurrently(self):
+        """Test total time is one node's round trip, not the sum"""
+        import time
+        from app.routers.health import check_redis
+
+        clients = [self.make_client(delay=0.2) for _ in self.NODES]
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.health.redis.Redis', side_effect=clients), \
+                patch('app.routers.health.settings', MagicMock(redis_nodes=self.NODES)):
+            start = time.monotonic()
+            result = await check_redis()
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert result["status"] == "healthy"
+        assert [n["host"] for n in result["nodes"]] == ["redis-1", "redis-2", "redis-3"]
+
+    async def test_cluster_state_from_first_reporting_node(self):
+        """Test cluster state follows node order and skips failed nodes"""
+        from app.routers.health import check_redis
+
+        clients = [
+            self.make_client(fail=True),
+            self.make_client(cluster_state="fail"),
+            self.make_client(cluster_state="ok"),
+        ]
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.health.redis.Redis', side_effect=clients), \
+                patch('app.routers.health.settings', MagicMock(redis_nodes=self.NODES)):
+            result = await check_redis()
+
+        assert result["status"] == "degraded"
+        assert result["cluster_enabled"] is True
+        assert result["cluster_state"] == "fail"
+        assert result["nodes"][0] == {
+            "host": "redis-1", "port": 6379, "status": "unhealthy", "error": "Node connection failed"
+        }
+        # Only the next node up was asked once the first could not answer
+        clients[1].execute_command.assert_awaited_once_with("CLUSTER", "INFO")
+        clients[2].execute_command.assert_not_awaited()
+
+    async def test_cluster_info_only_from_first_node(self):
+        """Test CLUSTER INFO is pipelined to the first node only"""
+        from app.routers.health import check_redis
+
+        clients = [self.make_client() for _ in self.NODES]
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.health.redis.Redis', side_effect=clients), \
+                patch('app.routers.health.settings', MagicMock(redis_nodes=self.NODES)):
+            result = await check_redis()
+
+        assert result["cluster_state"] == "ok"
+        assert [c.pipeline.return_value.execute_command.called for c in clients] == [True, False, False]
+        for client in clients:
+            client.execute_command.assert_not_awaited()
+
+    async def test_node_probed_in_one_round_trip(self):
+        """Test PING, INFO and CLUSTER INFO share one non-transactional pipeline"""
+        from app.routers.health import probe_redis_node
+
+        client = self.make_client()
+        node, cluster_enabled, cluster_state = await probe_redis_node("redis-1", 6379, client)
+
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe = client.pipeline.return_value
+        pipe.ping.assert_called_once_with()
+        pipe.info.assert_called_once_with()
+        pipe.execute_command.assert_called_once_with("CLUSTER", "INFO")
+        pipe.execute.assert_awaited_once_with(raise_on_error=False)
+        assert node["status"] == "healthy"
+        assert (cluster_enabled, cluster_state) == (True, "ok")
+
+    async def test_cluster_info_error_keeps_node_healthy(self):
+        """Test a failed CLUSTER INFO only leaves the cluster state unknown"""
+        from app.routers.health import probe_redis_node
+
+        client = self.make_client(cluster_error=Exception("ERR This instance has cluster support disabled"))
+        node, cluster_enabled, cluster_state = await probe_redis_node("redis-1", 6379, client)
+
+        assert node["status"] == "healthy"
+        assert cluster_enabled is True
+        assert cluster_state is None
+
+    async def test_stalled_node_timed_out_alone(self):
+        """Test a node past REDIS_NODE_TIMEOUT is unhealthy while the others report"""
+        from app.routers.health import check_redis
+
+        clients = [self.make_client(delay=10), self.make_client(), self.make_client()]
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.health.redis.Redis', side_effect=clients), \
+                patch('app.routers.health.settings', MagicMock(redis_nodes=self.NODES)), \
+                patch('app.routers.health.REDIS_NODE_TIMEOUT', 0.01):
+            result = await check_redis()
+
+        assert result["status"] == "degraded"
+        assert result["nodes"][0] == {
+            "host": "redis-1", "port": 6379, "status": "unhealthy", "error": "Node health check timed out"
+        }
+        assert [n["status"] for n in result["nodes"][1:]] == ["healthy", "healthy"]
+        assert result["cluster_state"] == "ok"
+
+    async def test_node_clients_reused(self):
+        """Test node clients and the Vault lookup are shared across checks"""
+        from app.routers.health import check_redis
+
+        clients = [self.make_client() for _ in self.NODES]
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={"password": "p"})) as mock_secret, \
+                patch('app.routers.health.redis.Redis', side_effect=clients) as mock_redis_class, \
+                patch('app.routers.health.settings', MagicMock(redis_nodes=self.NODES)):
+            await check_redis()
+            result = await check_redis()
+
+        assert result["status"] == "healthy"
+        mock_secret.assert_awaited_once_with("redis-1")
+        assert mock_redis_class.call_count == 3
+        for client in clients:
+            assert client.pipeline.return_value.execute.await_count == 2
+            client.aclose.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetAllResults:
+    """Test the single-flight, stale-while-revalidate results behind /health/all"""
+
+    def counting_check_all(self, delay=0.0):
+        """Build a check_all stand-in returning {"run": n} on its nth call"""
+        import asyncio
+
+        calls = 0
+
+        async def check_all():
+            nonlocal calls
+            calls += 1
+            run = calls
+            await asyncio.sleep(delay)
+            return {"run": run}
+
+        return check_all
+
+    async def test_concurrent_misses_share_one_run(self):
+        """Test callers arriving together wait on a single check_all"""
+        import asyncio
+        from app.routers.health import get_all_results
+
+        with patch('app.routers.health.check_all', self.counting_check_all(delay=0.05)):
+            results = await asyncio.gather(*(get_all_results() for _ in range(5)))
+
+        assert results == [{"run": 1}] * 5
+
+    async def test_fresh_results_reused(self):
+        """Test results younger than HEALTH_ALL_FRESH_FOR are served without a refresh"""
+        from app.routers.health import get_all_results
+
+        with patch('app.routers.health.check_all', self.counting_check_all()):
+            assert await get_all_results() == {"run": 1}
+            assert await get_all_results() == {"run": 1}
+
+    async def test_stale_results_served_while_refreshing(self):
+        """Test stale results return at once and are replaced by a background refresh"""
+        from app.routers import health
+
+        with patch('app.routers.health.check_all', self.counting_check_all()):
+            await health.get_all_results()
+            health._all_checked_at -= health.HEALTH_ALL_FRESH_FOR
+
+            assert await health.get_all_results() == {"run": 1}
+            await health._all_refresh
+            assert await health.get_all_results() == {"run": 2}
+
+    async def test_expired_results_awaited(self):
+        """Test results older than HEALTH_ALL_STALE_FOR are not served"""
+        from app.routers import health
+
+        with patch('app.routers.health.check_all', self.counting_check_all()):
+            await health.get_all_results()
+            health._all_checked_at -= health.HEALTH_ALL_STALE_FOR
+
+            assert await health.get_all_results() == {"run": 2}
+
+    async def test_cancel_health_refresh(self):
+        """Test a refresh still running at shutdown is cancelled"""
+        from app.routers import health
+
+        with patch('app.routers.health.check_all', self.counting_check_all(delay=10)):
+            task = health.start_refresh()
+            await health.cancel_health_refresh()
+
+        assert task.cancelled()
+        assert health._all_refresh is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHealthAllResponseCache:
+    """Test the /health/all response cache together with the in-process results"""
+
+    @pytest.fixture
+    def clock(self):
+        """One fake clock driving both the response cache and the results' age"""
+        from types import SimpleNamespace
+        from fastapi_cache import FastAPICache
+        from fastapi_cache.backends.inmemory import InMemoryBackend
+
+        now = [1000.0]
+        fake_time = SimpleNamespace(time=lambda: now[0], monotonic=lambda: now[0])
+        backend = InMemoryBackend()
+        backend._store.clear()
+        FastAPICache.init(backend, prefix="test")
+        try:
+            with patch('fastapi_cache.backends.inmemory.time', fake_time), \
+                    patch('app.routers.health.time', fake_time):
+                yield now
+        finally:
+            backend._store.clear()
+            FastAPICache.reset()
+
+    async def test_cache_miss_sees_change_from_previous_cycle(self, clock):
+        """Test an outage during one cache period shows on the next miss, not one later"""
+        import asyncio
+        from app.routers import health
+
+        status = {"status": "healthy"}
+        check_all = AsyncMock(side_effect=lambda: {"vault": dict(status)})
+
+        # Fire the scheduled refresh after 10ms of real time; the fake clock
+        # stands in for the seconds that would pass in between
+        with patch('app.routers.health.check_all', check_all), \
+                patch('app.routers.health.HEALTH_ALL_REFRESH_AHEAD', health.HEALTH_ALL_CACHE_TTL - 0.01):
+            assert (await health.health_all())["status"] == "healthy"
+
+            status["status"] = "unhealthy"
+            clock[0] += health.HEALTH_ALL_CACHE_TTL - health.HEALTH_ALL_REFRESH_AHEAD
+            assert (await health.health_all())["status"] == "healthy"  # response cache hit
+            await asyncio.sleep(0.05)
+            await health._all_refresh
+
+            # Past the cached response's expiry: a miss served without waiting
+            clock[0] += health.HEALTH_ALL_REFRESH_AHEAD + 1
+            assert (await health.health_all())["status"] == "degraded"
+
+        # One initial run and one ahead of expiry; the miss reused the latter
+        assert check_all.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHealthBreakers:
+    """Test the circuit breakers guarding the service checks"""
+
+    async def test_open_circuit_skips_connection_attempt(self):
+        """Test repeated failures stop the check from reconnecting"""
+        from app.routers.health import check_postgres, health_breakers, HEALTH_BREAKER_FAIL_MAX
+
+        with patch('app.routers.health.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.health.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
+            mock_create_pool.side_effect = Exception("Connection refused")
+
+            for _ in range(HEALTH_BREAKER_FAIL_MAX):
+                result = await check_postgres()
+                assert result["error"] == "PostgreSQL connection failed"
+
+            result = await check_postgres()
+
+        assert result == {"status": "unhealthy", "error": "circuit_open"}
+        assert mock_create_pool.await_count == HEALTH_BREAKER_FAIL_MAX
+        assert health_breakers["postgres"].current_state == "open"
+        # Breakers are per service
+        assert health_breakers["mysql"].current_state == "closed"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCloseHealthClients:
+    """Test releasing the shared health check connections"""
+
+    async def test_close_health_clients(self):
+        """Test every held connection is closed and forgotten"""
+        from app.routers import health
+
+        pg_pool = MagicMock(close=AsyncMock())
+        mysql_pool = MagicMock(wait_closed=AsyncMock())
+        mongo_client = MagicMock()
+        rabbitmq_connection = MagicMock(close=AsyncMock())
+        redis_client = MagicMock(aclose=AsyncMock())
+
+        with patch('app.routers.health._pg_pool', pg_pool), \
+                patch('app.routers.health._mysql_pool', mysql_pool), \
+                patch('app.routers.health._mongo_client', mongo_client), \
+                patch('app.routers.health._rabbitmq_connection', rabbitmq_connection):
+            health._redis_clients[("redis-1", 6379)] = redis_client
+
+            await health.close_health_clients()
+
+            assert health._pg_pool is None
+            assert health._mysql_pool is None
+            assert health._mongo_client is None
+            assert health._rabbitmq_connection is None
+            assert health._redis_clients == {}
+
+        pg_pool.close.assert_awaited_once()
+        mysql_pool.close.assert_called_once()
+        mysql_pool.wait_closed.assert_awaited_once()
+        mongo_client.close.assert_called_once()
+        rabbitmq_connection.close.assert_awaited_once()
+        redis_client.aclose.assert_awaited_once()
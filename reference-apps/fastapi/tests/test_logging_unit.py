@@ -0,0 +1,296 @@
+"""
+Unit tests for the structured logging helpers in app.utils.logging
+
+Tests the orjson-backed JSON formatter, the buffered stream handler and the
+queue handler/listener pair that moves formatting and flushing off the
+calling thread.
+"""
+
+import io
+import json
+import logging
+import queue
+import sys
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.utils.logging import (
+    BufferedQueueListener,
+    BufferedStreamHandler,
+    OrjsonFormatter,
+    StructuredQueueHandler,
+    redact_sensitive,
+    redact_url_password,
+)
+
+
+def make_record(msg="HTTP request completed", args=(), level=logging.INFO, exc_info=None, **extra):
+    """Build a LogRecord the same way Logger.makeRecord does for extra={...}"""
+    record = logging.LogRecord("app.main", level, __file__, 10, msg, args, exc_info)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class CountingStream(io.StringIO):
+    """StringIO that records how many times it was flushed"""
+
+    flushes = 0
+
+    def __init__(self):
+        super().__init__()
+        self.flushed = threading.Event()
+
+    def flush(self):
+        self.flushes += 1
+        self.flushed.set()
+
+
+@pytest.mark.unit
+class TestRedactSensitive:
+    """Test redaction of sensitive fields in log payloads"""
+
+    def test_sensitive_keys_are_redacted(self):
+        """Test keys containing a sensitive name are redacted, case-insensitively"""
+        data = {"user": "admin", "DB_Password": "p", "X-Vault-Token": "t", "apiKey": "k"}
+
+        assert redact_sensitive(data) == {
+            "user": "admin",
+            "DB_Password": "[REDACTED]",
+            "X-Vault-Token": "[REDACTED]",
+            "apiKey": "[REDACTED]",
+        }
+
+    def test_nested_dicts_and_lists(self):
+        """Test redaction reaches dicts nested in dicts and lists"""
+        data = {"db": {"host": "h", "secret_id": "s"}, "nodes": [{"auth": "a"}, "plain"]}
+
+        assert redact_sensitive(data) == {
+            "db": {"host": "h", "secret_id": "[REDACTED]"},
+            "nodes": [{"auth": "[REDACTED]"}, "plain"],
+        }
+
+
+@pytest.mark.unit
+class TestRedactUrlPassword:
+    """Test credential removal from connection URLs"""
+
+    def test_credentials_are_removed(self):
+        """Test user and password are dropped while host, port and path stay"""
+        assert redact_url_password("postgresql://user:pass@db:5432/mydb") == "postgresql://db:5432/mydb"
+        assert redact_url_password("redis://localhost:6379/0") == "redis://localhost:6379/0"
+
+    def test_repeated_urls_are_memoized(self):
+        """Test a URL seen before is served from the cache"""
+        redact_url_password.cache_clear()
+        for _ in range(3):
+            redact_url_password("redis://:secret@redis-1:6379/0")
+
+        info = redact_url_password.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+
+@pytest.mark.unit
+class TestOrjsonFormatter:
+    """Test OrjsonFormatter output shape"""
+
+    def test_base_fields(self):
+        """Test that every record has ts, name, levelname and message"""
+        record = make_record()
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload == {
+            "ts": record.created,
+            "name": "app.main",
+            "levelname": "INFO",
+            "message": "HTTP request completed",
+        }
+
+    def test_message_args_are_interpolated(self):
+        """Test that %-style args are merged into the message"""
+        record = make_record("Request failed: %s", args=("timeout",), level=logging.ERROR)
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["message"] == "Request failed: timeout"
+        assert payload["levelname"] == "ERROR"
+
+    def test_extra_fields_included(self):
+        """Test that fields passed via extra={...} are emitted at the top level"""
+        record = make_record(request_id="abc1", method="GET", status_code=200, duration_ms=1.5)
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["request_id"] == "abc1"
+        assert payload["method"] == "GET"
+        assert payload["status_code"] == 200
+        assert payload["duration_ms"] == 1.5
+
+    def test_reserved_attributes_excluded(self):
+        """Test that standard LogRecord attributes are not dumped"""
+        payload = json.loads(OrjsonFormatter().format(make_record()))
+
+        for attr in ("msg", "args", "pathname", "lineno", "thread", "process"):
+            assert attr not in payload
+
+    def test_non_serializable_values_use_str(self):
+        """Test that values orjson cannot serialize fall back to str()"""
+        value = object()
+        record = make_record(when=datetime(2024, 1, 1), thing=value)
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["when"] == "2024-01-01T00:00:00"
+        assert payload["thing"] == str(value)
+
+    def test_non_string_dict_keys(self):
+        """Test that dicts with non-string keys are serialized"""
+        record = make_record(counts={200: 3, 404: 1})
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["counts"] == {"200": 3, "404": 1}
+
+    def test_exc_info_formatted(self):
+        """Test that exception info is emitted as a separate exc_info field"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("Request failed", level=logging.ERROR, exc_info=sys.exc_info())
+
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["message"] == "Request failed"
+        assert "Traceback" in payload["exc_info"]
+        assert "ValueError: boom" in payload["exc_info"]
+
+    def test_output_is_single_line(self):
+        """Test that the formatter output carries no trailing newline"""
+        output = OrjsonFormatter().format(make_record())
+
+        assert "\n" not in output
+
+
+@pytest.mark.unit
+class TestBufferedStreamHandler:
+    """Test BufferedStreamHandler behavior"""
+
+    def test_emit_writes_formatted_line(self):
+        """Test that emit writes the formatted record plus terminator"""
+        stream = io.StringIO()
+        handler = BufferedStreamHandler(stream)
+        handler.setFormatter(OrjsonFormatter())
+
+        handler.emit(make_record())
+
+        line = stream.getvalue()
+        assert line.endswith("\n")
+        assert json.loads(line)["message"] == "HTTP request completed"
+
+    def test_emit_does_not_flush(self):
+        """Test that emit leaves flushing to the caller"""
+        stream = CountingStream()
+        handler = BufferedStreamHandler(stream)
+        handler.setFormatter(OrjsonFormatter())
+
+        handler.emit(make_record())
+        handler.emit(make_record())
+
+        assert len(stream.getvalue().splitlines()) == 2
+        assert stream.flushes == 0
+
+
+@pytest.mark.unit
+class TestStructuredQueueHandler:
+    """Test StructuredQueueHandler record preparation"""
+
+    def enqueue(self, log_call):
+        log_queue = queue.SimpleQueue()
+        test_logger = logging.getLogger("tests.structured_queue")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.INFO)
+        handler = StructuredQueueHandler(log_queue)
+        test_logger.addHandler(handler)
+        try:
+            log_call(test_logger)
+        finally:
+            test_logger.removeHandler(handler)
+        return log_queue.get_nowait()
+
+    def test_args_merged_into_message(self):
+        """Test that args are merged so the record is safe to format later"""
+        record = self.enqueue(lambda log: log.warning("cache miss for %s", "user:1"))
+
+        assert record.msg == "cache miss for user:1"
+        assert record.args is None
+
+    def test_exc_info_preserved(self):
+        """Test that the traceback stays in exc_info instead of the message"""
+        def log_error(log):
+            try:
+                raise RuntimeError("boom")
+            except RuntimeError:
+                log.error("Request failed", exc_info=True)
+
+        record = self.enqueue(log_error)
+        payload = json.loads(OrjsonFormatter().format(record))
+
+        assert payload["message"] == "Request failed"
+        assert "RuntimeError: boom" in payload["exc_info"]
+
+    def test_extra_fields_preserved(self):
+        """Test that extra={...} fields survive preparation"""
+        record = self.enqueue(lambda log: log.info("done", extra={"request_id": "abc1"}))
+
+        assert json.loads(OrjsonFormatter().format(record))["request_id"] == "abc1"
+
+
+@pytest.mark.unit
+class TestBufferedQueueListener:
+    """Test BufferedQueueListener flushing"""
+
+    def make_listener(self, flush_interval):
+        log_queue = queue.SimpleQueue()
+        stream = CountingStream()
+        handler = BufferedStreamHandler(stream)
+        handler.setFormatter(OrjsonFormatter())
+        listener = BufferedQueueListener(log_queue, handler, flush_interval=flush_interval)
+        return log_queue, stream, listener
+
+    def test_flushes_when_idle(self):
+        """Test that handlers are flushed from the listener thread once the queue is idle"""
+        log_queue, stream, listener = self.make_listener(flush_interval=0.01)
+        listener.start()
+        try:
+            log_queue.put(make_record())
+            assert stream.flushed.wait(timeout=2)
+        finally:
+            listener.stop()
+
+        assert json.loads(stream.getvalue())["message"] == "HTTP request completed"
+
+    def test_batches_records_between_flushes(self):
+        """Test that a burst of records is written with a single flush"""
+        log_queue, stream, listener = self.make_listener(flush_interval=60)
+        for _ in range(50):
+            log_queue.put(make_record())
+
+        listener.start()
+        listener.stop()
+
+        assert len(stream.getvalue().splitlines()) == 50
+        assert stream.flushes == 1
+
+    def test_stop_flushes_pending_output(self):
+        """Test that stop() drains the queue and flushes handlers"""
+        log_queue, stream, listener = self.make_listener(flush_interval=60)
+        listener.start()
+        log_queue.put(make_record())
+
+        listener.stop()
+
+        assert stream.flushes >= 1
+        assert stream.getvalue().count("\n") == 1
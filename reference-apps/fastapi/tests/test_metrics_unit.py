@@ -0,0 +1,177 @@
+"""
+Unit tests for request metric label resolution in app.main
+
+Tests the route index used to map request paths to endpoint templates and
+the cached Prometheus label children.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry, Counter, Gauge, generate_latest
+
+from app import main
+from app.main import (
+    OTHER_METHOD,
+    UNMATCHED_ENDPOINT,
+    app,
+    index_routes,
+    iter_metrics,
+    metric_children,
+    request_counter,
+    resolve_endpoint,
+)
+
+
+@pytest.fixture
+def indexed_app():
+    """Index the application's routes and restore the index afterwards"""
+    index_routes(app.routes)
+    yield app
+    index_routes(app.routes)
+
+
+@pytest.mark.unit
+class TestResolveEndpoint:
+    """Test resolve_endpoint path-to-template mapping"""
+
+    def test_templated_route_uses_template(self, indexed_app):
+        """Test that a path with parameters resolves to its route template"""
+        assert resolve_endpoint("/redis/nodes/redis-1/info") == "/redis/nodes/{node_name}/info"
+
+    def test_static_route_uses_dict_lookup(self, indexed_app):
+        """Test that static paths are indexed for a direct lookup"""
+        assert main._STATIC_ENDPOINTS["/redis/cluster/nodes"] == "/redis/cluster/nodes"
+        assert resolve_endpoint("/redis/cluster/nodes") == "/redis/cluster/nodes"
+        assert all(route.path != "/redis/cluster/nodes" for route in main._TEMPLATED_ROUTES)
+
+    def test_non_api_routes_indexed(self, indexed_app):
+        """Test that framework routes such as /openapi.json keep their own label"""
+        assert resolve_endpoint("/openapi.json") == "/openapi.json"
+
+    def test_unmatched_path_collapses_to_single_label(self, indexed_app):
+        """Test that unknown paths do not create new label values"""
+        assert resolve_endpoint("/wp-admin/setup.php") == UNMATCHED_ENDPOINT
+        assert resolve_endpoint("/redis/nodes/redis-1/info/extra") == UNMATCHED_ENDPOINT
+
+    def test_registration_order_preserved(self):
+        """Test that a static route registered after a matching template resolves to the template"""
+        ordered_app = FastAPI()
+
+        @ordered_app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {}
+
+        @ordered_app.get("/items/special")
+        async def get_special():
+            return {}
+
+        @ordered_app.get("/other")
+        async def get_other():
+            return {}
+
+        try:
+            index_routes(ordered_app.routes)
+
+            assert resolve_endpoint("/items/special") == "/items/{item_id}"
+            assert resolve_endpoint("/other") == "/other"
+        finally:
+            index_routes(app.routes)
+
+
+@pytest.mark.unit
+class TestMetricChildren:
+    """Test cached Prometheus label children"""
+
+    def test_metric_children_cached(self):
+        """Test that label children are bound once per method and endpoint"""
+        first = metric_children("GET", "/test/cached")
+        second = metric_children("GET", "/test/cached")
+
+        assert first is second
+        assert first is not metric_children("POST", "/test/cached")
+
+    def test_request_counter_cached_per_status(self):
+        """Test that counter children are cached per status code"""
+        ok = request_counter("GET", "/test/cached", 200)
+
+        assert request_counter("GET", "/test/cached", 200) is ok
+        assert request_counter("GET", "/test/cached", 404) is not ok
+
+    def test_status_counters_share_endpoint_entry(self):
+        """Test that status counters live in the endpoint's cached tuple"""
+        in_progress, duration, status_counters = metric_children("GET", "/test/grouped")
+
+        counter = request_counter("GET", "/test/grouped", 201)
+
+        assert status_counters[201] is counter
+        assert metric_children("GET", "/test/grouped")[2] is status_counters
+
+    def test_unmatched_requests_share_one_label(self, client):
+        """Test that requests for unknown paths are counted under one endpoint label"""
+        before = len(main._METRIC_CACHE)
+
+        client.get("/no/such/path-1")
+        client.get("/no/such/path-2")
+
+        assert ("GET", "/no/such/path-1") not in main._METRIC_CACHE
+        assert ("GET", UNMATCHED_ENDPOINT) in main._METRIC_CACHE
+        assert len(main._METRIC_CACHE) <= before + 1
+
+    def test_unknown_methods_share_one_label(self, client):
+        """Test that non-standard request methods are counted under one method label"""
+        client.request("PROPFIND", "/health/")
+        client.request("BREW", "/health/")
+
+        assert ("PROPFIND", "/health/") not in main._METRIC_CACHE
+        assert ("BREW", "/health/") not in main._METRIC_CACHE
+        assert (OTHER_METHOD, "/health/") in main._METRIC_CACHE
+
+
+@pytest.mark.unit
+class TestIterMetrics:
+    """Test streamed /metrics output"""
+
+    def test_matches_generate_latest(self):
+        """Test that the chunks join to the same text as generate_latest()"""
+        registry = CollectorRegistry()
+        Counter("test_requests", "Requests", ["status"], registry=registry).labels("200").inc()
+        Gauge("test_in_progress", "In progress", registry=registry).set(3)
+
+        chunks = list(iter_metrics(registry))
+
+        assert len(chunks) == 2
+        assert b"".join(chunks) == generate_latest(registry)
+
+    def test_metrics_endpoint_streams_exposition(self, client):
+        """Test that /metrics returns Prometheus text including request metrics"""
+        client.get("/health/")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert b"http_requests_total" in response.content
+
+
+@pytest.mark.unit
+class TestAccessLog:
+    """Test the access log emitted by ObservabilityMiddleware"""
+
+    def test_access_log_skipped_above_info(self, client):
+        """Test that no access log call is made when INFO is disabled"""
+        with patch.object(main.logger, "isEnabledFor", return_value=False), \
+                patch.object(main.logger, "info") as log_info:
+            response = client.get("/")
+
+        assert response.status_code
+        log_info.assert_not_called()
+
+    def test_access_log_emitted_at_info(self, client):
+        """Test that API requests are logged at INFO"""
+        with patch.object(main.logger, "info") as log_info:
+            client.get("/")
+
+        log_info.assert_called_once()
+        assert log_info.call_args.kwargs["extra"]["path"] == "/"
@@ -95,6 +95,150 @@ class TestRedisClusterNodes:
                 assert data["nodes"][1]["master_id"] == "abc123"
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClusterNodesParsing:
+    """Test CLUSTER NODES parsing in get_cluster_nodes, called directly"""
+
+    async def get_nodes(self, raw):
+        """Run get_cluster_nodes against a mocked CLUSTER NODES reply"""
+        from app.routers.redis_cluster import get_cluster_nodes
+
+        mock_client = AsyncMock()
+        mock_client.execute_command.return_value = raw
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.redis_cluster.redis.Redis', return_value=mock_client):
+            return await get_cluster_nodes()
+
+    async def test_slot_ranges_and_counts(self):
+        """Test ranges, single slots and migrating slots are parsed"""
+        data = await self.get_nodes(
+            "abc123 10.0.0.1:6379@16379 myself,master - 0 1234567890 1 connected 0-5460 5470 [5461->-def456]\n"
+            "def456 10.0.0.2:6379@16379 master - 0 1234567891 2 connected 5461-10922\n"
+            "replica1 10.0.0.4:6379@16379 slave abc123 0 1234567893 1 connected\n"
+        )
+
+        assert data["status"] == "success"
+        master, other, replica = data["nodes"]
+        assert master["slot_ranges"] == [{"start": 0, "end": 5460}, {"start": 5470, "end": 5470}]
+        assert master["slots_count"] == 5462
+        assert master["flags"] == ["myself", "master"]
+        assert master["host"] == "10.0.0.1"
+        assert master["port"] == 6379
+        assert other["slots_count"] == 5462
+        assert replica["slots_count"] == 0
+        assert replica["slot_ranges"] == []
+
+    async def test_roles(self):
+        """Test master/slave flags map to roles"""
+        data = await self.get_nodes(
+            "a 10.0.0.1:6379@16379 myself,master - 0 0 1 connected 0-16383\n"
+            "b 10.0.0.2:6379@16379 slave a 0 0 1 connected\n"
+            "c 10.0.0.3:6379@16379 handshake - 0 0 0 connected\n"
+        )
+
+        assert [node["role"] for node in data["nodes"]] == ["master", "replica", "unknown"]
+        assert data["nodes"][1]["master_id"] == "a"
+        assert data["nodes"][0]["master_id"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClusterInfoParsing:
+    """Test CLUSTER INFO parsing in get_cluster_info, called directly"""
+
+    async def test_fields_parsed_and_typed(self):
+        """Test CRLF lines are split into fields with numeric values as ints"""
+        from app.routers.redis_cluster import get_cluster_info
+
+        mock_client = AsyncMock()
+        mock_client.execute_command.return_value = (
+            "cluster_state:ok\r\n"
+            "cluster_slots_assigned:16384\r\n"
+            "cluster_current_epoch:6\r\n"
+            "cluster_stats_messages_ping_sent:-1\r\n"
+            "\r\n"
+        )
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.redis_cluster.redis.Redis', return_value=mock_client):
+            data = await get_cluster_info()
+
+        assert data == {
+            "status": "success",
+            "cluster_info": {
+                "cluster_state": "ok",
+                "cluster_slots_assigned": 16384,
+                "cluster_current_epoch": 6,
+                "cluster_stats_messages_ping_sent": -1,
+            }
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClusterSlotsCache:
+    """Test get_cluster_slots parsing and its short-lived cache, called directly"""
+
+    @pytest.fixture(autouse=True)
+    def reset_slots_cache(self):
+        """Start every test without a cached slot distribution"""
+        with patch('app.routers.redis_cluster._slots_response', None):
+            yield
+
+    @staticmethod
+    def make_client(reply):
+        """Build a mock Redis client answering CLUSTER SLOTS with reply"""
+        mock_client = AsyncMock()
+        mock_client.execute_command.return_value = reply
+        return mock_client
+
+    async def test_slots_parsed_and_reused(self):
+        """Test decoded replies are parsed and served again from the cache"""
+        from app.routers.redis_cluster import get_cluster_slots
+
+        mock_client = self.make_client([
+            [0, 8191, ["10.0.0.1", 6379, "abc123"], ["10.0.0.4", 6379, "replica1"]],
+            [8192, 16383, ["10.0.0.2", 6379, "def456"]],
+        ])
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(return_value={"password": "p"})), \
+                patch('app.routers.redis_cluster.redis.Redis', return_value=mock_client) as mock_redis_class:
+            first = await get_cluster_slots()
+            second = await get_cluster_slots()
+
+        assert first is second
+        assert first["total_slots"] == 16384
+        assert first["slot_distribution"][0]["master"] == {"host": "10.0.0.1", "port": 6379, "node_id": "abc123"}
+        assert first["slot_distribution"][0]["replicas"] == [{"host": "10.0.0.4", "port": 6379, "node_id": "replica1"}]
+        assert first["slot_distribution"][1]["replicas"] == []
+        assert mock_redis_class.call_args.kwargs["decode_responses"] is True
+        mock_client.execute_command.assert_awaited_once_with("CLUSTER", "SLOTS")
+
+    async def test_expired_cache_refetched(self):
+        """Test the distribution is read again after SLOTS_CACHE_TTL"""
+        from app.routers import redis_cluster
+
+        mock_client = self.make_client([[0, 16383, ["10.0.0.1", 6379, "abc123"]]])
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.redis_cluster.redis.Redis', return_value=mock_client):
+            await redis_cluster.get_cluster_slots()
+            redis_cluster._slots_read_at -= redis_cluster.SLOTS_CACHE_TTL
+            await redis_cluster.get_cluster_slots()
+
+        assert mock_client.execute_command.await_count == 2
+
+    async def test_errors_not_cached(self):
+        """Test a failed read is retried on the next request"""
+        from app.routers.redis_cluster import get_cluster_slots
+
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(side_effect=Exception("Vault down"))):
+            assert (await get_cluster_slots())["status"] == "error"
+
+        mock_client = self.make_client([[0, 16383, ["10.0.0.1", 6379, "abc123"]]])
+        with patch('app.routers.redis_cluster.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.redis_cluster.redis.Redis', return_value=mock_client):
+            assert (await get_cluster_slots())["status"] == "success"
+
+
 @pytest.mark.unit
 @pytest.mark.skip(reason="Integration test requires real infrastructure or alternative testing approach (TestClient incompatible with complex middleware stack)")
 class TestRedisClusterSlots:
@@ -115,9 +259,9 @@ class TestRedisClusterSlots:
 
                 mock_client = AsyncMock()
                 mock_client.execute_command.return_value = [
-                    [0, 5460, [b"127.0.0.1", 6379, b"abc123"]],
-                    [5461, 10922, [b"127.0.0.1", 6380, b"def456"]],
-                    [10923, 16383, [b"127.0.0.1", 6381, b"ghi789"]]
+                    [0, 5460, ["127.0.0.1", 6379, "abc123"]],
+                    [5461, 10922, ["127.0.0.1", 6380, "def456"]],
+                    [10923, 16383, ["127.0.0.1", 6381, "ghi789"]]
                 ]
                 mock_client.close = AsyncMock()
                 mock_redis_class.return_value = mock_client
@@ -140,7 +284,7 @@ class TestRedisClusterSlots:
 
                 mock_client = AsyncMock()
                 mock_client.execute_command.return_value = [
-                    [0, 5460, [b"127.0.0.1", 6379, b"abc123"], [b"127.0.0.1", 6384, b"replica1"]]
+                    [0, 5460, ["127.0.0.1", 6379, "abc123"], ["127.0.0.1", 6384, "replica1"]]
                 ]
                 mock_client.close = AsyncMock()
                 mock_redis_class.return_value = mock_client
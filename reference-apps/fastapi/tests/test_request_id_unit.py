@@ -0,0 +1,65 @@
+"""
+Unit tests for request ID generation in app.main
+
+Tests the per-process prefix plus counter scheme and its reset after fork.
+"""
+
+import os
+import re
+
+import pytest
+
+from app.main import generate_request_id, reset_request_ids
+
+
+@pytest.mark.unit
+class TestRequestIds:
+    """Test generate_request_id and reset_request_ids"""
+
+    def test_format(self):
+        """Test that IDs are a 16-char hex prefix followed by a hex counter"""
+        request_id = generate_request_id()
+
+        assert re.fullmatch(r"[0-9a-f]{17,}", request_id)
+
+    def test_shared_prefix_within_process(self):
+        """Test that consecutive IDs share the process prefix"""
+        first, second = generate_request_id(), generate_request_id()
+
+        assert first[:16] == second[:16]
+        assert int(second[16:], 16) == int(first[16:], 16) + 1
+
+    def test_unique_within_process(self):
+        """Test that IDs do not repeat"""
+        ids = {generate_request_id() for _ in range(10000)}
+
+        assert len(ids) == 10000
+
+    def test_reset_draws_new_prefix(self):
+        """Test that a reset changes the prefix and restarts the counter"""
+        before = generate_request_id()
+
+        reset_request_ids()
+        after = generate_request_id()
+
+        assert after[:16] != before[:16]
+        assert after[16:] == "0"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_gets_own_prefix(self):
+        """Test that a forked worker does not reuse the parent's prefix"""
+        parent_id = generate_request_id()
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            os.close(read_fd)
+            os.write(write_fd, generate_request_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert child_id[:16] != parent_id[:16]
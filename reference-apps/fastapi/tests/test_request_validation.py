@@ -8,7 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
-from app.main import app
+from app.main import MAX_REQUEST_SIZE, app, validate_request
 
 
 @pytest.mark.unit
@@ -88,6 +88,26 @@ class TestContentTypeValidation:
         # May reject invalid content type or return 405 if method not allowed
         assert response.status_code in [400, 405, 415]
 
+    def test_multipart_with_boundary_accepted(self, client):
+        """Test that media type parameters such as boundary are ignored"""
+        response = client.post(
+            "/examples/vault/secret/test",
+            content=b"--x--",
+            headers={"Content-Type": "multipart/form-data; boundary=x"}
+        )
+
+        assert response.status_code != 415
+
+    def test_content_type_prefix_rejected(self, client):
+        """Test that a media type merely starting with an allowed one is rejected"""
+        response = client.post(
+            "/examples/vault/secret/test",
+            content=b"{}",
+            headers={"Content-Type": "application/jsonp"}
+        )
+
+        assert response.status_code == 415
+
 
 @pytest.mark.unit
 class TestRequestSizeValidation:
@@ -280,3 +300,69 @@ class TestValidationMiddlewareIntegration:
 
             # Should succeed or return proper error
             assert response.status_code in [200, 404]
+
+
+@pytest.mark.unit
+class TestValidateRequest:
+    """Test validate_request against raw ASGI headers"""
+
+    def test_safe_method_skipped(self):
+        """Test that GET requests are never validated"""
+        headers = [(b"content-length", str(MAX_REQUEST_SIZE + 1).encode())]
+
+        assert validate_request("GET", "/examples/cache/key", headers) is None
+
+    def test_exempt_paths_skipped(self):
+        """Test that health and docs paths are never validated"""
+        headers = [(b"content-length", b"10"), (b"content-type", b"application/xml")]
+
+        assert validate_request("POST", "/health/all", headers) is None
+        assert validate_request("POST", "/openapi.json", headers) is None
+
+    def test_missing_content_type(self):
+        """Test that a body without content-type returns 400"""
+        response = validate_request("POST", "/examples/cache/key", [(b"content-length", b"2")])
+
+        assert response.status_code == 400
+
+    def test_allowed_content_type(self):
+        """Test that parameters are stripped before the content-type check"""
+        headers = [(b"content-type", b"application/json; charset=utf-8"), (b"content-length", b"2")]
+
+        assert validate_request("PUT", "/examples/cache/key", headers) is None
+
+    def test_unsupported_content_type(self):
+        """Test that an unsupported content-type returns 415"""
+        headers = [(b"content-type", b"application/xml"), (b"content-length", b"2")]
+
+        assert validate_request("POST", "/examples/cache/key", headers).status_code == 415
+
+    def test_oversized_request(self):
+        """Test that a content-length above the limit returns 413"""
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(MAX_REQUEST_SIZE + 1).encode()),
+        ]
+
+        assert validate_request("DELETE", "/examples/cache/key", headers).status_code == 413
+
+    def test_invalid_content_length(self):
+        """Test that a non-numeric content-length returns 400 instead of raising"""
+        headers = [(b"content-type", b"application/json"), (b"content-length", b"ten")]
+
+        assert validate_request("POST", "/examples/cache/key", headers).status_code == 400
+
+    def test_empty_body_skips_content_type_check(self):
+        """Test that a zero content-length needs no content-type"""
+        assert validate_request("POST", "/examples/cache/key", [(b"content-length", b"0")]) is None
+
+    def test_rejection_carries_request_id(self, client):
+        """Test that validation errors still get an X-Request-ID header"""
+        response = client.post(
+            "/examples/vault/secret/test",
+            content=b"<a/>",
+            headers={"Content-Type": "application/xml"}
+        )
+
+        assert response.status_code == 415
+        assert response.headers["X-Request-ID"]
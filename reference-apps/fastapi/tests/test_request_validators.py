@@ -55,6 +55,12 @@ class TestServiceNameParam:
         with pytest.raises(ValidationError):
             ServiceNameParam(name="")
 
+    def test_service_name_surrounding_whitespace_rejected(self):
+        """Test padded service names are rejected rather than stripped"""
+        for name in [" postgres", "postgres ", "postgres\n"]:
+            with pytest.raises(ValidationError):
+                ServiceNameParam(name=name)
+
 
 @pytest.mark.unit
 class TestCacheKeyParam:
@@ -140,6 +146,11 @@ class TestCacheSetRequest:
         assert request.value == "test data"
         assert request.ttl is None
 
+    def test_cache_value_whitespace_stripped(self):
+        """Test free-form cache values are still stripped"""
+        request = CacheSetRequest(value="  test data  ")
+        assert request.value == "test data"
+
     def test_cache_value_too_long(self):
         """Test cache value exceeds max size"""
         long_value = "a" * 10001  # Max is 10000
@@ -197,6 +208,26 @@ class TestMessagePublishRequest:
         request = MessagePublishRequest(message=acceptable_message)
         assert request.message == acceptable_message
 
+    def test_message_size_counts_encoded_bytes(self):
+        """Test message size is measured in UTF-8 encoded bytes"""
+        # 400k two-byte characters encode to 800k bytes, under the limit
+        request = MessagePublishRequest(message={"data": "\u00e9" * 400_000})
+        assert len(request.message["data"]) == 400_000
+
+        # 600k two-byte characters encode to 1.2M bytes, over the limit
+        with pytest.raises(ValidationError) as exc_info:
+            MessagePublishRequest(message={"data": "\u00e9" * 600_000})
+        assert "exceeds 1mb limit" in str(exc_info.value).lower()
+
+    def test_message_with_big_integer(self):
+        """Test integers beyond 64 bits are accepted and still size-checked"""
+        request = MessagePublishRequest.model_validate_json('{"message": {"n": 100000000000000000000}}')
+        assert request.message == {"n": 10**20}
+
+        with pytest.raises(ValidationError) as exc_info:
+            MessagePublishRequest(message={"n": 10**20, "data": "x" * 1_000_001})
+        assert "exceeds 1mb limit" in str(exc_info.value).lower()
+
 
 @pytest.mark.unit
 class TestSecretKeyParam:
@@ -0,0 +1,37 @@
+"""
+Unit tests for app.utils.responses
+
+Tests the orjson-backed JSON response class.
+"""
+
+import json
+
+import pytest
+
+from app.utils.responses import OrjsonResponse
+
+
+@pytest.mark.unit
+class TestOrjsonResponse:
+    """Test OrjsonResponse rendering"""
+
+    def test_renders_compact_json(self):
+        """Test that content is rendered as compact JSON bytes"""
+        response = OrjsonResponse({"error": "Unsupported Media Type", "allowed_types": ["application/json"]})
+
+        assert response.body == b'{"error":"Unsupported Media Type","allowed_types":["application/json"]}'
+        assert response.media_type == "application/json"
+
+    def test_status_code_and_headers(self):
+        """Test that status code and content headers are set like JSONResponse"""
+        response = OrjsonResponse(status_code=413, content={"max_size_mb": 10.0})
+
+        assert response.status_code == 413
+        assert response.headers["content-type"] == "application/json"
+        assert int(response.headers["content-length"]) == len(response.body)
+
+    def test_non_string_keys(self):
+        """Test that dicts keyed by ints are serialized"""
+        response = OrjsonResponse({200: 3})
+
+        assert json.loads(response.body) == {"200": 3}
@@ -4,6 +4,7 @@ Direct unit tests for router functions without TestClient
 Tests router endpoint logic directly by calling async functions with mocked dependencies.
 """
 
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
@@ -76,8 +77,9 @@ class TestDatabaseDemoRouters:
         """Test PostgreSQL query"""
         from app.routers.database_demo import postgres_example
 
-        with patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
-            with patch('app.routers.database_demo.asyncpg.connect') as mock_connect:
+        with patch('app.routers.database_demo._pg_pool', None), \
+                patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
+            with patch('app.routers.database_demo.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_vault.return_value = {
                     "user": "test", 
                     "password": "test",
@@ -86,35 +88,47 @@ class TestDatabaseDemoRouters:
 
                 mock_conn = AsyncMock()
                 mock_conn.fetchval.return_value = "2024-01-01 00:00:00"
-                mock_conn.close = AsyncMock()
-                mock_connect.return_value = mock_conn
+
+                mock_acquire = MagicMock()
+                mock_acquire.__aenter__ = AsyncMock(return_value=mock_conn)
+                mock_acquire.__aexit__ = AsyncMock(return_value=None)
+
+                mock_pool = MagicMock()
+                mock_pool.acquire.return_value = mock_acquire
+                mock_create_pool.return_value = mock_pool
 
                 result = await postgres_example()
+                await postgres_example()
 
                 assert result["database"] == "PostgreSQL"
                 assert "result" in result
+                # Pool (and Vault lookup) are created once and reused
+                mock_create_pool.assert_called_once()
+                mock_vault.assert_called_once_with("postgres")
+                assert mock_pool.acquire.call_count == 2
 
     async def test_postgres_query_failure(self):
         """Test PostgreSQL query failure"""
         from app.routers.database_demo import postgres_example
 
-        with patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
-            with patch('app.routers.database_demo.asyncpg.connect') as mock_connect:
+        with patch('app.routers.database_demo._pg_pool', None), \
+                patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
+            with patch('app.routers.database_demo.asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_vault.return_value = {"user": "test", "password": "test", "database": "test"}
-                mock_connect.side_effect = Exception("Connection failed")
+                mock_create_pool.side_effect = Exception("Connection failed")
 
                 with pytest.raises(HTTPException) as exc_info:
                     await postgres_example()
 
                 assert exc_info.value.status_code == 500
 
-    @pytest.mark.skip(reason="Needs better async mocking for aiomysql")
     async def test_mysql_query_success(self):
         """Test MySQL query"""
         from app.routers.database_demo import mysql_example
 
-        with patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
-            with patch('app.routers.database_demo.aiomysql.connect') as mock_connect:
+        with patch('app.routers.database_demo._mysql_pool', None), \
+                patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
+            with patch('app.routers.database_demo.aiomysql.create_pool', new_callable=AsyncMock) as mock_create_pool:
                 mock_vault.return_value = {
                     "user": "test",
                     "password": "test",
@@ -125,23 +139,31 @@ class TestDatabaseDemoRouters:
                 mock_cursor.execute = AsyncMock()
                 mock_cursor.fetchone.return_value = ("2024-01-01 00:00:00",)
                 mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-                mock_cursor.__aexit__ = AsyncMock()
+                mock_cursor.__aexit__ = AsyncMock(return_value=None)
 
                 mock_conn = MagicMock()
                 mock_conn.cursor.return_value = mock_cursor
-                mock_conn.close = MagicMock()
-                mock_connect.return_value = mock_conn
+
+                mock_acquire = MagicMock()
+                mock_acquire.__aenter__ = AsyncMock(return_value=mock_conn)
+                mock_acquire.__aexit__ = AsyncMock(return_value=None)
+
+                mock_pool = MagicMock()
+                mock_pool.acquire.return_value = mock_acquire
+                mock_create_pool.return_value = mock_pool
 
                 result = await mysql_example()
 
                 assert result["database"] == "MySQL"
-                assert "result" in result
+                assert result["result"] == "2024-01-01 00:00:00"
+                mock_cursor.execute.assert_awaited_once_with("SELECT NOW()")
 
     async def test_mongodb_query_success(self):
         """Test MongoDB query"""
         from app.routers.database_demo import mongodb_example
 
-        with patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
+        with patch('app.routers.database_demo._mongo_client', None), \
+                patch('app.routers.database_demo.vault_client.get_secret') as mock_vault:
             with patch('app.routers.database_demo.motor.motor_asyncio.AsyncIOMotorClient') as mock_client_class:
                 mock_vault.return_value = {
                     "user": "test",
@@ -154,14 +176,40 @@ class TestDatabaseDemoRouters:
 
                 mock_client = MagicMock()
                 mock_client.__getitem__.return_value = mock_db
-                mock_client.close = MagicMock()
                 mock_client_class.return_value = mock_client
 
                 result = await mongodb_example()
+                await mongodb_example()
 
                 assert result["database"] == "MongoDB"
                 assert result["count"] == 2
                 assert len(result["collections"]) == 2
+                mock_client_class.assert_called_once()
+                mock_client.__getitem__.assert_called_with("test_db")
+                mock_client.close.assert_not_called()
+
+    async def test_close_database_pools(self):
+        """Test that closing releases the shared pools so the next call reconnects"""
+        from app.routers import database_demo
+
+        mock_pg_pool = MagicMock()
+        mock_pg_pool.close = AsyncMock()
+        mock_mysql_pool = MagicMock()
+        mock_mysql_pool.wait_closed = AsyncMock()
+        mock_mongo_client = MagicMock()
+
+        with patch('app.routers.database_demo._pg_pool', mock_pg_pool), \
+                patch('app.routers.database_demo._mysql_pool', mock_mysql_pool), \
+                patch('app.routers.database_demo._mongo_client', mock_mongo_client):
+            await database_demo.close_database_pools()
+
+            assert database_demo._pg_pool is None
+            assert database_demo._mysql_pool is None
+            assert database_demo._mongo_client is None
+            mock_pg_pool.close.assert_awaited_once()
+            mock_mysql_pool.close.assert_called_once()
+            mock_mysql_pool.wait_closed.assert_awaited_once()
+            mock_mongo_client.close.assert_called_once()
 
 
 @pytest.mark.unit
@@ -169,6 +217,25 @@ class TestDatabaseDemoRouters:
 class TestMessagingDemoRouters:
     """Test messaging demo router functions directly"""
 
+    @pytest.fixture(autouse=True)
+    def reset_connection(self):
+        """Start every test without a shared connection or channel pool"""
+        with patch('app.routers.messaging_demo._connection', None), \
+                patch('app.routers.messaging_demo._channel_pool', None), \
+                patch('app.routers.messaging_demo._declared_queues', set()):
+            yield
+
+    @staticmethod
+    def make_channel_pool(channel):
+        """Build a mock channel pool whose acquire() yields channel"""
+        acquire = MagicMock()
+        acquire.__aenter__ = AsyncMock(return_value=channel)
+        acquire.__aexit__ = AsyncMock(return_value=None)
+
+        pool = MagicMock()
+        pool.acquire.return_value = acquire
+        return pool
+
     @pytest.mark.skip(reason="Needs better async mocking for aio_pika")
     async def test_publish_message_success(self):
         """Test publishing message to RabbitMQ"""
@@ -215,6 +282,174 @@ class TestMessagingDemoRouters:
 
                 assert exc_info.value.status_code == 500
 
+    async def test_publish_message_serializes_once(self):
+        """Test the published body is the single orjson encoding of the message"""
+        from app.routers.messaging_demo import publish_message
+
+        message = {"event": "created", "id": 1}
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock()
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock,
+                      return_value=MagicMock(reconnect_callbacks=MagicMock())), \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)), \
+                patch('app.routers.messaging_demo.aio_pika.Message') as mock_message_class, \
+                patch('app.routers.messaging_demo.orjson.dumps', wraps=orjson.dumps) as mock_dumps:
+            result = await publish_message("events", message)
+
+        assert result.action == "published"
+        mock_dumps.assert_called_once_with(message)
+        mock_message_class.assert_called_once_with(body=b'{"event":"created","id":1}')
+        mock_channel.default_exchange.publish.assert_awaited_once()
+
+    async def test_publish_message_with_big_integer(self):
+        """Test integers beyond 64 bits are published via the stdlib encoder"""
+        from app.routers.messaging_demo import publish_message
+
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock()
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock,
+                      return_value=MagicMock(reconnect_callbacks=MagicMock())), \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)), \
+                patch('app.routers.messaging_demo.aio_pika.Message') as mock_message_class:
+            result = await publish_message("events", {"n": 10**20})
+
+        assert result.action == "published"
+        mock_message_class.assert_called_once_with(body=b'{"n": 100000000000000000000}')
+
+    async def test_publish_reuses_connection_and_channels(self):
+        """Test publishes share one connection and draw channels from one pool"""
+        from app.routers.messaging_demo import publish_message
+
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock()
+        mock_connection = MagicMock(close=AsyncMock())
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock) as mock_connect, \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)) as mock_pool_class, \
+                patch('app.routers.messaging_demo.aio_pika.Message'):
+            mock_connect.return_value = mock_connection
+
+            await publish_message("events", {"n": 1})
+            await publish_message("events", {"n": 2})
+
+        mock_connect.assert_awaited_once()
+        mock_pool_class.assert_called_once()
+        channel_factory = mock_pool_class.call_args.args[0]
+        assert channel_factory.func is mock_connection.channel
+        assert channel_factory.keywords == {"on_return_raises": True}
+        assert mock_pool_class.call_args.kwargs == {"max_size": 16}
+        assert mock_channel.default_exchange.publish.await_count == 2
+        mock_connection.close.assert_not_called()
+
+    async def test_queue_declared_once_per_connection(self):
+        """Test repeat publishes to a queue skip queue.declare until reconnect"""
+        from app.routers import messaging_demo
+
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock()
+        mock_connection = MagicMock()
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock, return_value=mock_connection), \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)), \
+                patch('app.routers.messaging_demo.aio_pika.Message'):
+            await messaging_demo.publish_message("events", {"n": 1})
+            await messaging_demo.publish_message("events", {"n": 2})
+            await messaging_demo.publish_message("audit", {"n": 3})
+            assert mock_channel.declare_queue.await_count == 2
+
+            # A reconnect may land on a broker without the queues
+            mock_connection.reconnect_callbacks.add.assert_called_once_with(
+                messaging_demo.forget_declared_queues
+            )
+            messaging_demo.forget_declared_queues(mock_connection)
+            await messaging_demo.publish_message("events", {"n": 4})
+
+        assert mock_channel.declare_queue.await_count == 3
+        assert mock_channel.default_exchange.publish.await_count == 4
+
+    async def test_queue_deleted_out_of_band_is_declared_again(self):
+        """Test a publish returned as unroutable declares the queue and publishes again"""
+        from aio_pika.exceptions import DeliveryError
+        from app.routers import messaging_demo
+
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock(
+            side_effect=[None, DeliveryError(None, None), None]
+        )
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock,
+                      return_value=MagicMock(reconnect_callbacks=MagicMock())), \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)), \
+                patch('app.routers.messaging_demo.aio_pika.Message'):
+            await messaging_demo.publish_message("events", {"n": 1})
+            # The queue is deleted on the broker; this publish comes back
+            result = await messaging_demo.publish_message("events", {"n": 2})
+
+        assert result.action == "published"
+        assert mock_channel.declare_queue.await_count == 2
+        assert mock_channel.default_exchange.publish.await_count == 3
+
+    async def test_failed_publish_forgets_declared_queue(self):
+        """Test a publish failure makes the next publish declare the queue again"""
+        from app.routers import messaging_demo
+
+        mock_channel = MagicMock()
+        mock_channel.declare_queue = AsyncMock()
+        mock_channel.default_exchange.publish = AsyncMock(side_effect=[Exception("channel closed"), None])
+
+        with patch('app.routers.messaging_demo.vault_client.get_secret', AsyncMock(return_value={})), \
+                patch('app.routers.messaging_demo.aio_pika.connect_robust', new_callable=AsyncMock,
+                      return_value=MagicMock(reconnect_callbacks=MagicMock())), \
+                patch('app.routers.messaging_demo.Pool', return_value=self.make_channel_pool(mock_channel)), \
+                patch('app.routers.messaging_demo.aio_pika.Message'):
+            with pytest.raises(HTTPException) as exc_info:
+                await messaging_demo.publish_message("events", {"n": 1})
+            assert exc_info.value.status_code == 500
+            assert "events" not in messaging_demo._declared_queues
+
+            await messaging_demo.publish_message("events", {"n": 2})
+
+        assert mock_channel.declare_queue.await_count == 2
+
+    async def test_close_rabbitmq_connection(self):
+        """Test the channel pool and connection are closed and forgotten"""
+        from app.routers import messaging_demo
+
+        mock_pool = MagicMock(close=AsyncMock())
+        mock_connection = MagicMock(close=AsyncMock())
+        messaging_demo._channel_pool = mock_pool
+        messaging_demo._connection = mock_connection
+
+        await messaging_demo.close_rabbitmq_connection()
+
+        mock_pool.close.assert_awaited_once()
+        mock_connection.close.assert_awaited_once()
+        assert messaging_demo._channel_pool is None
+        assert messaging_demo._connection is None
+
+    async def test_publish_message_too_large(self):
+        """Test oversized messages are rejected before connecting"""
+        from app.routers.messaging_demo import publish_message
+
+        with patch('app.routers.messaging_demo.aio_pika.connect_robust') as mock_connect:
+            with pytest.raises(HTTPException) as exc_info:
+                await publish_message("events", {"data": "x" * 1_000_000})
+
+        assert exc_info.value.status_code == 413
+        mock_connect.assert_not_called()
+
     @pytest.mark.skip(reason="Needs better async mocking for message consumption")
     async def test_consume_messages_success(self):
         """Test consuming messages from RabbitMQ"""
@@ -313,6 +548,25 @@ class TestRedisClusterRouters:
         assert "Invalid node name" in result["error"]
 
 
+@pytest.mark.unit
+class TestVaultDemoMasking:
+    """Test which secret fields the Vault demo masks"""
+
+    @pytest.mark.parametrize("key", ["password", "db_password", "token", "secret_id", "api_key"])
+    def test_sensitive_keys(self, key):
+        """Test credential-like field names are masked"""
+        from app.routers.vault_demo import is_sensitive_key
+
+        assert is_sensitive_key(key)
+
+    @pytest.mark.parametrize("key", ["user", "host", "port", "database"])
+    def test_plain_keys(self, key):
+        """Test ordinary field names are returned as-is"""
+        from app.routers.vault_demo import is_sensitive_key
+
+        assert not is_sensitive_key(key)
+
+
 @pytest.mark.skip(reason="Cannot test route handlers directly due to cache decorators - need TestClient")
 @pytest.mark.unit
 @pytest.mark.asyncio
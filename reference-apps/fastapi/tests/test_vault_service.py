@@ -4,6 +4,8 @@ Unit tests for Vault service with exception handling
 Tests the VaultClient class and its error handling behavior.
 """
 
+import asyncio
+
 import pytest
 import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -175,6 +177,219 @@ class TestVaultClientGetSecret:
             assert "unexpected error" in str(exc_info.value).lower()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVaultClientSecretCache:
+    """Test the in-process secret cache in VaultClient.get_secret"""
+
+    @pytest.fixture
+    def vault_client(self):
+        """Create VaultClient instance"""
+        return VaultClient()
+
+    async def test_repeated_lookups_fetch_once(self, vault_client, mock_httpx_client):
+        """Test a cached secret is served without another Vault request"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            first = await vault_client.get_secret("postgres")
+            second = await vault_client.get_secret("postgres")
+            key_only = await vault_client.get_secret("postgres", key="key")
+
+        assert first == second == {"key": "value"}
+        assert key_only == {"key": "value"}
+        assert mock_httpx_client.get.await_count == 1
+
+    async def test_returned_secret_is_a_copy(self, vault_client, mock_httpx_client):
+        """Test callers cannot modify the cached secret"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            (await vault_client.get_secret("postgres"))["key"] = "changed"
+            assert await vault_client.get_secret("postgres") == {"key": "value"}
+
+    async def test_expired_secret_is_refetched(self, vault_client, mock_httpx_client):
+        """Test a secret older than the TTL is fetched again"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            # Age the entry past its expiry
+            expires_at, secret = vault_client._secret_cache["postgres"]
+            vault_client._secret_cache["postgres"] = (expires_at - 301, secret)
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.await_count == 2
+
+    async def test_cache_disabled_with_zero_ttl(self, vault_client, mock_httpx_client):
+        """Test VAULT_SECRET_CACHE_TTL=0 fetches on every lookup"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client), \
+                patch('app.services.vault.settings', MagicMock(VAULT_SECRET_CACHE_TTL=0)):
+            await vault_client.get_secret("postgres")
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.await_count == 2
+
+    async def test_concurrent_lookups_share_one_fetch(self, vault_client, mock_httpx_client):
+        """Test concurrent misses on one path send a single request"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            results = await asyncio.gather(*(vault_client.get_secret("postgres") for _ in range(5)))
+
+        assert results == [{"key": "value"}] * 5
+        assert mock_httpx_client.get.await_count == 1
+
+    async def test_errors_are_not_cached(self, vault_client, mock_httpx_client):
+        """Test a failed fetch is retried on the next lookup"""
+        ok_response = mock_httpx_client.get.return_value
+        mock_httpx_client.get.side_effect = [httpx.ConnectError("refused"), ok_response]
+
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            with pytest.raises(VaultUnavailableError):
+                await vault_client.get_secret("postgres")
+            assert await vault_client.get_secret("postgres") == {"key": "value"}
+
+    async def test_clear_secret_cache(self, vault_client, mock_httpx_client):
+        """Test clearing the cache forces a new fetch"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            vault_client.clear_secret_cache()
+            await vault_client.get_secret("postgres")
+
+        assert mock_httpx_client.get.await_count == 2
+
+    async def test_clear_secret_cache_for_one_path(self, vault_client, mock_httpx_client):
+        """Test clearing one path keeps the other cached secrets"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            await vault_client.get_secret("postgres")
+            await vault_client.get_secret("mysql")
+            vault_client.clear_secret_cache("/postgres")
+
+        assert list(vault_client._secret_cache) == ["mysql"]
+
+    async def test_cache_size_is_bounded(self, vault_client, mock_httpx_client):
+        """Test the oldest secret is evicted once the cache is full"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client), \
+                patch('app.services.vault.SECRET_CACHE_MAX_ENTRIES', 2):
+            for path in ("a", "b", "c"):
+                await vault_client.get_secret(path)
+
+        assert list(vault_client._secret_cache) == ["b", "c"]
+
+
+@pytest.mark.unit
+class TestVaultClientHttpClient:
+    """Test the shared HTTP client used by VaultClient"""
+
+    @pytest.fixture
+    def vault_client(self):
+        """Create VaultClient instance"""
+        return VaultClient()
+
+    async def test_client_is_reused_across_requests(self, vault_client, mock_httpx_client):
+        """Test secret lookups and health checks share one HTTP client"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client) as factory, \
+                patch('app.services.vault.settings', MagicMock(VAULT_SECRET_CACHE_TTL=0)):
+            await vault_client.get_secret("postgres")
+            await vault_client.get_secret("mysql")
+            await vault_client.check_health()
+
+        assert factory.call_count == 1
+        assert mock_httpx_client.get.await_count == 3
+
+    async def test_aclose_closes_client(self, vault_client, mock_httpx_client):
+        """Test aclose releases the client and a later request creates a new one"""
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client) as factory:
+            await vault_client.check_health()
+            await vault_client.aclose()
+            assert vault_client._http_client is None
+            mock_httpx_client.aclose.assert_awaited_once()
+
+            await vault_client.check_health()
+
+        assert factory.call_count == 2
+
+    async def test_aclose_without_client(self, vault_client):
+        """Test aclose is a no-op before the first request"""
+        await vault_client.aclose()
+        assert vault_client._http_client is None
+
+
+@pytest.mark.unit
+class TestVaultClientAppRoleToken:
+    """Test the lazily obtained and refreshed AppRole token"""
+
+    @pytest.fixture
+    def approle_settings(self, tmp_path):
+        """Settings pointing at an AppRole directory with role and secret IDs"""
+        (tmp_path / "role-id").write_text("role\n")
+        (tmp_path / "secret-id").write_text("secret\n")
+        settings = MagicMock(
+            VAULT_ADDR="http://test-vault:8200",
+            VAULT_TOKEN="dev-token",
+            VAULT_APPROLE_DIR=str(tmp_path),
+            VAULT_SECRET_CACHE_TTL=0,
+        )
+        with patch('app.services.vault.settings', settings):
+            yield settings
+
+    @pytest.fixture
+    def login_client(self, mock_httpx_client):
+        """HTTP client mock that also answers AppRole logins"""
+        login_response = MagicMock()
+        login_response.json = MagicMock(return_value={
+            "auth": {"client_token": "approle-token", "lease_duration": 3600}
+        })
+        mock_httpx_client.post = AsyncMock(return_value=login_response)
+        with patch('httpx.AsyncClient', return_value=mock_httpx_client):
+            yield mock_httpx_client
+
+    async def test_login_is_deferred_to_first_request(self, approle_settings, login_client):
+        """Test creating the client does not log in and the first fetch does"""
+        client = VaultClient()
+        assert login_client.post.await_count == 0
+
+        await client.get_secret("postgres")
+        await client.get_secret("postgres")
+
+        assert login_client.post.await_count == 1
+        assert login_client.post.await_args.kwargs["json"] == {"role_id": "role", "secret_id": "secret"}
+        assert login_client.get.await_args.kwargs["headers"] == {"X-Vault-Token": "approle-token"}
+
+    async def test_concurrent_requests_share_one_login(self, approle_settings, login_client):
+        """Test concurrent first requests wait for a single login"""
+        client = VaultClient()
+
+        await asyncio.gather(*(client.get_secret(path) for path in ("postgres", "mysql", "mongodb")))
+
+        assert login_client.post.await_count == 1
+
+    async def test_token_is_refreshed_before_expiry(self, approle_settings, login_client):
+        """Test a token near the end of its lease is replaced by a new login"""
+        client = VaultClient()
+        await client.get_secret("postgres")
+
+        # Move the refresh point into the past, as if the lease were ending
+        client._token_refresh_at -= 3600
+        await client.get_secret("postgres")
+
+        assert login_client.post.await_count == 2
+
+    async def test_failed_login_keeps_token_and_retries_later(self, approle_settings, login_client):
+        """Test a failed login falls back to VAULT_TOKEN and is not retried on every request"""
+        login_client.post.side_effect = httpx.ConnectError("refused")
+        client = VaultClient()
+
+        await client.get_secret("postgres")
+        await client.get_secret("postgres")
+
+        assert login_client.post.await_count == 1
+        assert client.headers == {"X-Vault-Token": "dev-token"}
+
+    async def test_token_mode_never_logs_in(self, login_client):
+        """Test no login is attempted without an AppRole directory"""
+        with patch('app.services.vault.settings', MagicMock(
+                VAULT_TOKEN="dev-token", VAULT_APPROLE_DIR="", VAULT_SECRET_CACHE_TTL=0)):
+            client = VaultClient()
+            await client.get_secret("postgres")
+
+        assert login_client.post.await_count == 0
+        assert client.headers == {"X-Vault-Token": "dev-token"}
+
+
 @pytest.mark.unit
 class TestVaultClientCheckHealth:
     """Test VaultClient.check_health method"""